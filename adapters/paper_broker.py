@@ -6,13 +6,22 @@ Provides realistic order simulation using price feeds for testing and developmen
 import logging
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from core.broker import BrokerGateway, OrderRequest, OrderResult, Position, Side
 
 logger = logging.getLogger(__name__)
 
+# Columns of PaperBroker._book, one row per open position
+_QTY, _AVG_PRICE = 0, 1
+_INITIAL_BOOK_ROWS = 8
+# Replies kept for retried client order IDs, least recently retried evicted
+_ORDER_RESULT_CACHE_SIZE = 10000
+
 
 class PaperBroker(BrokerGateway):
     """
@@ -36,7 +45,14 @@ class PaperBroker(BrokerGateway):
 
         # Internal simulation state
         self._orders: dict[str, dict] = {}  # client_order_id -> order data
-        self._positions: dict[str, Position] = {}  # symbol -> position
+        # client_order_id -> duplicate reply, shared by every retry (frozen)
+        self._order_results: OrderedDict[str, OrderResult] = OrderedDict()
+        # symbol -> row in self._book; Position objects are built on demand
+        self._positions: dict[str, int] = {}
+        # symbol -> Position built from its row, dropped when the row changes
+        self._position_objects: dict[str, Position] = {}
+        self._book = np.zeros((_INITIAL_BOOK_ROWS, 2))
+        self._free_rows = list(range(_INITIAL_BOOK_ROWS - 1, -1, -1))
         self._balance = getattr(settings, "INITIAL_BALANCE", 10000.0)
         self._equity = self._balance
         self._commission_per_lot = getattr(settings, "COMMISSION_PER_LOT", 5.0)
@@ -118,6 +134,15 @@ class PaperBroker(BrokerGateway):
 
         return price
 
+    def _open_row(self, symbol: str) -> int:
+        """Claim a book row for a new position, growing the book if full."""
+        if not self._free_rows:
+            rows = len(self._book)
+            self._book = np.concatenate([self._book, np.zeros_like(self._book)])
+            self._free_rows = list(range(2 * rows - 1, rows - 1, -1))
+        row = self._positions[symbol] = self._free_rows.pop()
+        return row
+
     def _update_position(self, symbol: str, qty_change: float, avg_price: float):
         """
         Update position for symbol with new quantity and average price.
@@ -127,47 +152,47 @@ class PaperBroker(BrokerGateway):
             qty_change: Quantity change (positive=buy, negative=sell)
             avg_price: Execution price
         """
-        current_pos = self._positions.get(symbol)
+        self._position_objects.pop(symbol, None)
+        row = self._positions.get(symbol)
 
-        if current_pos is None:
+        if row is None:
             # New position
             if qty_change != 0:
-                self._positions[symbol] = Position(
-                    symbol=symbol, qty=qty_change, avg_price=avg_price
-                )
+                row = self._open_row(symbol)  # May grow (replace) self._book
+                book = self._book[row]
+                book[_QTY] = qty_change
+                book[_AVG_PRICE] = avg_price
                 logger.debug(f"New position: {symbol} qty={qty_change} @ {avg_price}")
         else:
             # Update existing position
-            new_qty = current_pos.qty + qty_change
+            book = self._book[row]
+            current_qty = book[_QTY]
+            new_qty = current_qty + qty_change
 
             if (
                 abs(new_qty) < 0.001
             ):  # Position closed (considering floating point precision)
                 del self._positions[symbol]
+                self._free_rows.append(row)
                 logger.debug(f"Position closed: {symbol}")
             else:
                 # Update average price using weighted average
-                if (current_pos.qty > 0 and qty_change > 0) or (
-                    current_pos.qty < 0 and qty_change < 0
+                if (current_qty > 0 and qty_change > 0) or (
+                    current_qty < 0 and qty_change < 0
                 ):
                     # Adding to position in same direction
-                    total_cost = (current_pos.qty * current_pos.avg_price) + (
+                    total_cost = (current_qty * book[_AVG_PRICE]) + (
                         qty_change * avg_price
                     )
-                    new_avg_price = total_cost / new_qty
-                else:
-                    # Reducing position or reversing
-                    new_avg_price = (
-                        avg_price
-                        if abs(qty_change) > abs(current_pos.qty)
-                        else current_pos.avg_price
-                    )
+                    book[_AVG_PRICE] = total_cost / new_qty
+                elif abs(qty_change) > abs(current_qty):
+                    # Reversing: the remainder opens at the fill price
+                    book[_AVG_PRICE] = avg_price
+                # Reducing keeps the existing average price
 
-                self._positions[symbol] = Position(
-                    symbol=symbol, qty=new_qty, avg_price=new_avg_price
-                )
+                book[_QTY] = new_qty
                 logger.debug(
-                    f"Updated position: {symbol} qty={new_qty} @ {new_avg_price}"
+                    f"Updated position: {symbol} qty={new_qty} @ {book[_AVG_PRICE]}"
                 )
 
     def _calculate_commission(self, symbol: str, qty: float) -> float:
@@ -227,16 +252,23 @@ class PaperBroker(BrokerGateway):
 
         try:
             # Check for duplicate client order ID (idempotency)
-            if request.client_order_id in self._orders:
-                existing_order = self._orders[request.client_order_id]
-                logger.info(
-                    f"Duplicate order ID {request.client_order_id}, returning existing result"
-                )
-                return OrderResult(
+            coid = request.client_order_id
+            cached = self._order_results.get(coid)
+            if cached is not None:
+                self._order_results.move_to_end(coid)
+                logger.info(f"Duplicate order ID {coid}, returning existing result")
+                return cached
+            if coid in self._orders:
+                existing_order = self._orders[coid]
+                logger.info(f"Duplicate order ID {coid}, returning existing result")
+                result = self._order_results[coid] = OrderResult(
                     accepted=True,
                     broker_order_id=existing_order["broker_order_id"],
                     reason="Duplicate order - returned existing result",
                 )
+                if len(self._order_results) > _ORDER_RESULT_CACHE_SIZE:
+                    self._order_results.popitem(last=False)
+                return result
 
             # Generate unique broker order ID
             broker_order_id = str(uuid.uuid4())[:8]
@@ -313,7 +345,19 @@ class PaperBroker(BrokerGateway):
             logger.warning("Cannot fetch positions: paper broker not connected")
             return []
 
-        positions = list(self._positions.values())
+        # Position is frozen, so unchanged rows reuse the validated object
+        cache = self._position_objects
+        book = self._book
+        positions = []
+        for symbol, row in self._positions.items():
+            position = cache.get(symbol)
+            if position is None:
+                position = cache[symbol] = Position(
+                    symbol=symbol,
+                    qty=float(book[row, _QTY]),
+                    avg_price=float(book[row, _AVG_PRICE]),
+                )
+            positions.append(position)
         logger.debug(f"Paper broker positions: {len(positions)} open")
         return positions
 
@@ -354,7 +398,10 @@ class PaperBroker(BrokerGateway):
         Reset paper broker to initial state (for testing).
         """
         self._orders.clear()
+        self._order_results.clear()
         self._positions.clear()
+        self._position_objects.clear()
+        self._free_rows = list(range(len(self._book) - 1, -1, -1))
         self._balance = getattr(self.settings, "INITIAL_BALANCE", 10000.0)
         self._equity = self._balance
         logger.info("Paper broker simulation reset")
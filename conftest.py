@@ -0,0 +1,19 @@
+"""
+Root pytest configuration shared by top-level and tests/ suites.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def warm_profile_manager():
+    """
+    Global symbol profile manager with profiles and session timezones loaded.
+
+    Built once per session, only for tests that request it.
+    """
+    from core.symbols import get_profile_manager
+
+    manager = get_profile_manager()
+    manager._prewarm()
+    return manager
@@ -6,7 +6,8 @@ Defines core domain models for order management and position tracking.
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import ConfigDict, Field, TypeAdapter, ValidationInfo, field_validator
+from pydantic.dataclasses import dataclass
 
 
 class Side(str, Enum):
@@ -24,7 +25,13 @@ class OrderType(str, Enum):
     STOP = "STOP"
 
 
-class OrderRequest(BaseModel):
+# Frozen, slotted dataclasses: orders and results are created on every
+# place_order call, and slots avoid a per-instance __dict__.
+_MODEL_CONFIG = ConfigDict(use_enum_values=True)
+
+
+@dataclass(frozen=True, slots=True, config=_MODEL_CONFIG)
+class OrderRequest:
     """Broker-agnostic order request model"""
 
     client_order_id: str = Field(
@@ -40,22 +47,30 @@ class OrderRequest(BaseModel):
     tp: float | None = Field(default=None, description="Take profit price (optional)")
     price: float | None = Field(
         default=None,
+        validate_default=True,
         description="Limit/Stop order price (required for non-MARKET orders)",
     )
 
-    @validator("price", always=True)
-    def validate_price_for_non_market(cls, v, values):
+    @field_validator("price")
+    @classmethod
+    def validate_price_for_non_market(cls, v, info: ValidationInfo):
         """Price required for LIMIT/STOP orders"""
-        order_type = values.get("order_type")
+        order_type = info.data.get("order_type")
         if order_type in ["LIMIT", "STOP"] and v is None:
             raise ValueError(f"{order_type} orders require a price")
         return v
 
-    class Config:
-        use_enum_values = True
+    @classmethod
+    def batch(cls, rows: list[dict]) -> list["OrderRequest"]:
+        """Validate many order dicts in a single pydantic pass"""
+        return _ORDER_REQUEST_LIST.validate_python(rows)
+
 
+_ORDER_REQUEST_LIST = TypeAdapter(list[OrderRequest])
 
-class OrderResult(BaseModel):
+
+@dataclass(frozen=True, slots=True, config=_MODEL_CONFIG)
+class OrderResult:
     """Broker order execution result"""
 
     accepted: bool = Field(description="Whether the order was accepted by broker")
@@ -66,16 +81,18 @@ class OrderResult(BaseModel):
         default=None, description="Rejection reason or additional info"
     )
 
-    @validator("broker_order_id")
-    def validate_order_id_when_accepted(cls, v, values):
+    @field_validator("broker_order_id")
+    @classmethod
+    def validate_order_id_when_accepted(cls, v, info: ValidationInfo):
         """Accepted orders should have broker_order_id"""
-        accepted = values.get("accepted", False)
+        accepted = info.data.get("accepted", False)
         if accepted and not v:
             raise ValueError("Accepted orders must have broker_order_id")
         return v
 
 
-class Position(BaseModel):
+@dataclass(frozen=True, slots=True, config=_MODEL_CONFIG)
+class Position:
     """Open position representation"""
 
     symbol: str = Field(description="Trading symbol")
@@ -96,6 +113,3 @@ class Position(BaseModel):
     def abs_qty(self) -> float:
         """Absolute position size"""
         return abs(self.qty)
-
-    class Config:
-        use_enum_values = True
@@ -4,8 +4,8 @@ Lightweight event handling for domain events within the trading pipeline.
 """
 
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterable
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -16,7 +16,12 @@ class EventBus:
     Synchronous in-process event bus using publish/subscribe pattern.
 
     Handlers are called immediately when events are published.
-    Thread-safety is not guaranteed in v1 - designed for single-threaded use.
+    Handler registrations are copy-on-write tuples, so publish reads them
+    without locking or copying; subscribe/unsubscribe swap in a new tuple
+    under a lock. Each change also rebuilds that type's dispatcher, a
+    closure over the tuple and the bus, so publish is one lookup and a call.
+    Stats are three slotted ints, assembled into a dict only by get_stats;
+    they are not thread-safe.
 
     Example usage:
         bus = EventBus()
@@ -28,10 +33,23 @@ class EventBus:
         bus.publish(SignalDetected(symbol="XAUUSD", side="BUY", strength=0.85))
     """
 
+    __slots__ = (
+        "_handlers",
+        "_dispatch",
+        "_write_lock",
+        "_events",
+        "_calls",
+        "_errors",
+    )
+
     def __init__(self) -> None:
         """Initialize empty event bus"""
-        self._handlers: dict[type, list[Callable[[Any], None]]] = defaultdict(list)
-        self._stats = {"events_published": 0, "handlers_called": 0, "errors": 0}
+        self._handlers: dict[type, tuple[Callable[[Any], None], ...]] = {}
+        self._dispatch: dict[type, Callable[[Any], None]] = {}
+        self._write_lock = threading.Lock()
+        self._events = 0
+        self._calls = 0
+        self._errors = 0
 
     def subscribe(self, event_type: type, handler: Callable[[Any], None]) -> None:
         """
@@ -49,7 +67,9 @@ class EventBus:
         if not callable(handler):
             raise ValueError(f"Handler must be callable, got {type(handler)}")
 
-        self._handlers[event_type].append(handler)
+        with self._write_lock:
+            handlers = self._handlers.get(event_type, ())
+            self._set_handlers(event_type, handlers + (handler,))
         handler_name = getattr(handler, "__name__", str(handler))
         logger.debug(f"Subscribed handler {handler_name} to {event_type.__name__}")
 
@@ -66,28 +86,65 @@ class EventBus:
             - If a handler raises an exception, it's logged but doesn't stop other handlers
             - No return value - fire-and-forget pattern
         """
-        event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
+        self._dispatch.get(type(event), self._publish_unhandled)(event)
+
+    def _publish_unhandled(self, event: Any) -> None:
+        """Dispatcher for event types nobody subscribed to"""
+        self._events += 1
+
+    def _set_handlers(
+        self, event_type: type, handlers: tuple[Callable[[Any], None], ...]
+    ) -> None:
+        """Store an event type's handlers and rebuild its dispatcher"""
+        self._handlers[event_type] = handlers
+        if handlers:
+            self._dispatch[event_type] = self._build_dispatcher(event_type, handlers)
+        else:
+            self._dispatch.pop(event_type, None)
+
+    def _build_dispatcher(
+        self, event_type: type, handlers: tuple[Callable[[Any], None], ...]
+    ) -> Callable[[Any], None]:
+        """
+        Build the publish function for one event type.
 
-        logger.debug(f"Publishing {event_type.__name__} to {len(handlers)} handlers")
+        The handler tuple and the bus are bound as closure variables so the
+        per-event path does no dict-of-handlers lookups.
+        """
+        bus = self
+        type_name = event_type.__name__
+
+        def dispatch(event: Any) -> None:
+            bus._events += 1
+            for handler in handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    bus._errors += 1
+                    handler_name = getattr(handler, "__name__", str(handler))
+                    logger.error(
+                        f"Handler {handler_name} failed for {type_name}: {e}",
+                        exc_info=True,
+                    )
+                    # Continue calling other handlers even if one fails
+                else:
+                    bus._calls += 1
+
+        return dispatch
+
+    def publish_many(self, events: Iterable[Any]) -> None:
+        """
+        Publish several events in order.
 
-        self._stats["events_published"] += 1
+        Equivalent to calling publish() for each event; lets a producer
+        hand over everything it generated for one operation in one call.
 
-        for handler in handlers:
-            try:
-                handler(event)
-                self._stats["handlers_called"] += 1
-                handler_name = getattr(handler, "__name__", str(handler))
-                logger.debug(f"Called handler {handler_name} for {event_type.__name__}")
-
-            except Exception as e:
-                self._stats["errors"] += 1
-                handler_name = getattr(handler, "__name__", str(handler))
-                logger.error(
-                    f"Handler {handler_name} failed for {event_type.__name__}: {e}",
-                    exc_info=True,
-                )
-                # Continue calling other handlers even if one fails
+        Args:
+            events: Event instances to publish, in delivery order
+        """
+        publish = self.publish
+        for event in events:
+            publish(event)
 
     def unsubscribe(self, event_type: type, handler: Callable[[Any], None]) -> bool:
         """
@@ -100,23 +157,24 @@ class EventBus:
         Returns:
             bool: True if handler was found and removed, False otherwise
         """
-        if event_type not in self._handlers:
-            return False
+        with self._write_lock:
+            handlers = self._handlers.get(event_type, ())
+            try:
+                index = handlers.index(handler)
+            except ValueError:
+                return False
+            self._set_handlers(event_type, handlers[:index] + handlers[index + 1 :])
 
-        try:
-            self._handlers[event_type].remove(handler)
-            handler_name = getattr(handler, "__name__", str(handler))
-            logger.debug(
-                f"Unsubscribed handler {handler_name} from {event_type.__name__}"
-            )
-            return True
-        except ValueError:
-            return False
+        handler_name = getattr(handler, "__name__", str(handler))
+        logger.debug(f"Unsubscribed handler {handler_name} from {event_type.__name__}")
+        return True
 
     def clear(self) -> None:
         """Remove all event handlers and reset statistics"""
-        self._handlers.clear()
-        self._stats = {"events_published": 0, "handlers_called": 0, "errors": 0}
+        with self._write_lock:
+            self._handlers = {}
+            self._dispatch = {}
+        self._events = self._calls = self._errors = 0
         logger.debug("Cleared all event handlers")
 
     def get_handlers(self, event_type: type) -> list[Callable[[Any], None]]:
@@ -129,7 +187,21 @@ class EventBus:
         Returns:
             List of handler functions (copy, safe to modify)
         """
-        return self._handlers.get(event_type, []).copy()
+        return list(self._handlers.get(event_type, ()))
+
+    def has_subscribers(self, event_type: type) -> bool:
+        """
+        Check whether any handler is registered for an event type.
+
+        Lets publishers skip building events nobody listens to.
+
+        Args:
+            event_type: Event class to check
+
+        Returns:
+            bool: True if at least one handler is registered
+        """
+        return bool(self._handlers.get(event_type))
 
     def get_stats(self) -> dict[str, int]:
         """
@@ -138,7 +210,11 @@ class EventBus:
         Returns:
             Dictionary with events_published, handlers_called, errors counts
         """
-        return self._stats.copy()
+        return {
+            "events_published": self._events,
+            "handlers_called": self._calls,
+            "errors": self._errors,
+        }
 
     def __len__(self) -> int:
         """Return total number of registered handlers across all event types"""
@@ -0,0 +1,66 @@
+"""
+Fixed-size Bloom filter for client order ID lookups
+
+Answers "definitely never recorded" without touching storage; a hit only
+means "maybe recorded" and must be confirmed against the database.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Bit-array Bloom filter sized for an expected item count and error rate
+
+    Uses double hashing over a single 128-bit BLAKE2b digest to derive the
+    bit positions. Items cannot be removed; stale entries only cost an extra
+    confirmation lookup.
+    """
+
+    __slots__ = ("capacity", "error_rate", "num_bits", "num_hashes", "_bits")
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of items before the error rate degrades
+            error_rate: Target false positive probability at capacity
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        """Bit positions for an item"""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter"""
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits, m = self._bits, self.num_bits
+        # Stop at the first clear bit: most unseen IDs miss on the first probe
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
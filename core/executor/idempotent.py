@@ -4,22 +4,34 @@ Ensures each logical order is submitted to broker at most once using SQLite stor
 Integrates position netting policy for intelligent order management.
 """
 
+import functools
 import hashlib
 import logging
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from core.broker import BrokerGateway, OrderRequest, OrderResult
 from core.positions import NettingMode, Position, PositionAggregator, ReduceRule
 
+from .bloom import BloomFilter
+
 if TYPE_CHECKING:
     from config.settings import ApplicationSettings
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _coid_hasher(symbol: str, side: str, strategy_id: str) -> Any:
+    """SHA256 state already fed with the per-strategy part of a COID input"""
+    return hashlib.sha256(
+        f"{symbol}_{side}_{strategy_id}_".encode(), usedforsecurity=False
+    )
+
+
 def make_coid(symbol: str, side: str, strategy_id: str, ts_bucket: str) -> str:
     """
     Generate deterministic client order ID from order parameters.
@@ -37,15 +49,14 @@ def make_coid(symbol: str, side: str, strategy_id: str, ts_bucket: str) -> str:
         >>> make_coid("XAUUSD", "BUY", "ma_cross", "20250907_1510")
         'f4a2b8c3d9e1f6g7h8i9j0k1'
     """
-    # Create deterministic input string
-    input_data = f"{symbol}_{side}_{strategy_id}_{ts_bucket}"
+    # Hash "{symbol}_{side}_{strategy_id}_{ts_bucket}" by resuming a cached
+    # hasher for the fixed prefix; only the time bucket is encoded per call
+    hasher = _coid_hasher(symbol, side, strategy_id).copy()
+    hasher.update(ts_bucket.encode())
 
-    # Generate SHA256 hash (secure and deterministic)
-    hash_obj = hashlib.sha256(input_data.encode(), usedforsecurity=False)
-    hash_hex = hash_obj.hexdigest()
-
-    # Return first 24 characters for readability
-    return hash_hex[:24]
+    # IDs are persisted in the idempotency store, so the hash must stay SHA256;
+    # hex-encode only the 12 bytes kept (first 24 hex characters)
+    return hasher.digest()[:12].hex()
 
 
 class IdempotentOrderExecutor:
@@ -62,6 +73,7 @@ class IdempotentOrderExecutor:
         broker: BrokerGateway,
         db_path: str = "infra/id_store.sqlite",
         settings: Optional["ApplicationSettings"] = None,
+        use_bloom: bool = False,
     ):
         """
         Initialize idempotent executor with broker and database.
@@ -70,6 +82,8 @@ class IdempotentOrderExecutor:
             broker: Broker gateway for order execution
             db_path: Path to SQLite database for tracking sent orders
             settings: Application settings for netting configuration
+            use_bloom: Answer never-recorded IDs from an in-memory Bloom filter
+                instead of querying the sent table
         """
         self.broker = broker
         self.db_path = Path(db_path)
@@ -88,6 +102,18 @@ class IdempotentOrderExecutor:
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # One autocommit connection for the executor's lifetime, shared by
+        # threads under a lock, instead of a connect per lookup/record
+        self._conn: sqlite3.Connection
+        self._conn_lock = threading.Lock()
+
+        # Optionally fronts the sent table so most new-COID checks skip the
+        # SELECT; sized for roughly a day's worth of client order IDs
+        self._bloom = (
+            BloomFilter(capacity=1_000_000, error_rate=0.001) if use_bloom else None
+        )
+        self._data_version = 0
+
         # Initialize database schema
         self._init_database()
 
@@ -97,23 +123,34 @@ class IdempotentOrderExecutor:
         )
 
     def _init_database(self) -> None:
-        """Initialize SQLite database with required tables"""
+        """Open the database connection and create required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS sent (
-                        client_order_id TEXT PRIMARY KEY,
-                        broker_order_id TEXT,
-                        ts DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        symbol TEXT,
-                        side TEXT,
-                        qty REAL,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
+            conn = sqlite3.connect(
+                self.db_path, isolation_level=None, check_same_thread=False
+            )
+            # WAL appends each commit instead of rewriting a rollback journal;
+            # synchronous stays FULL so a recorded order survives power loss
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute(
                 """
+                CREATE TABLE IF NOT EXISTS sent (
+                    client_order_id TEXT PRIMARY KEY,
+                    broker_order_id TEXT,
+                    ts DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    symbol TEXT,
+                    side TEXT,
+                    qty REAL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
-                conn.commit()
+            """
+            )
+            self._conn = conn
+
+            # Warm the filter with IDs recorded before this process started
+            if self._bloom is not None:
+                self._warm_bloom()
 
             logger.debug(f"Database initialized: {self.db_path}")
 
@@ -121,6 +158,27 @@ class IdempotentOrderExecutor:
             logger.error(f"Failed to initialize database: {e}")
             raise
 
+    def _warm_bloom(self) -> None:
+        """Add every recorded ID to the filter; caller holds the lock or is init"""
+        # data_version changes only when another connection commits, so
+        # remembering it tells already_sent when the filter may be stale
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        rows = self._conn.execute("SELECT client_order_id FROM sent")
+        for (client_order_id,) in rows:
+            self._bloom.add(client_order_id)
+
+    def _bloom_miss(self, client_order_id: str) -> bool:
+        """True if the filter proves client_order_id was never recorded"""
+        if client_order_id in self._bloom:
+            return False
+        with self._conn_lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return True
+            # Another executor or process wrote to the database: re-warm
+            self._warm_bloom()
+        return client_order_id not in self._bloom
+
     def already_sent(self, client_order_id: str) -> bool:
         """
         Check if order with given client_order_id was already sent.
@@ -130,14 +188,22 @@ class IdempotentOrderExecutor:
 
         Returns:
             bool: True if order was already sent, False otherwise
+
+        With use_bloom, IDs never added to the in-memory filter are answered
+        without a lookup in the sent table; filter hits are confirmed there.
+        Writes by other connections are picked up through PRAGMA
+        data_version before a miss is trusted.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
+            if self._bloom is not None and self._bloom_miss(client_order_id):
+                logger.debug(f"Order {client_order_id} already sent: False")
+                return False
+
+            with self._conn_lock:
+                result = self._conn.execute(
                     "SELECT 1 FROM sent WHERE client_order_id = ? LIMIT 1",
                     (client_order_id,),
-                )
-                result = cursor.fetchone()
+                ).fetchone()
 
             exists = result is not None
             logger.debug(f"Order {client_order_id} already sent: {exists}")
@@ -156,16 +222,17 @@ class IdempotentOrderExecutor:
             client_order_id: Client order identifier
             broker_order_id: Broker-assigned order ID (if available)
         """
+        if self._bloom is not None:
+            self._bloom.add(client_order_id)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+            with self._conn_lock:
+                self._conn.execute(
                     """
                     INSERT OR REPLACE INTO sent (client_order_id, broker_order_id, ts)
                     VALUES (?, ?, CURRENT_TIMESTAMP)
                     """,
                     (client_order_id, broker_order_id),
                 )
-                conn.commit()
 
             logger.debug(f"Recorded order: {client_order_id} -> {broker_order_id}")
 
@@ -393,9 +460,8 @@ class IdempotentOrderExecutor:
             List of order records from database
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Enable dict-like access
-                cursor = conn.execute(
+            with self._conn_lock:
+                cursor = self._conn.execute(
                     """
                     SELECT client_order_id, broker_order_id, ts, symbol, side, qty
                     FROM sent
@@ -404,6 +470,7 @@ class IdempotentOrderExecutor:
                     """,
                     (limit,),
                 )
+                cursor.row_factory = sqlite3.Row  # Enable dict-like access
                 return [dict(row) for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
@@ -421,15 +488,14 @@ class IdempotentOrderExecutor:
             Number of records removed
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
+            with self._conn_lock:
+                cursor = self._conn.execute(
                     f"""
                     DELETE FROM sent
                     WHERE ts < datetime('now', '-{days_old} days')
                     """
                 )
                 count = cursor.rowcount
-                conn.commit()
 
             logger.info(f"Purged {count} old order records (>{days_old} days)")
             return count
@@ -444,7 +510,8 @@ class IdempotentOrderExecutor:
         return f"IdempotentOrderExecutor(broker={broker_type}, db={self.db_path})"
 
     def close(self) -> None:
-        """Close database connection - provided for explicit cleanup"""
-        # SQLite connections are closed automatically when using context managers
-        # This method is provided for test cleanup if needed
-        pass
+        """Close the executor's database connection"""
+        # Later calls fail with sqlite3.ProgrammingError, handled like other
+        # database errors
+        with self._conn_lock:
+            self._conn.close()
@@ -118,7 +118,7 @@ class OrderBook:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self._lock = threading.RLock()  # Thread-safe operations
+        self._lock = threading.Lock()  # Thread-safe operations; never re-entered
 
         # Initialize database
         self._init_database()
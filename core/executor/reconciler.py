@@ -70,7 +70,7 @@ class ReconciliationEngine:
 
         # Track processed deals to avoid duplicates
         self._processed_deals: set[str] = set()
-        self._deal_history_lock = threading.RLock()
+        self._deal_history_lock = threading.Lock()
 
         logger.info(f"ReconciliationEngine initialized (poll={poll_interval}s)")
 
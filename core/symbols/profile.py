@@ -16,7 +16,7 @@ Features:
 import logging
 from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, List, Literal, NamedTuple, Optional, Union
 from zoneinfo import ZoneInfo
 
 import yaml
@@ -51,6 +51,36 @@ class SessionDefinition(BaseModel):
     breaks: list[dict[str, str]] = Field(default=[], description="Intraday breaks")
 
 
+class SessionWindow(NamedTuple):
+    """Precompiled session: weekday bitmask plus times as seconds since midnight"""
+
+    weekday_mask: int
+    open_secs: int
+    close_secs: int
+    breaks: tuple[tuple[int, int], ...] = ()
+
+    @classmethod
+    def from_definition(cls, session_def: SessionDefinition) -> "SessionWindow":
+        """Compile a SessionDefinition into integer form for fast checks"""
+        return cls(
+            weekday_mask=sum(1 << day for day in set(session_def.days)),
+            open_secs=_seconds_of_day(time.fromisoformat(session_def.start_time)),
+            close_secs=_seconds_of_day(time.fromisoformat(session_def.end_time)),
+            breaks=tuple(
+                (
+                    _seconds_of_day(time.fromisoformat(b["start"])),
+                    _seconds_of_day(time.fromisoformat(b["end"])),
+                )
+                for b in session_def.breaks
+            ),
+        )
+
+
+def _seconds_of_day(t: time) -> int:
+    """Convert a time-of-day to whole seconds since midnight"""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
 class ProfileSettings(BaseModel):
     """Profile system configuration"""
 
@@ -173,6 +203,7 @@ class SymbolProfileManager:
             config: Profile configuration (loads from file if None)
         """
         self.config = config or load_symbol_profiles()
+        self._session_windows: dict[str, SessionWindow] = {}
         logger.info(
             f"SymbolProfileManager initialized with {len(self.config.profiles)} profiles"
         )
@@ -244,45 +275,46 @@ class SymbolProfileManager:
             return True  # Default to open if session undefined
 
         try:
+            window = self._session_windows.get(profile.session)
+            if window is None:
+                window = SessionWindow.from_definition(session_def)
+                self._session_windows[profile.session] = window
+
             # Convert to symbol's timezone
             symbol_tz = ZoneInfo(profile.tz)
             local_dt = dt.astimezone(symbol_tz)
 
-            # Check if current day is a trading day
-            weekday = local_dt.weekday()  # 0=Monday, 6=Sunday
-            if weekday not in session_def.days:
+            # Check if current day is a trading day (0=Monday, 6=Sunday)
+            if not window.weekday_mask & (1 << local_dt.weekday()):
                 logger.debug(
                     f"Session closed: {symbol} not trading on {local_dt.strftime('%A')}"
                 )
                 return False
 
-            # Parse session times
-            start_time = time.fromisoformat(session_def.start_time)
-            end_time = time.fromisoformat(session_def.end_time)
-            current_time = local_dt.time()
+            now_secs = local_dt.hour * 3600 + local_dt.minute * 60 + local_dt.second
 
             # Handle session that spans midnight (e.g., 22:00 to 22:00 next day)
-            if start_time > end_time:
+            if window.open_secs > window.close_secs:
                 # Session spans midnight
-                is_open = current_time >= start_time or current_time <= end_time
+                is_open = now_secs >= window.open_secs or now_secs <= window.close_secs
             else:
                 # Normal session within single day
-                is_open = start_time <= current_time <= end_time
+                is_open = window.open_secs <= now_secs <= window.close_secs
 
             # Check for intraday breaks
-            if is_open and session_def.breaks:
-                for break_period in session_def.breaks:
-                    break_start = time.fromisoformat(break_period["start"])
-                    break_end = time.fromisoformat(break_period["end"])
-                    if break_start <= current_time <= break_end:
+            if is_open:
+                for break_start, break_end in window.breaks:
+                    if break_start <= now_secs <= break_end:
                         logger.debug(
-                            f"Session closed: {symbol} in break period {break_start}-{break_end}"
+                            f"Session closed: {symbol} in break period "
+                            f"{timedelta(seconds=break_start)}-{timedelta(seconds=break_end)}"
                         )
                         return False
 
             if not is_open:
                 logger.debug(
-                    f"Session closed: {symbol} outside {start_time}-{end_time} in {profile.tz}"
+                    f"Session closed: {symbol} outside "
+                    f"{session_def.start_time}-{session_def.end_time} in {profile.tz}"
                 )
 
             return is_open
@@ -338,6 +370,16 @@ class SymbolProfileManager:
 
         return True, "OK"
 
+    def _prewarm(self) -> None:
+        """
+        Run every profile through the session and holiday checks once so
+        timezone data and any lazily built session state are loaded up front.
+        """
+        now = datetime.now(ZoneInfo("UTC"))
+        for symbol in self.config.profiles:
+            self.is_session_open(symbol, now)
+            self.is_holiday(symbol, now)
+
     def get_asset_symbols(self, asset_type: AssetType) -> list[str]:
         """
         Get all symbols of specific asset type
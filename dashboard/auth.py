@@ -11,16 +11,19 @@ Features:
 - Cookie-based auth: HttpOnly, Secure, SameSite=Strict
 """
 
+import functools
 import hashlib
+import hmac
 import json
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any, List, Optional, Tuple
 
 import bcrypt
 from fastapi import Depends, HTTPException, Request, status
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from config.settings import get_settings
 from infra.secrets import get_secret
@@ -41,6 +44,13 @@ ROLE_HIERARCHY = {
     "viewer": ["viewer"],
 }
 
+# bcrypt cost for stored password hashes; the test suite lowers it in a fixture
+BCRYPT_ROUNDS = 12
+
+# Fixed pepper for the AUTH_KDF_PROFILE=test fast hash; never used in production
+_TEST_KDF_PEPPER = b"dashboard-test-kdf-pepper"
+_TEST_KDF_PREFIX = "sha256$"
+
 
 class AuthConfig:
     """Authentication configuration"""
@@ -84,20 +94,47 @@ class AuthConfig:
 
         return int(os.getenv("DASH_REFRESH_TTL_DAYS", "7"))
 
+    @property
+    def audit_file_enabled(self) -> bool:
+        """Audit events go to logs/ unless DASHBOARD_AUDIT_SINK=null (tests)"""
+        import os
+
+        return os.getenv("DASHBOARD_AUDIT_SINK") != "null"
+
+    @property
+    def test_kdf(self) -> bool:
+        """Whether AUTH_KDF_PROFILE=test selects the fast test password hash"""
+        import os
+
+        return os.getenv("AUTH_KDF_PROFILE") == "test"
+
 
 # Global auth config instance
 _auth_config = AuthConfig()
 
 
+def _test_kdf_digest(password: str) -> str:
+    """Peppered HMAC-SHA256 used instead of bcrypt under AUTH_KDF_PROFILE=test"""
+    digest = hmac.new(_TEST_KDF_PEPPER, password.encode("utf-8"), hashlib.sha256)
+    return _TEST_KDF_PREFIX + digest.hexdigest()
+
+
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt"""
-    salt = bcrypt.gensalt()
+    """Hash password using bcrypt (HMAC-SHA256 under AUTH_KDF_PROFILE=test)"""
+    if _auth_config.test_kdf:
+        return _test_kdf_digest(password)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify password against bcrypt hash"""
+    if hashed.startswith(_TEST_KDF_PREFIX):
+        # Test-profile hashes are only honoured while that profile is active
+        return _auth_config.test_kdf and hmac.compare_digest(
+            _test_kdf_digest(password), hashed
+        )
     try:
         return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
     except Exception as e:
@@ -105,6 +142,12 @@ def verify_password(password: str, hashed: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4)
+def _hs256_key(secret: str) -> jwk.Key:
+    """HS256 key object for a secret, built once instead of on every token"""
+    return jwk.construct(secret, "HS256")
+
+
 def create_access_token(user_id: str, roles: list[str]) -> str:
     """Create JWT access token"""
     now = datetime.utcnow()
@@ -117,7 +160,7 @@ def create_access_token(user_id: str, roles: list[str]) -> str:
         "jti": uuid.uuid4().hex,  # Token ID for tracking
     }
 
-    return jwt.encode(payload, _auth_config.jwt_secret, algorithm="HS256")
+    return jwt.encode(payload, _hs256_key(_auth_config.jwt_secret), algorithm="HS256")
 
 
 def create_refresh_token(user_id: str) -> str:
@@ -131,13 +174,15 @@ def create_refresh_token(user_id: str) -> str:
         "jti": uuid.uuid4().hex,
     }
 
-    return jwt.encode(payload, _auth_config.jwt_secret, algorithm="HS256")
+    return jwt.encode(payload, _hs256_key(_auth_config.jwt_secret), algorithm="HS256")
 
 
 def decode_token(token: str) -> dict[str, Any]:
     """Decode and validate JWT token"""
     try:
-        payload = jwt.decode(token, _auth_config.jwt_secret, algorithms=["HS256"])
+        payload = jwt.decode(
+            token, _hs256_key(_auth_config.jwt_secret), algorithms=["HS256"]
+        )
         return payload
     except JWTError as e:
         logger.debug(f"Token decode error: {e}")
@@ -172,6 +217,26 @@ def check_rate_limit(
     return True
 
 
+def _write_audit_file(audit_entry: dict[str, Any]) -> None:
+    """Append an audit entry to this year's logs/audit-*.jsonl file"""
+    if not _auth_config.audit_file_enabled:
+        return
+
+    audit_file = f"logs/audit-{datetime.now().strftime('%Y')}.jsonl"
+
+    # Ensure logs directory exists
+    import os
+
+    os.makedirs("logs", exist_ok=True)
+
+    with open(audit_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(audit_entry) + "\n")
+
+
+# Where log_audit_event sends entries; tests swap in a recorder
+_audit_sink: Callable[[dict[str, Any]], None] = _write_audit_file
+
+
 def log_audit_event(
     event_type: str, user_id: str = None, details: dict = None, success: bool = True
 ):
@@ -186,16 +251,7 @@ def log_audit_event(
             "severity": "INFO" if success else "WARNING",
         }
 
-        # Write to audit log file
-        audit_file = f"logs/audit-{datetime.now().strftime('%Y')}.jsonl"
-
-        # Ensure logs directory exists
-        import os
-
-        os.makedirs("logs", exist_ok=True)
-
-        with open(audit_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(audit_entry) + "\n")
+        _audit_sink(audit_entry)
 
         logger.info(
             t("auth_login_ok" if success else "auth_login_fail") + f" - {user_id}"
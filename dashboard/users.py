@@ -7,8 +7,11 @@ Schema: users(id, email, pwd_hash, roles_csv, created_ts, last_login_ts)
 """
 
 import logging
+import os
 import sqlite3
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -26,18 +29,38 @@ logger = logging.getLogger(__name__)
 # Database path
 DB_PATH = "infra/dash_users.sqlite"
 
+# Per-connection prepared statement cache; UserStore issues a handful of queries
+_CACHED_STATEMENTS = 256
+
 
 class UserStore:
     """SQLite-based user store with bcrypt password hashing"""
 
     def __init__(self, db_path: str = DB_PATH):
+        """
+        Args:
+            db_path: SQLite file, or ":memory:" for a private in-memory store
+                (e.g. tests); it lives as long as this UserStore
+        """
         self.db_path = db_path
+        self._uri = False
+        self._local = threading.local()
+        self._memory_keeper: sqlite3.Connection | None = None
+        if db_path == ":memory:":
+            # Named shared-cache memory DB so every per-call connection sees
+            # the same data; the keeper connection keeps it alive
+            self.db_path = (
+                f"file:dash_users_{uuid.uuid4().hex}?mode=memory&cache=shared"
+            )
+            self._uri = True
+            self._memory_keeper = sqlite3.connect(self.db_path, uri=True)
         self._ensure_database()
 
     def _ensure_database(self):
         """Ensure database and table exist"""
         # Create directory if needed
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        if not self._uri:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -66,13 +89,25 @@ class UserStore:
 
     @contextmanager
     def _get_connection(self):
-        """Get database connection context manager"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like row access
+        """
+        Get database connection context manager
+
+        Each thread reuses one connection, so its prepared statement cache
+        survives across calls instead of every query being parsed again.
+        Uncommitted work is rolled back on exit, as closing used to do.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, uri=self._uri, cached_statements=_CACHED_STATEMENTS
+            )
+            conn.row_factory = sqlite3.Row  # Enable dict-like row access
+            self._local.conn = conn
         try:
             yield conn
         finally:
-            conn.close()
+            if conn.in_transaction:
+                conn.rollback()
 
     def create_user(self, email: str, password: str, roles: list[str] = None) -> str:
         """
@@ -89,17 +124,7 @@ class UserStore:
         Raises:
             ValueError: If email already exists or invalid data
         """
-        if not email or not password:
-            raise ValueError("Email and password are required")
-
-        if roles is None:
-            roles = ["viewer"]
-
-        # Validate roles
-        valid_roles = ["viewer", "trader", "admin"]
-        invalid_roles = [r for r in roles if r not in valid_roles]
-        if invalid_roles:
-            raise ValueError(f"Invalid roles: {invalid_roles}. Valid: {valid_roles}")
+        roles = self._validate_new_user(email, password, roles)
 
         user_id = str(uuid.uuid4())
         pwd_hash = hash_password(password)
@@ -132,6 +157,86 @@ class UserStore:
                 raise ValueError(f"User with email {email} already exists")
             raise ValueError(f"Database error: {e}")
 
+    @staticmethod
+    def _validate_new_user(email: str, password: str, roles: list[str] | None):
+        """Check new-user input; returns the roles to store"""
+        if not email or not password:
+            raise ValueError("Email and password are required")
+
+        if roles is None:
+            roles = ["viewer"]
+
+        # Validate roles
+        valid_roles = ["viewer", "trader", "admin"]
+        invalid_roles = [r for r in roles if r not in valid_roles]
+        if invalid_roles:
+            raise ValueError(f"Invalid roles: {invalid_roles}. Valid: {valid_roles}")
+
+        return roles
+
+    def create_users_bulk(
+        self, records: list[tuple[str, str, list[str] | None]]
+    ) -> list[str]:
+        """
+        Create several users in one transaction
+
+        Passwords are hashed concurrently (bcrypt releases the GIL) and all
+        rows are inserted together; either every user is created or none.
+
+        Args:
+            records: (email, password, roles) tuples; roles may be None
+
+        Returns:
+            User IDs, in record order
+
+        Raises:
+            ValueError: If any email already exists or any record is invalid
+        """
+        roles_list = [
+            self._validate_new_user(email, password, roles)
+            for email, password, roles in records
+        ]
+        if not records:
+            return []
+
+        workers = min(len(records), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pwd_hashes = list(pool.map(hash_password, [r[1] for r in records]))
+
+        created_ts = int(datetime.utcnow().timestamp())
+        user_ids = [str(uuid.uuid4()) for _ in records]
+        rows = [
+            (user_id, email.lower().strip(), pwd_hash, ",".join(roles), created_ts)
+            for user_id, (email, _, _), pwd_hash, roles in zip(
+                user_ids, records, pwd_hashes, roles_list
+            )
+        ]
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO users (id, email, pwd_hash, roles_csv, created_ts)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e):
+                raise ValueError(f"A user in the batch already exists: {e}")
+            raise ValueError(f"Database error: {e}")
+
+        for user_id, (email, _, _), roles in zip(user_ids, records, roles_list):
+            log_audit_event(
+                "user_created",
+                user_id=user_id,
+                details={"email": email, "roles": roles},
+            )
+        logger.info(f"Created {len(user_ids)} users")
+
+        return user_ids
+
     def authenticate_user(self, email: str, password: str) -> dict[str, Any] | None:
         """
         Authenticate user by email and password
@@ -343,35 +448,28 @@ class UserStore:
 
     def get_stats(self) -> dict[str, Any]:
         """Get user statistics"""
+        # Recent logins cover the last 7 days
+        week_ago = int((datetime.utcnow().timestamp()) - (7 * 24 * 3600))
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Total users
-            cursor.execute("SELECT COUNT(*) FROM users WHERE active = 1")
-            total_users = cursor.fetchone()[0]
-
-            # Users by role
+            # One pass over active users: per role set, members and recent logins
             cursor.execute(
                 """
-                SELECT roles_csv, COUNT(*)
+                SELECT roles_csv, COUNT(*),
+                       COUNT(CASE WHEN last_login_ts >= ? THEN 1 END)
                 FROM users
                 WHERE active = 1
                 GROUP BY roles_csv
-            """
-            )
-            role_counts = dict(cursor.fetchall())
-
-            # Recent logins (last 7 days)
-            week_ago = int((datetime.utcnow().timestamp()) - (7 * 24 * 3600))
-            cursor.execute(
-                """
-                SELECT COUNT(*)
-                FROM users
-                WHERE active = 1 AND last_login_ts >= ?
             """,
                 (week_ago,),
             )
-            recent_logins = cursor.fetchone()[0]
+            rows = cursor.fetchall()
+
+            role_counts = {roles_csv: count for roles_csv, count, _ in rows}
+            total_users = sum(role_counts.values())
+            recent_logins = sum(recent for _, _, recent in rows)
 
             return {
                 "total_users": total_users,
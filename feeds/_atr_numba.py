@@ -0,0 +1,28 @@
+"""
+Numba-compiled ATR smoothing kernel
+
+Optional accelerator for calculate_atr: importing this module raises
+ImportError when numba is not installed, and callers keep the pandas path.
+"""
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def ewm_last(values: np.ndarray, period: int) -> float:
+    """
+    Last value of values.ewm(span=period, adjust=False).mean()
+
+    Follows pandas' update step operation for operation so results match
+    bit for bit (no fastmath). Inputs must be finite; pandas' NaN handling
+    is not reproduced.
+    """
+    com = (period - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+
+    weighted = values[0]
+    for i in range(1, values.shape[0]):
+        weighted = (old_wt * weighted + alpha * values[i]) / (old_wt + alpha)
+    return weighted
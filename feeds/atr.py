@@ -7,20 +7,33 @@ Calculates ATR using Feed abstraction for live/backtest parity
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from .batch import CandleBatch
+
+try:
+    from ._atr_numba import ewm_last
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from feeds.base import Candle, Feed
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_atr(candles: list["Candle"], period: int = 14) -> float | None:
+def calculate_atr(candles: "Sequence[Candle]", period: int = 14) -> float | None:
     """
     Calculate Average True Range from candle data
 
     Args:
-        candles: List of candles in chronological order (oldest to newest)
+        candles: Candles in chronological order (oldest to newest); a
+            CandleBatch is read column-wise without per-candle access
         period: ATR calculation period (default: 14)
 
     Returns:
@@ -36,32 +49,33 @@ def calculate_atr(candles: list["Candle"], period: int = 14) -> float | None:
         return None
 
     try:
-        # Convert candles to DataFrame
-        data = []
-        for candle in candles:
-            data.append(
-                {
-                    "high": candle.high,
-                    "low": candle.low,
-                    "close": candle.close,
-                }
-            )
-
-        df = pd.DataFrame(data)
-
-        # Calculate True Range components
-        df["hl"] = df["high"] - df["low"]  # High - Low
-        df["hcp"] = abs(df["high"] - df["close"].shift(1))  # |High - Previous Close|
-        df["lcp"] = abs(df["low"] - df["close"].shift(1))  # |Low - Previous Close|
-
-        # True Range = max(HL, HCP, LCP)
-        df["tr"] = df[["hl", "hcp", "lcp"]].max(axis=1)
-
-        # ATR = EMA of True Range
-        atr_series = df["tr"].ewm(span=period, adjust=False).mean()
-
-        # Get the most recent ATR value
-        current_atr = atr_series.iloc[-1]
+        if isinstance(candles, CandleBatch):
+            high, low, close = candles.high, candles.low, candles.close
+        else:
+            # Pull candle fields into arrays once
+            count = len(candles)
+            high = np.fromiter((c.high for c in candles), np.float64, count=count)
+            low = np.fromiter((c.low for c in candles), np.float64, count=count)
+            close = np.fromiter((c.close for c in candles), np.float64, count=count)
+
+        # The first candle has no previous close, so its True Range is High - Low
+        prev_close = np.empty_like(close)
+        prev_close[0] = close[0]
+        prev_close[1:] = close[:-1]
+
+        # True Range = max(HL, |High - Previous Close|, |Low - Previous Close|)
+        tr = np.maximum(
+            high - low,
+            np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)),
+        )
+        tr[0] = high[0] - low[0]
+
+        # ATR = EMA of True Range; keep the most recent value. The compiled
+        # kernel skips Series construction but only handles finite input
+        if NUMBA_AVAILABLE and np.isfinite(tr).all():
+            current_atr = ewm_last(tr, period)
+        else:
+            current_atr = pd.Series(tr).ewm(span=period, adjust=False).mean().iloc[-1]
 
         logger.debug(
             f"Calculated ATR({period}): {current_atr:.5f} from {len(candles)} candles"
@@ -5,18 +5,35 @@ Reads CSV data files exported from MT5 or other sources
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from .base import BaseFeed, Candle
+from .batch import CandleBatch
 
 if TYPE_CHECKING:
     from config.settings import ApplicationSettings
 
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Multithreaded Arrow CSV parser when installed, pandas' C parser otherwise
+_CSV_ENGINE = "pyarrow" if PYARROW_AVAILABLE else "c"
+
+# Columns kept in the typed sidecar written next to each parsed CSV
+_SIDECAR_COLUMNS = ("ts", "open", "high", "low", "close", "volume")
+_SIDECAR_SUFFIX = ".npz"
+
 
 class BacktestFeed(BaseFeed):
     """Backtest feed for historical data replay"""
@@ -32,6 +49,7 @@ class BacktestFeed(BaseFeed):
         super().__init__(settings)
         self.data_dir = Path(data_dir)
         self._cache: dict[str, pd.DataFrame] = {}
+        self._batches: dict[str, CandleBatch] = {}
 
         if not self.data_dir.exists():
             self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -83,8 +101,17 @@ class BacktestFeed(BaseFeed):
                 f"Available files: {available_names}"
             )
 
+        sidecar = csv_file.with_name(csv_file.name + _SIDECAR_SUFFIX)
+        df = self._read_sidecar(csv_file, sidecar)
+        if df is not None:
+            self._cache[cache_key] = df
+            logger.info(
+                f"Loaded {len(df)} candles for {symbol} {timeframe} from {sidecar}"
+            )
+            return df
+
         try:
-            df = pd.read_csv(csv_file)
+            df = pd.read_csv(csv_file, engine=_CSV_ENGINE)
 
             # Handle different CSV formats
             df = self._normalize_csv_columns(df)
@@ -92,6 +119,9 @@ class BacktestFeed(BaseFeed):
             # Ensure proper data types
             df = self._validate_csv_data(df, symbol, timeframe)
 
+            # Later runs can skip CSV parsing
+            self._write_sidecar(df, sidecar)
+
             # Cache the processed data
             self._cache[cache_key] = df
 
@@ -104,6 +134,37 @@ class BacktestFeed(BaseFeed):
         except Exception as e:
             raise RuntimeError(f"Failed to load CSV data from {csv_file}: {e}") from e
 
+    def _read_sidecar(self, csv_file: Path, sidecar: Path) -> pd.DataFrame | None:
+        """
+        Load the typed sidecar of a CSV file if it is at least as new as the CSV
+
+        Returns:
+            DataFrame with the standard OHLCV columns, or None if the sidecar
+            is missing, stale or unreadable
+        """
+        try:
+            if sidecar.stat().st_mtime < csv_file.stat().st_mtime:
+                return None
+            with np.load(sidecar, allow_pickle=False) as arrays:
+                return pd.DataFrame({col: arrays[col] for col in _SIDECAR_COLUMNS})
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable data sidecar {sidecar}: {e}")
+            return None
+
+    def _write_sidecar(self, df: pd.DataFrame, sidecar: Path) -> None:
+        """Save the validated OHLCV columns next to the CSV they came from"""
+        tmp_file = sidecar.with_name(sidecar.name + ".tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                np.savez(f, **{col: df[col].to_numpy() for col in _SIDECAR_COLUMNS})
+            os.replace(tmp_file, sidecar)
+        except OSError as e:
+            # Read-only data directories still work, just without the sidecar
+            logger.warning(f"Could not write data sidecar {sidecar}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
     def _normalize_csv_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize CSV column names to standard format
@@ -215,7 +276,23 @@ class BacktestFeed(BaseFeed):
 
         return df
 
-    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> list[Candle]:
+    def _load_batch(self, symbol: str, timeframe: str) -> CandleBatch:
+        """
+        Column arrays of the cached CSV data, built once per symbol/timeframe
+
+        The arrays are read-only: get_ohlcv hands out slices that share their
+        memory instead of copying the requested rows.
+        """
+        cache_key = f"{symbol}_{timeframe}"
+        batch = self._batches.get(cache_key)
+        if batch is None:
+            batch = CandleBatch.from_frame(self._load_csv_data(symbol, timeframe))
+            for column in _SIDECAR_COLUMNS:
+                getattr(batch, column).flags.writeable = False
+            self._batches[cache_key] = batch
+        return batch
+
+    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> CandleBatch:
         """
         Get historical OHLCV data from CSV
 
@@ -225,37 +302,24 @@ class BacktestFeed(BaseFeed):
             n: Number of candles to retrieve (most recent)
 
         Returns:
-            List of candles in chronological order (oldest to newest)
+            Candles in chronological order (oldest to newest)
 
         Raises:
             RuntimeError: If CSV file not found or data invalid
         """
         try:
-            df = self._load_csv_data(symbol, timeframe)
+            batch = self._load_batch(symbol, timeframe)
 
             # Get the most recent n candles
-            if n > len(df):
+            if n > len(batch):
                 logger.warning(
-                    f"Requested {n} candles but only {len(df)} available "
+                    f"Requested {n} candles but only {len(batch)} available "
                     f"for {symbol} {timeframe}"
                 )
-                n = len(df)
-
-            # Take the last n rows (most recent)
-            recent_data = df.tail(n)
-
-            # Convert to Candle objects
-            candles = []
-            for _, row in recent_data.iterrows():
-                candle = Candle(
-                    ts=int(row["ts"]),
-                    open=float(row["open"]),
-                    high=float(row["high"]),
-                    low=float(row["low"]),
-                    close=float(row["close"]),
-                    volume=float(row["volume"]),
-                )
-                candles.append(candle)
+                n = len(batch)
+
+            # Take the last n rows (most recent) as views of the cached arrays
+            candles = batch[len(batch) - max(n, 0) :]
 
             logger.debug(
                 f"Fetched {len(candles)} candles for {symbol} {timeframe} from CSV"
@@ -5,6 +5,7 @@ Provides unified interface for live and backtesting data feeds
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from pydantic import BaseModel, Field
@@ -46,7 +47,7 @@ class Feed(Protocol):
         """
         ...
 
-    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> list[Candle]:
+    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> Sequence[Candle]:
         """
         Get historical OHLCV data
 
@@ -56,7 +57,8 @@ class Feed(Protocol):
             n: Number of candles to retrieve (most recent first)
 
         Returns:
-            List of candles in chronological order (oldest to newest)
+            Candles in chronological order (oldest to newest), e.g. a
+            CandleBatch
 
         Raises:
             RuntimeError: If data fetch fails
@@ -77,6 +79,6 @@ class BaseFeed(ABC):
         pass
 
     @abstractmethod
-    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> list[Candle]:
+    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> Sequence[Candle]:
         """Get historical candles - must be implemented by subclasses"""
         pass
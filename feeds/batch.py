@@ -0,0 +1,74 @@
+"""
+Column-oriented candle container
+
+Holds OHLCV history as one NumPy array per field so indicator code can work
+on whole columns; individual Candle objects are only built when indexed
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .base import Candle
+
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True, eq=False)
+class CandleBatch(Sequence[Candle]):
+    """
+    Candles in chronological order (oldest to newest), stored as arrays
+
+    Behaves like a read-only list of Candle: integer indexing and iteration
+    yield Candle objects, slicing returns another CandleBatch over views of
+    the same arrays.
+    """
+
+    ts: np.ndarray  # int64 Unix timestamps (UTC seconds)
+    open: np.ndarray  # float64 columns from here on
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "CandleBatch":
+        """Build a batch from a DataFrame with ts/open/high/low/close/volume"""
+        return cls(
+            ts=df["ts"].to_numpy(dtype=np.int64),
+            **{name: df[name].to_numpy(dtype=np.float64) for name in _PRICE_FIELDS},
+        )
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __getitem__(self, index: int | slice) -> "Candle | CandleBatch":
+        if isinstance(index, slice):
+            return CandleBatch(
+                ts=self.ts[index],
+                **{name: getattr(self, name)[index] for name in _PRICE_FIELDS},
+            )
+        # Columns are already typed, so skip model validation
+        return Candle.model_construct(
+            ts=int(self.ts[index]),
+            open=float(self.open[index]),
+            high=float(self.high[index]),
+            low=float(self.low[index]),
+            close=float(self.close[index]),
+            volume=float(self.volume[index]),
+        )
+
+    def __iter__(self) -> Iterator[Candle]:
+        for ts, open_, high, low, close, volume in zip(
+            self.ts.tolist(),
+            self.open.tolist(),
+            self.high.tolist(),
+            self.low.tolist(),
+            self.close.tolist(),
+            self.volume.tolist(),
+        ):
+            yield Candle.model_construct(
+                ts=ts, open=open_, high=high, low=low, close=close, volume=volume
+            )
@@ -7,6 +7,8 @@ Provides unified interface for creating live or backtest feeds based on configur
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from models.slippage import FixedPipsSlippage, NoSlippage, PercentOfATRSlippage
 
 from .backtest import BacktestFeed
@@ -106,6 +108,10 @@ class FeedWithSlippage:
         self.fee_per_lot = settings.feed.fee_per_lot
         self.pip_size = settings.feed.pip_size
 
+        # BUY pays half the spread above mid, SELL receives half below
+        half_spread = (self.spread_pips / 2) * self.pip_size
+        self._spread_by_side = {"BUY": half_spread, "SELL": -half_spread}
+
         logger.info(
             f"FeedWithSlippage initialized: "
             f"feed={settings.feed.feed_kind}, "
@@ -148,12 +154,12 @@ class FeedWithSlippage:
         Returns:
             Spread cost in price units
         """
-        spread_cost = (self.spread_pips / 2) * self.pip_size
-
-        if side.upper() == "BUY":
-            return spread_cost  # BUY pays half spread above mid
-        else:  # SELL
-            return -spread_cost  # SELL receives half spread below mid
+        spread_cost = self._spread_by_side.get(side)
+        if spread_cost is None:
+            # Lower-case or unknown sides: anything but BUY prices as SELL
+            is_buy = side.upper() == "BUY"
+            spread_cost = self._spread_by_side["BUY" if is_buy else "SELL"]
+        return spread_cost
 
     def get_commission_cost(self, lot_size: float) -> float:
         """
@@ -166,3 +172,15 @@ class FeedWithSlippage:
             Commission cost in account currency
         """
         return self.fee_per_lot * abs(lot_size)
+
+    def get_commission_cost_many(self, lot_sizes: np.ndarray) -> np.ndarray:
+        """
+        Get commission costs for a batch of trades in one vectorized pass
+
+        Args:
+            lot_sizes: Position sizes in lots
+
+        Returns:
+            Commission costs in account currency, one per trade
+        """
+        return self.fee_per_lot * np.abs(np.asarray(lot_sizes, dtype=np.float64))
@@ -8,8 +8,10 @@ import logging
 from typing import TYPE_CHECKING
 
 import MetaTrader5 as mt5
+import numpy as np
 
 from .base import BaseFeed, Candle
+from .batch import CandleBatch
 
 if TYPE_CHECKING:
     from config.settings import ApplicationSettings
@@ -53,7 +55,7 @@ class LiveMT5Feed(BaseFeed):
             )
         return _TIMEFRAME_MAP[timeframe]
 
-    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> list[Candle]:
+    def get_ohlcv(self, symbol: str, timeframe: str, n: int) -> CandleBatch:
         """
         Get historical OHLCV data from MT5
 
@@ -63,7 +65,7 @@ class LiveMT5Feed(BaseFeed):
             n: Number of candles to retrieve
 
         Returns:
-            List of candles in chronological order (oldest to newest)
+            Candles in chronological order (oldest to newest)
 
         Raises:
             RuntimeError: If MT5 data fetch fails
@@ -83,18 +85,19 @@ class LiveMT5Feed(BaseFeed):
             if len(rates) == 0:
                 raise RuntimeError(f"No data returned for {symbol} {timeframe}")
 
-            # Convert to Candle objects (rates come in chronological order)
-            candles = []
-            for rate in rates:
-                candle = Candle(
-                    ts=int(rate["time"]),
-                    open=float(rate["open"]),
-                    high=float(rate["high"]),
-                    low=float(rate["low"]),
-                    close=float(rate["close"]),
-                    volume=float(rate["tick_volume"]),
-                )
-                candles.append(candle)
+            # Rates are a structured array in chronological order; copy each
+            # field into a contiguous column rather than keeping strided views
+            def column(field: str, dtype: type) -> np.ndarray:
+                return np.ascontiguousarray(rates[field], dtype=dtype)
+
+            candles = CandleBatch(
+                ts=column("time", np.int64),
+                open=column("open", np.float64),
+                high=column("high", np.float64),
+                low=column("low", np.float64),
+                close=column("close", np.float64),
+                volume=column("tick_volume", np.float64),
+            )
 
             logger.debug(
                 f"Fetched {len(candles)} candles for {symbol} {timeframe} from MT5"
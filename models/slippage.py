@@ -8,8 +8,13 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Protocol
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Direction slippage moves the price: against us on both sides
+_SIDE_SIGN = {"BUY": 1.0, "SELL": -1.0}
+
 
 class SlippageModel(Protocol):
     """Protocol for slippage calculation models"""
@@ -44,10 +49,17 @@ class BaseSlippageModel(ABC):
     def _validate_side(self, side: str) -> str:
         """Validate and normalize order side"""
         side_upper = side.upper()
-        if side_upper not in ("BUY", "SELL"):
+        if side_upper not in _SIDE_SIGN:
             raise ValueError(f"Invalid order side: {side}. Must be 'BUY' or 'SELL'")
         return side_upper
 
+    def _side_sign(self, side: str) -> float:
+        """Validate order side and return +1.0 for BUY, -1.0 for SELL"""
+        sign = _SIDE_SIGN.get(side)
+        if sign is None:
+            sign = _SIDE_SIGN[self._validate_side(side)]
+        return sign
+
     def _validate_price(self, price: float) -> float:
         """Validate order price"""
         if price <= 0:
@@ -91,23 +103,46 @@ class FixedPipsSlippage(BaseSlippageModel):
         Returns:
             Price with slippage applied
         """
-        side = self._validate_side(side)
+        sign = self._side_sign(side)
         price = self._validate_price(price)
 
-        if side == "BUY":
-            # BUY: pay more (slippage against us)
-            slipped_price = price + self.slippage_amount
-        else:  # SELL
-            # SELL: receive less (slippage against us)
-            slipped_price = price - self.slippage_amount
+        # BUY pays more, SELL receives less
+        slipped_price = price + sign * self.slippage_amount
 
-        logger.debug(
-            f"Fixed slippage applied: {side} {price} → {slipped_price} "
-            f"(slip: {self.slippage_amount})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Fixed slippage applied: {side} {price} → {slipped_price} "
+                f"(slip: {self.slippage_amount})"
+            )
 
         return slipped_price
 
+    def apply_many(self, sides: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """
+        Apply fixed pip slippage to a batch of fills in one vectorized pass
+
+        Args:
+            sides: Order sides ('BUY' or 'SELL'), one per price
+            prices: Original order prices
+
+        Returns:
+            Prices with slippage applied, same results as calling apply per fill
+
+        Raises:
+            ValueError: If any side is not 'BUY'/'SELL' or any price is not positive
+        """
+        sides = np.asarray(sides)
+        prices = np.asarray(prices, dtype=np.float64)
+
+        buys = sides == "BUY"
+        if not (buys | (sides == "SELL")).all():
+            raise ValueError("Invalid order side in batch. Must be 'BUY' or 'SELL'")
+        if not (prices > 0).all():
+            raise ValueError("Prices must be positive")
+
+        signs = np.where(buys, 1.0, -1.0)
+        return prices + signs * self.slippage_amount
+
 
 class PercentOfATRSlippage(BaseSlippageModel):
     """ATR percentage-based slippage model"""
@@ -142,7 +177,7 @@ class PercentOfATRSlippage(BaseSlippageModel):
         Raises:
             ValueError: If ATR is None or invalid
         """
-        side = self._validate_side(side)
+        sign = self._side_sign(side)
         price = self._validate_price(price)
 
         if atr is None:
@@ -153,17 +188,14 @@ class PercentOfATRSlippage(BaseSlippageModel):
         # Calculate slippage amount as percentage of ATR
         slippage_amount = atr * self.atr_multiplier
 
-        if side == "BUY":
-            # BUY: pay more (slippage against us)
-            slipped_price = price + slippage_amount
-        else:  # SELL
-            # SELL: receive less (slippage against us)
-            slipped_price = price - slippage_amount
+        # BUY pays more, SELL receives less
+        slipped_price = price + sign * slippage_amount
 
-        logger.debug(
-            f"ATR slippage applied: {side} {price} → {slipped_price} "
-            f"(ATR: {atr}, slip: {slippage_amount}, {self.atr_percentage}%)"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"ATR slippage applied: {side} {price} → {slipped_price} "
+                f"(ATR: {atr}, slip: {slippage_amount}, {self.atr_percentage}%)"
+            )
 
         return slipped_price
 
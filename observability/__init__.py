@@ -4,7 +4,14 @@ Observability module - metrics, health checks, and monitoring
 
 from .health import check_health
 from .httpd import start_httpd
-from .metrics import get_metrics, inc, observe, render_as_text, set_gauge
+from .metrics import (
+    get_metrics,
+    inc,
+    observe,
+    render_as_bytes,
+    render_as_text,
+    set_gauge,
+)
 
 __all__ = [
     "get_metrics",
@@ -12,6 +19,7 @@ __all__ = [
     "set_gauge",
     "observe",
     "render_as_text",
+    "render_as_bytes",
     "check_health",
     "start_httpd",
 ]
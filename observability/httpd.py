@@ -14,7 +14,7 @@ from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Optional
 
 from .health import check_health
-from .metrics import render_as_text
+from .metrics import render_as_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -44,12 +44,12 @@ class MetricsHTTPHandler(BaseHTTPRequestHandler):
     def _serve_metrics(self):
         """Serve metrics endpoint."""
         try:
-            text = render_as_text()
+            body = render_as_bytes()
             self.send_response(200)
             self.send_header("Content-Type", "text/plain; charset=utf-8")
             self.send_header("Cache-Control", "no-cache")
             self.end_headers()
-            self.wfile.write(text.encode("utf-8"))
+            self.wfile.write(body)
         except Exception as e:
             logger.error(f"Error serving metrics: {e}")
             self._serve_error(500, "Error generating metrics")
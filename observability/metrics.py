@@ -5,27 +5,257 @@ Provides a simple metrics API with Counter, Gauge, and Histogram-like functional
 Thread-safe using locks. Optional Prometheus exporter if ENABLE_PROMETHEUS=true.
 """
 
+import functools
+import math
 import os
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Callable, Sequence
 from typing import Any, Optional
 
+import numpy as np
+
+
+@functools.lru_cache(maxsize=5000)
+def _compose_label_key(items: tuple[tuple[str, str], ...]) -> str:
+    """Join rendered label pairs into a registry key; bounded LRU over label sets."""
+    return "&".join(f"{k}={v}" for k, v in sorted(items))
+
+
+def _label_block(label_key: str) -> str:
+    """Label set rendered as {k=v,...}, %-escaped for use in a template."""
+    if label_key == "__default__":
+        return ""
+    return ("{" + label_key.replace("&", ",") + "}").replace("%", "%%")
+
+
+@functools.lru_cache(maxsize=5000)
+def _series_template(name: str, label_key: str) -> bytes:
+    """Exposition line for a counter or gauge series; takes (value, ts)."""
+    return (name.replace("%", "%%") + _label_block(label_key)).encode() + b" %b %d"
+
+
+@functools.lru_cache(maxsize=5000)
+def _histogram_templates(name: str, label_key: str) -> tuple[bytes, ...]:
+    """Exposition lines for a histogram series: count, sum, avg, p50/95/99."""
+    base = name.replace("%", "%%")
+    labels = _label_block(label_key)
+    return tuple(
+        f"{base}_{suffix}{labels} {spec} %d".encode()
+        for suffix, spec in (
+            ("count", "%d"),
+            ("sum", "%b"),
+            ("avg", "%.6f"),
+            ("p50", "%.6g"),
+            ("p95", "%.6g"),
+            ("p99", "%.6g"),
+        )
+    )
+
+
+def _sample(value: Any) -> bytes:
+    """A sample value exactly as str() renders it, for a %b slot."""
+    return str(value).encode()
+
+
+class Circllhist:
+    """
+    Log-linear sparse histogram (circllhist) for one histogram series.
+
+    Observations are counted in bins of two significant decimal digits,
+    [m * 10**e, (m + 1) * 10**e) with m in 10..99, so memory stays bounded
+    however many values are observed and quantiles carry under 5% relative
+    error. Count, sum, min and max are exact, and the last few raw
+    observations are kept for inspection.
+    """
+
+    __slots__ = ("bins", "count", "sum", "min", "max", "recent", "lock")
+
+    # Raw observations kept for the summary's "values"
+    RECENT = 10
+
+    def __init__(self):
+        # Packed bin code -> observations; codes sort in value order
+        self.bins: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        # Extremes of the finite observations, None until one is seen
+        self.min: float | None = None
+        self.max: float | None = None
+        self.recent: deque[float] = deque(maxlen=self.RECENT)
+        # Per-series lock; the registry holds it around observe and reads
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _bin_code(value: float) -> int:
+        """Pack a value's (sign, exponent, mantissa) bin into one int."""
+        if value == 0:
+            return 0
+        magnitude = abs(value)
+        exponent = math.floor(math.log10(magnitude)) - 1
+        # Saturate tiny values before scaling: 10**-exponent overflows a
+        # float below ~1e-308 (one spare step for the rounding fix below)
+        if exponent < -129:
+            return 0
+        if exponent >= 0:
+            mantissa = int(magnitude / 10**exponent)
+        else:
+            mantissa = int(magnitude * 10**-exponent)
+        # Correct log10 rounding at decade boundaries
+        if mantissa >= 100:
+            mantissa //= 10
+            exponent += 1
+        elif mantissa < 10:
+            mantissa *= 10
+            exponent -= 1
+        # Exponents outside -128..127 saturate, as in circllhist
+        if exponent < -128:
+            return 0
+        if exponent > 127:
+            exponent, mantissa = 127, 99
+        code = (exponent + 128) * 100 + mantissa
+        return code if value > 0 else -code
+
+    def observe(self, value: float) -> None:
+        # Bin first so a failure leaves the series untouched
+        finite = math.isfinite(value)
+        code = self._bin_code(value) if finite else 0
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+        if finite:
+            self.bins[code] = self.bins.get(code, 0) + 1
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+
+    def __len__(self) -> int:
+        return self.count
+
+    def quantiles(self, qs: Sequence[float]) -> list[float | None]:
+        """
+        Approximate quantiles (each 0..1) from the bins in one pass.
+
+        Returns None for every q when nothing has been binned.
+        """
+        if not self.bins:
+            return [None] * len(qs)
+        codes = np.array(sorted(self.bins), dtype=np.int64)
+        cumulative = np.cumsum([self.bins[code] for code in codes.tolist()])
+        ranks = np.maximum(1, np.ceil(np.asarray(qs) * cumulative[-1]))
+        idx = np.minimum(np.searchsorted(cumulative, ranks), len(codes) - 1)
+        picked = codes[idx]
+        exponent, mantissa = np.divmod(np.abs(picked), 100)
+        midpoint = (mantissa + 0.5) * np.power(10.0, exponent - 128)
+        return np.where(picked == 0, 0.0, np.sign(picked) * midpoint).tolist()
+
+    def quantile(self, q: float) -> float | None:
+        """Approximate q-quantile (0..1) from the bins, None when empty."""
+        return self.quantiles((q,))[0]
+
+    def summary(self) -> dict[str, Any]:
+        """Count, sum, recent values, exact min/max and binned quantiles."""
+        p50, p95, p99 = self.quantiles((0.5, 0.95, 0.99))
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "values": list(self.recent),
+            "min": self.min,
+            "max": self.max,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+        }
+
+
+class _CounterShard:
+    """One thread's counter increments not yet merged into the registry."""
+
+    __slots__ = ("lock", "pending", "events", "thread")
+
+    def __init__(self):
+        # Contended only when another thread drains this shard
+        self.lock = threading.Lock()
+        self.pending: dict[tuple[str, str], float] = {}
+        self.events = 0
+        self.thread = threading.current_thread()
+
+
+class _ShardedCounters:
+    """Per-thread counter accumulators, drained in batches into the registry."""
+
+    # Increments a thread buffers before draining its own shard
+    FLUSH_EVERY = 256
+
+    def __init__(self, merge: Callable[[dict[tuple[str, str], float]], None]):
+        """
+        Args:
+            merge: Receives the drained increments of exited threads' shards
+        """
+        self._tls = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_CounterShard] = []
+        self._merge = merge
+
+    def _shard(self) -> _CounterShard:
+        shard = getattr(self._tls, "shard", None)
+        if shard is None:
+            shard = self._tls.shard = _CounterShard()
+            # Retire exited threads' shards here too, so thread churn cannot
+            # grow the list when nothing reads the registry
+            with self._lock:
+                alive, dead = [shard], []
+                for other in self._shards:
+                    (alive if other.thread.is_alive() else dead).append(other)
+                self._shards = alive
+            for other in dead:
+                self._merge(self.drain(other))
+        return shard
+
+    def add(self, key: tuple[str, str], value: float) -> _CounterShard | None:
+        """Buffer an increment; returns the shard when it is due to be drained."""
+        shard = self._shard()
+        with shard.lock:
+            pending = shard.pending
+            pending[key] = pending.get(key, 0.0) + value
+            shard.events += 1
+            return shard if shard.events >= self.FLUSH_EVERY else None
+
+    @staticmethod
+    def drain(shard: _CounterShard) -> dict[tuple[str, str], float]:
+        """Detach and return a shard's pending increments."""
+        with shard.lock:
+            pending = shard.pending
+            shard.pending = {}
+            shard.events = 0
+        return pending
+
+    def shards(self) -> list[_CounterShard]:
+        """Return all shards, forgetting those of exited threads."""
+        with self._lock:
+            shards = self._shards
+            self._shards = [shard for shard in shards if shard.thread.is_alive()]
+        return shards
+
 
 class MetricsRegistry:
     """Thread-safe metrics registry with Counter, Gauge, and Histogram support."""
 
     def __init__(self):
+        # Guards gauges
         self._lock = threading.Lock()
-        self._counters: dict[str, dict[str, float]] = defaultdict(
-            lambda: defaultdict(float)
-        )
+        # Taken only when a counter or histogram series is created; updates
+        # use the series' own lock so different series never contend
+        self._structure_lock = threading.Lock()
+        self._counters: dict[str, dict[str, float]] = {}
+        self._counter_locks: dict[str, threading.Lock] = {}
+        self._counter_shards = _ShardedCounters(self._merge_counters)
         self._gauges: dict[str, dict[str, float]] = defaultdict(
             lambda: defaultdict(float)
         )
-        self._histograms: dict[str, dict[str, list]] = defaultdict(
-            lambda: defaultdict(list)
-        )
+        self._histograms: dict[str, dict[str, Circllhist]] = {}
         self._prometheus_enabled = (
             os.getenv("ENABLE_PROMETHEUS", "false").lower() == "true"
         )
@@ -50,17 +280,81 @@ class MetricsRegistry:
             )
 
     def _get_label_key(self, **labels) -> str:
-        """Generate a key for label combinations."""
+        """Generate a key for label combinations (cached per label set)."""
         if not labels:
             return "__default__"
-        return "&".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        # Cache on rendered values: 200 and 200.0 (or 1 and True) are equal
+        # as keys but name different series
+        return _compose_label_key(tuple((k, str(v)) for k, v in labels.items()))
+
+    def _counter_series(self, name: str) -> tuple[dict[str, float], threading.Lock]:
+        """Return a counter's label buckets and lock, creating them on first use."""
+        lock = self._counter_locks.get(name)
+        if lock is None:
+            with self._structure_lock:
+                lock = self._counter_locks.get(name)
+                if lock is None:
+                    # Publish the buckets before the lock that marks them ready
+                    self._counters[name] = {}
+                    lock = self._counter_locks[name] = threading.Lock()
+        return self._counters[name], lock
+
+    def _merge_counters(self, pending: dict[tuple[str, str], float]) -> None:
+        """Add drained per-thread increments to the shared counters."""
+        for (name, label_key), value in pending.items():
+            buckets, lock = self._counter_series(name)
+            with lock:
+                buckets[label_key] = buckets.get(label_key, 0.0) + value
+
+    def flush(self) -> None:
+        """Merge every thread's buffered counter increments into the registry."""
+        for shard in self._counter_shards.shards():
+            self._merge_counters(self._counter_shards.drain(shard))
+
+    def _snapshot_counters(self) -> dict[str, dict[str, float]]:
+        """Copy all counters, holding each counter's lock only while copying it."""
+        self.flush()
+        with self._structure_lock:
+            series = [(name, self._counter_locks[name]) for name in self._counters]
+
+        snapshot = {}
+        for name, lock in series:
+            with lock:
+                snapshot[name] = dict(self._counters[name])
+        return snapshot
+
+    def _histogram_series(self, name: str, label_key: str) -> Circllhist:
+        """Return a histogram series, creating it on first use."""
+        series = self._histograms.get(name)
+        hist = series.get(label_key) if series is not None else None
+        if hist is None:
+            with self._structure_lock:
+                hist = self._histograms.setdefault(name, {}).setdefault(
+                    label_key, Circllhist()
+                )
+        return hist
+
+    def _histogram_items(self) -> list[tuple[str, str, Circllhist]]:
+        """List every histogram series; read each one under its own lock."""
+        with self._structure_lock:
+            return [
+                (name, label_key, hist)
+                for name, series in self._histograms.items()
+                for label_key, hist in series.items()
+            ]
 
     def inc(self, name: str, value: float = 1.0, **labels) -> None:
-        """Increment a counter metric."""
+        """
+        Increment a counter metric.
+
+        The increment lands in the calling thread's shard and is merged into
+        the registry in batches, or when metrics are read.
+        """
         label_key = self._get_label_key(**labels)
 
-        with self._lock:
-            self._counters[name][label_key] += value
+        due = self._counter_shards.add((name, label_key), value)
+        if due is not None:
+            self._merge_counters(self._counter_shards.drain(due))
 
         if self._prometheus_enabled and self._prometheus_registry:
             self._prometheus_inc(name, value, **labels)
@@ -79,13 +373,9 @@ class MetricsRegistry:
         """Observe a value for histogram-like metrics."""
         label_key = self._get_label_key(**labels)
 
-        with self._lock:
-            self._histograms[name][label_key].append(value)
-            # Keep only last 1000 observations to prevent memory issues
-            if len(self._histograms[name][label_key]) > 1000:
-                self._histograms[name][label_key] = self._histograms[name][label_key][
-                    -1000:
-                ]
+        hist = self._histogram_series(name, label_key)
+        with hist.lock:
+            hist.observe(value)
 
         if self._prometheus_enabled and self._prometheus_registry:
             self._prometheus_observe(name, value, **labels)
@@ -153,74 +443,99 @@ class MetricsRegistry:
         except Exception:
             pass  # Fail silently
 
-    def render_as_text(self) -> str:
-        """Render metrics as Prometheus text format."""
+    def render_as_bytes(self) -> bytes:
+        """Render metrics as Prometheus text format, UTF-8 encoded."""
         if self._prometheus_enabled and self._prometheus_registry:
             try:
                 from prometheus_client import generate_latest
 
-                return generate_latest(self._prometheus_registry).decode("utf-8")
+                return generate_latest(self._prometheus_registry)
             except Exception:
                 pass  # Fall back to simple format
 
-        # Simple text format fallback
+        # Simple text format fallback, built from cached bytes templates
         lines = []
         timestamp = int(time.time())
 
+        counters = self._snapshot_counters()
+
         with self._lock:
-            # Counters
-            for name, labels_dict in self._counters.items():
-                for label_key, value in labels_dict.items():
-                    if label_key == "__default__":
-                        lines.append(f"{name} {value} {timestamp}")
-                    else:
-                        label_str = "{" + label_key.replace("&", ",") + "}"
-                        lines.append(f"{name}{label_str} {value} {timestamp}")
-
-            # Gauges
-            for name, labels_dict in self._gauges.items():
-                for label_key, value in labels_dict.items():
-                    if label_key == "__default__":
-                        lines.append(f"{name} {value} {timestamp}")
-                    else:
-                        label_str = "{" + label_key.replace("&", ",") + "}"
-                        lines.append(f"{name}{label_str} {value} {timestamp}")
-
-            # Histograms (simplified - just count, sum, avg)
-            for name, labels_dict in self._histograms.items():
-                for label_key, values in labels_dict.items():
-                    if not values:
-                        continue
-
-                    count = len(values)
-                    total = sum(values)
-                    avg = total / count if count > 0 else 0
-
-                    suffix = (
-                        ""
-                        if label_key == "__default__"
-                        else "{" + label_key.replace("&", ",") + "}"
-                    )
-                    lines.append(f"{name}_count{suffix} {count} {timestamp}")
-                    lines.append(f"{name}_sum{suffix} {total} {timestamp}")
-                    lines.append(f"{name}_avg{suffix} {avg:.6f} {timestamp}")
-
-        return "\n".join(lines) + "\n"
+            # Counters and gauges: one cached template per series
+            for series in (counters, self._gauges):
+                for name, labels_dict in series.items():
+                    for label_key, value in labels_dict.items():
+                        lines.append(
+                            _series_template(name, label_key)
+                            % (_sample(value), timestamp)
+                        )
+
+        # Histograms (simplified - count, sum, avg and bin quantiles)
+        for name, label_key, values in self._histogram_items():
+            with values.lock:
+                count = values.count
+                total = values.sum
+                p50, p95, p99 = values.quantiles((0.5, 0.95, 0.99))
+            if not count:
+                continue
+
+            avg = total / count
+
+            t_count, t_sum, t_avg, t_p50, t_p95, t_p99 = _histogram_templates(
+                name, label_key
+            )
+            lines.append(t_count % (count, timestamp))
+            lines.append(t_sum % (_sample(total), timestamp))
+            lines.append(t_avg % (avg, timestamp))
+            if p50 is not None:
+                lines.append(t_p50 % (p50, timestamp))
+                lines.append(t_p95 % (p95, timestamp))
+                lines.append(t_p99 % (p99, timestamp))
+
+        return b"\n".join(lines) + b"\n"
+
+    def render_as_text(self) -> str:
+        """Render metrics as Prometheus text format."""
+        return self.render_as_bytes().decode("utf-8")
 
     def get_all_metrics(self) -> dict[str, Any]:
         """Get all metrics as a dict for debugging/inspection."""
+        counters = self._snapshot_counters()
+
+        histograms: dict[str, dict[str, Any]] = {}
+        for name, label_key, hist in self._histogram_items():
+            with hist.lock:
+                histograms.setdefault(name, {})[label_key] = hist.summary()
+
+        with self._lock:
+            gauges = dict(self._gauges)
+
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+    def get_counter(self, name: str, **labels) -> float:
+        """Read one counter series without snapshotting the registry."""
+        label_key = self._get_label_key(**labels)
+        self.flush()
+        lock = self._counter_locks.get(name)
+        if lock is None:
+            return 0.0
+        with lock:
+            return self._counters[name].get(label_key, 0.0)
+
+    def get_gauge(self, name: str, **labels) -> Optional[float]:
+        """Read one gauge series, or None if it was never set."""
+        label_key = self._get_label_key(**labels)
         with self._lock:
-            return {
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
-                "histograms": {
-                    k: {
-                        lk: {"count": len(lv), "sum": sum(lv), "values": lv[-10:]}
-                        for lk, lv in v.items()
-                    }
-                    for k, v in self._histograms.items()
-                },
-            }
+            series = self._gauges.get(name)
+            return series.get(label_key) if series is not None else None
+
+    def get_histogram(self, name: str, **labels) -> Optional[dict[str, Any]]:
+        """Summarize one histogram series, or None if nothing was observed."""
+        series = self._histograms.get(name)
+        hist = series.get(self._get_label_key(**labels)) if series else None
+        if hist is None:
+            return None
+        with hist.lock:
+            return hist.summary()
 
 
 # Global metrics registry instance
@@ -232,21 +547,18 @@ def get_metrics() -> MetricsRegistry:
     return _registry
 
 
-def inc(name: str, value: float = 1.0, **labels) -> None:
-    """Increment a counter metric."""
-    _registry.inc(name, value, **labels)
-
-
-def set_gauge(name: str, value: float, **labels) -> None:
-    """Set a gauge metric value."""
-    _registry.set_gauge(name, value, **labels)
-
-
-def observe(name: str, value: float, **labels) -> None:
-    """Observe a value for histogram-like metrics."""
-    _registry.observe(name, value, **labels)
+# Module-level helpers are the singleton's bound methods, so each emission
+# skips a wrapper frame and the global lookup of ``_registry``.
+inc = _registry.inc
+set_gauge = _registry.set_gauge
+observe = _registry.observe
 
 
 def render_as_text() -> str:
     """Render all metrics as text/plain format."""
     return _registry.render_as_text()
+
+
+def render_as_bytes() -> bytes:
+    """Render all metrics as UTF-8 text/plain, ready to write to a response."""
+    return _registry.render_as_bytes()
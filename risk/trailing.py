@@ -8,12 +8,49 @@ import logging
 import time
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from strategies.indicators import atr
 
 logger = logging.getLogger(__name__)
 
+# Struct-of-arrays layout for batch position screening
+POSITION_SOA_DTYPE = np.dtype(
+    [
+        ("ticket", np.int64),
+        ("type", np.int8),
+        ("price_open", np.float64),
+        ("price_current", np.float64),
+        ("sl", np.float64),
+        ("point", np.float64),
+    ]
+)
+
+
+def positions_to_soa(positions, points: dict[str, float]) -> np.recarray:
+    """
+    Pack MT5 position objects into a NumPy record array (one column per field).
+
+    Args:
+        positions: Sequence of MT5 position objects
+        points: Mapping of symbol to point size (missing symbols become NaN)
+
+    Returns:
+        Record array with POSITION_SOA_DTYPE fields; missing SL is NaN
+    """
+    soa = np.empty(len(positions), dtype=POSITION_SOA_DTYPE).view(np.recarray)
+    for i, position in enumerate(positions):
+        soa[i] = (
+            int(position.ticket),
+            position.type,
+            float(position.price_open),
+            float(position.price_current),
+            float(position.sl) if position.sl else np.nan,
+            points.get(position.symbol, np.nan),
+        )
+    return soa
+
 
 class TrailingStopManager:
     """
@@ -317,52 +354,86 @@ class TrailingStopManager:
             position_state = self._position_states.get(ticket, {})
             breakeven_applied = position_state.get("breakeven_applied", False)
 
-            action_taken = None
-
-            if not breakeven_applied:
-                # Try breakeven first
-                breakeven_sl = self.compute_breakeven_sl(
-                    position, breakeven_threshold, breakeven_buffer
-                )
-
-                if breakeven_sl is not None:
-                    if self.update_position_stops(ticket, sl=breakeven_sl):
-                        # Mark breakeven as applied
-                        self._position_states[ticket] = {
-                            **position_state,
-                            "breakeven_applied": True,
-                            "last_trailing_sl": breakeven_sl,
-                        }
-                        action_taken = "breakeven"
-
-            if not action_taken:
-                # Try trailing stop with enhanced parameters
-                trailing_sl = self.compute_trailing_sl(
-                    position=position,
-                    trailing_step_pips=trailing_step,
-                    trailing_buffer_pips=trailing_buffer,
-                    use_atr=use_atr_trailing,
+            # Walk the precomputed steps for this state; first success wins
+            for step in self._TRAILING_DISPATCH[bool(breakeven_applied)]:
+                action_taken = step(
+                    self,
+                    position,
+                    ticket,
+                    position_state,
+                    breakeven_threshold=breakeven_threshold,
+                    breakeven_buffer=breakeven_buffer,
+                    trailing_step=trailing_step,
+                    trailing_buffer=trailing_buffer,
+                    use_atr_trailing=use_atr_trailing,
                     atr_multiplier=atr_multiplier,
                     hysteresis_pips=hysteresis_pips,
                     recent_candles=recent_candles,
                 )
+                if action_taken:
+                    return action_taken
 
-                if trailing_sl is not None:
-                    if self.update_position_stops(ticket, sl=trailing_sl):
-                        # Update trailing state with the actual applied SL
-                        self._position_states[ticket] = {
-                            **position_state,
-                            "last_trailing_sl": trailing_sl,
-                            "last_update_time": time.time(),
-                        }
-                        action_taken = "trailing"
-
-            return action_taken
+            return None
 
         except Exception as e:
             logger.error(f"Error processing trailing for {symbol} ticket {ticket}: {e}")
             return None
 
+    def _apply_breakeven(
+        self, position, ticket: str, position_state: dict, **params
+    ) -> str | None:
+        """Move SL to breakeven if the threshold is reached. Returns "breakeven" on success."""
+        breakeven_sl = self.compute_breakeven_sl(
+            position, params["breakeven_threshold"], params["breakeven_buffer"]
+        )
+
+        if breakeven_sl is not None and self.update_position_stops(
+            ticket, sl=breakeven_sl
+        ):
+            # Mark breakeven as applied
+            self._position_states[ticket] = {
+                **position_state,
+                "breakeven_applied": True,
+                "last_trailing_sl": breakeven_sl,
+            }
+            return "breakeven"
+
+        return None
+
+    def _apply_trailing(
+        self, position, ticket: str, position_state: dict, **params
+    ) -> str | None:
+        """Trail the SL behind price if step/hysteresis allow. Returns "trailing" on success."""
+        trailing_sl = self.compute_trailing_sl(
+            position=position,
+            trailing_step_pips=params["trailing_step"],
+            trailing_buffer_pips=params["trailing_buffer"],
+            use_atr=params["use_atr_trailing"],
+            atr_multiplier=params["atr_multiplier"],
+            hysteresis_pips=params["hysteresis_pips"],
+            recent_candles=params["recent_candles"],
+        )
+
+        if trailing_sl is not None and self.update_position_stops(
+            ticket, sl=trailing_sl
+        ):
+            # Update trailing state with the actual applied SL
+            self._position_states[ticket] = {
+                **position_state,
+                "last_trailing_sl": trailing_sl,
+                "last_update_time": time.time(),
+            }
+            return "trailing"
+
+        return None
+
+    # Dispatch table: breakeven_applied -> ordered steps to attempt.
+    # Side (BUY/SELL) is resolved inside compute_breakeven_sl/compute_trailing_sl.
+    _TRAILING_DISPATCH = {
+        False: (_apply_breakeven, _apply_trailing),
+        True: (_apply_trailing,),
+    }
+
     def process_all_positions(self, **kwargs) -> dict[str, str]:
         """
         Process trailing logic for all open positions.
@@ -382,7 +453,18 @@ class TrailingStopManager:
 
             logger.debug(f"Processing trailing logic for {len(positions)} positions")
 
-            for position in positions:
+            # Screen all positions at once; only candidates go through the
+            # per-position state machine, which re-checks everything exactly
+            try:
+                candidates = self._trailing_candidates(positions, **kwargs)
+            except Exception as e:
+                # One malformed position must not stop trailing for the rest:
+                # process each position, which handles its own errors
+                logger.warning(f"Batch trailing screen failed, checking all: {e}")
+                candidates = np.ones(len(positions), dtype=bool)
+
+            for i in np.flatnonzero(candidates):
+                position = positions[i]
                 ticket = str(position.ticket)
                 action = self.process_position_trailing(position, **kwargs)
 
@@ -394,6 +476,59 @@ class TrailingStopManager:
 
         return actions
 
+    def _trailing_candidates(self, positions, **kwargs) -> np.ndarray:
+        """
+        Boolean mask of positions that may need a breakeven or trailing update.
+
+        Conservative: a False entry means process_position_trailing would
+        certainly take no action for that position with the same parameters.
+        """
+        points = {}
+        for symbol in {position.symbol for position in positions}:
+            symbol_info = self.mt5.symbol_info(symbol)
+            if symbol_info:
+                points[symbol] = float(symbol_info.point)
+
+        soa = positions_to_soa(positions, points)
+        is_buy = soa.type == 0
+        has_sl = ~np.isnan(soa.sl)
+
+        # Breakeven: not yet applied and profit threshold reached
+        breakeven_applied = np.array(
+            [
+                self._position_states.get(str(position.ticket), {}).get(
+                    "breakeven_applied", False
+                )
+                for position in positions
+            ],
+            dtype=bool,
+        )
+        profit_pips = (
+            np.where(
+                is_buy,
+                soa.price_current - soa.price_open,
+                soa.price_open - soa.price_current,
+            )
+            / soa.point
+        )
+        breakeven_due = ~breakeven_applied & (
+            profit_pips >= kwargs.get("breakeven_threshold", 10.0)
+        )
+
+        # Trailing: ATR buffers are only known per position, so keep them all
+        if kwargs.get("use_atr_trailing", False):
+            trailing_due = np.ones(len(soa), dtype=bool)
+        else:
+            buffer = kwargs.get("trailing_buffer", 10.0) * soa.point
+            trailing_due = ~has_sl | np.where(
+                is_buy,
+                soa.price_current - buffer > soa.sl,
+                soa.price_current + buffer < soa.sl,
+            )
+
+        # Unknown point size: let the per-position path handle and log it
+        return breakeven_due | trailing_due | np.isnan(soa.point)
+
     def cleanup_closed_positions(self) -> int:
         """
         Clean up tracking state for closed positions.
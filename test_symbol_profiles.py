@@ -11,14 +11,22 @@ import pytest
 from core.sizing.sizing import calc_lot_by_risk
 from core.symbols import SymbolProfileManager
 
+# Fixed session timestamps shared across tests
+MON_1000_UTC = datetime(2024, 1, 8, 10, 0, tzinfo=UTC)
+SAT_1000_UTC = datetime(2024, 1, 6, 10, 0, tzinfo=UTC)
+SUN_1000_UTC = datetime(2024, 1, 7, 10, 0, tzinfo=UTC)
+NEW_YEARS_2024_UTC = datetime(2024, 1, 1, 15, 0, tzinfo=UTC)
+US_OPEN_UTC = datetime(2024, 1, 8, 14, 30, tzinfo=UTC)  # 9:30 EST
+PRE_MARKET_UTC = datetime(2024, 1, 8, 6, 0, tzinfo=UTC)  # 1:00 EST
+
 
 class TestSymbolProfileManager:
     """Test symbol profile management and validation."""
 
     @pytest.fixture
-    def manager(self):
-        """Create symbol profile manager for testing."""
-        return SymbolProfileManager()
+    def manager(self, warm_profile_manager):
+        """Shared prewarmed symbol profile manager (tests only read it)."""
+        return warm_profile_manager
 
     def test_profile_loading(self, manager):
         """Test that symbol profiles load correctly."""
@@ -50,30 +58,26 @@ class TestSymbolProfileManager:
     def test_session_validation_forex(self, manager):
         """Test session validation for forex (24x5)."""
         # Monday 10:00 UTC - should be open for 24x5 forex session
-        monday_10 = datetime(2024, 1, 8, 10, 0, tzinfo=UTC)
-        can_trade, reason = manager.can_trade("EURUSD", monday_10)
+        can_trade, reason = manager.can_trade("EURUSD", MON_1000_UTC)
         assert can_trade
         assert "market is open" in reason.lower() or "ok" in reason.lower()
 
         # Saturday 10:00 UTC - should be closed for 24x5 forex session
-        saturday_10 = datetime(2024, 1, 6, 10, 0, tzinfo=UTC)
-        can_trade, reason = manager.can_trade("EURUSD", saturday_10)
+        can_trade, reason = manager.can_trade("EURUSD", SAT_1000_UTC)
         assert not can_trade
         assert "market is closed" in reason.lower() or "closed" in reason.lower()
 
     def test_session_validation_crypto(self, manager):
         """Test session validation for crypto (24x7)."""
         # Saturday 10:00 UTC - should be open for crypto
-        saturday_10 = datetime(2024, 1, 6, 10, 0, tzinfo=UTC)
-        can_trade, reason = manager.can_trade("BTCUSD", saturday_10)
+        can_trade, reason = manager.can_trade("BTCUSD", SAT_1000_UTC)
         assert can_trade
         assert "market is open" in reason
 
     def test_session_validation_with_holidays(self, manager):
         """Test session validation respects holidays."""
         # New Year's Day 2024 (Monday) - should be closed for US indices
-        new_years = datetime(2024, 1, 1, 15, 0, tzinfo=UTC)
-        can_trade, reason = manager.can_trade("US500", new_years)
+        can_trade, reason = manager.can_trade("US500", NEW_YEARS_2024_UTC)
         assert not can_trade
         assert "holiday" in reason.lower()
 
@@ -81,13 +85,11 @@ class TestSymbolProfileManager:
         """Test RTH (Regular Trading Hours) session validation."""
         # US500 should have RTH restrictions
         # 14:30 UTC = 9:30 EST (market open) - should be open
-        market_open = datetime(2024, 1, 8, 14, 30, tzinfo=UTC)
-        can_trade, reason = manager.can_trade("US500", market_open)
+        can_trade, reason = manager.can_trade("US500", US_OPEN_UTC)
         # Note: This depends on the exact RTH configuration and timezone handling
 
         # 06:00 UTC = 1:00 EST (pre-market) - should be closed for RTH
-        pre_market = datetime(2024, 1, 8, 6, 0, tzinfo=UTC)
-        can_trade, reason = manager.can_trade("US500", pre_market)
+        can_trade, reason = manager.can_trade("US500", PRE_MARKET_UTC)
         # RTH session should be closed at this time
 
     def test_invalid_symbol_session_check(self, manager):
@@ -112,9 +114,9 @@ class TestPositionSizingWithProfiles:
         return info
 
     @pytest.fixture
-    def manager(self):
-        """Create symbol profile manager for testing."""
-        return SymbolProfileManager()
+    def manager(self, warm_profile_manager):
+        """Shared prewarmed symbol profile manager (tests only read it)."""
+        return warm_profile_manager
 
     def test_calc_lot_by_risk_with_profile(self, mock_symbol_info, manager):
         """Test position sizing uses profile overrides."""
@@ -185,12 +187,10 @@ class TestSessionDefinitions:
         profile = manager.get_profile("EURUSD")
 
         # Monday should be open
-        monday = datetime(2024, 1, 8, 10, 0, tzinfo=UTC)
-        assert profile.session.is_open(monday)
+        assert profile.session.is_open(MON_1000_UTC)
 
         # Saturday should be closed
-        saturday = datetime(2024, 1, 6, 10, 0, tzinfo=UTC)
-        assert not profile.session.is_open(saturday)
+        assert not profile.session.is_open(SAT_1000_UTC)
 
     def test_24x7_session(self):
         """Test 24x7 session is always open."""
@@ -198,11 +198,9 @@ class TestSessionDefinitions:
         profile = manager.get_profile("BTCUSD")
 
         # Any day should be open
-        saturday = datetime(2024, 1, 6, 10, 0, tzinfo=UTC)
-        assert profile.session.is_open(saturday)
+        assert profile.session.is_open(SAT_1000_UTC)
 
-        sunday = datetime(2024, 1, 7, 10, 0, tzinfo=UTC)
-        assert profile.session.is_open(sunday)
+        assert profile.session.is_open(SUN_1000_UTC)
 
     def test_holiday_checking(self):
         """Test holiday checking works correctly."""
@@ -212,8 +210,9 @@ class TestSessionDefinitions:
         profile = manager.get_profile("US500")
         if profile and profile.holidays:
             # New Year's Day 2024
-            new_years = datetime(2024, 1, 1, 15, 0, tzinfo=UTC)
-            assert not profile.session.is_open(new_years, holidays=profile.holidays)
+            assert not profile.session.is_open(
+                NEW_YEARS_2024_UTC, holidays=profile.holidays
+            )
 
 
 @pytest.mark.integration
@@ -4,9 +4,16 @@ Tests breakeven logic, trailing stops, and position state management.
 """
 
 import time
+from collections import namedtuple
+from math import isclose
 from unittest.mock import MagicMock, Mock
 
-from risk.trailing import TrailingStopManager
+import numpy as np
+
+from risk.trailing import TrailingStopManager, positions_to_soa
+
+# Lightweight stand-in for the MT5 order_send result
+Result = namedtuple("Result", ["retcode", "comment"], defaults=[""])
 
 
 class MockPosition:
@@ -70,7 +77,7 @@ class TestTrailingStopManager:
         # Breakeven SL = entry + buffer = 1.10000 + (2 * 0.0001) = 1.10020
         expected_sl = 1.10020
         assert breakeven_sl is not None
-        assert abs(breakeven_sl - expected_sl) < 1e-9
+        assert isclose(breakeven_sl, expected_sl, abs_tol=1e-9)
 
         # Test no breakeven trigger (threshold 2 pips)
         breakeven_sl = manager.compute_breakeven_sl(position, 2.0, 2.0)
@@ -98,7 +105,7 @@ class TestTrailingStopManager:
         # Breakeven SL = entry - buffer = 1.10000 - (2 * 0.0001) = 1.09980
         expected_sl = 1.09980
         assert breakeven_sl is not None
-        assert abs(breakeven_sl - expected_sl) < 1e-9
+        assert isclose(breakeven_sl, expected_sl, abs_tol=1e-9)
 
     def test_trailing_stop_buy_position(self):
         """Test trailing stop calculation for BUY position"""
@@ -125,7 +132,7 @@ class TestTrailingStopManager:
         # Step = 1.10100 - 1.10050 = 0.0050 = 5 pips >= 5 pips step → OK
         expected_sl = 1.10100
         assert trailing_sl is not None
-        assert abs(trailing_sl - expected_sl) < 1e-9
+        assert isclose(trailing_sl, expected_sl, abs_tol=1e-9)
 
         # Test insufficient step (current price barely moved)
         position.price_current = 1.10130  # Only 3 pips more favorable
@@ -160,7 +167,7 @@ class TestTrailingStopManager:
         # Step = 1.09950 - 1.09900 = 0.0050 = 5 pips >= 5 pips step → OK
         expected_sl = 1.09900
         assert trailing_sl is not None
-        assert abs(trailing_sl - expected_sl) < 1e-9
+        assert isclose(trailing_sl, expected_sl, abs_tol=1e-9)
 
     def test_position_trailing_workflow(self):
         """Test complete position trailing workflow"""
@@ -171,9 +178,7 @@ class TestTrailingStopManager:
         mt5.TRADE_RETCODE_DONE = 10009
 
         # Mock successful order_send
-        result = Mock()
-        result.retcode = mt5.TRADE_RETCODE_DONE
-        mt5.order_send.return_value = result
+        mt5.order_send.return_value = Result(mt5.TRADE_RETCODE_DONE)
 
         manager = TrailingStopManager(mt5)
 
@@ -195,7 +200,8 @@ class TestTrailingStopManager:
         call_args = mt5.order_send.call_args[0][0]
         assert call_args["action"] == mt5.TRADE_ACTION_SLTP
         assert call_args["position"] == 12349
-        assert abs(call_args["sl"] - 1.10020) < 1e-9  # Breakeven with 2 pip buffer
+        # Breakeven with 2 pip buffer
+        assert isclose(call_args["sl"], 1.10020, abs_tol=1e-9)
 
         # Reset mock for next test
         mt5.order_send.reset_mock()
@@ -211,7 +217,8 @@ class TestTrailingStopManager:
         mt5.order_send.assert_called_once()
         call_args = mt5.order_send.call_args[0][0]
         assert call_args["position"] == 12349
-        assert abs(call_args["sl"] - 1.10150) < 1e-9  # Trail 10 pips behind 1.10250
+        # Trail 10 pips behind 1.10250
+        assert isclose(call_args["sl"], 1.10150, abs_tol=1e-9)
 
     def test_process_all_positions(self):
         """Test processing multiple positions"""
@@ -229,9 +236,7 @@ class TestTrailingStopManager:
         mt5.TRADE_ACTION_SLTP = 2
         mt5.TRADE_RETCODE_DONE = 10009
 
-        result = Mock()
-        result.retcode = mt5.TRADE_RETCODE_DONE
-        mt5.order_send.return_value = result
+        mt5.order_send.return_value = Result(mt5.TRADE_RETCODE_DONE)
 
         # Mock positions_get to return multiple positions
         positions = [
@@ -261,6 +266,46 @@ class TestTrailingStopManager:
         # Verify two order_send calls
         assert mt5.order_send.call_count == 2
 
+    def test_process_all_positions_skips_malformed_position(self):
+        """Test one malformed position does not stop trailing for the others"""
+        mt5 = Mock()
+        mt5.symbol_info.return_value = MockSymbolInfo(point=0.0001)
+        mt5.TRADE_ACTION_SLTP = 2
+        mt5.TRADE_RETCODE_DONE = 10009
+        mt5.order_send.return_value = Result(mt5.TRADE_RETCODE_DONE)
+
+        bad = MockPosition(222, "GBPUSD", 1, 1.30000, 1.29850)
+        bad.price_open = None  # Cannot be packed into the SoA
+        mt5.positions_get.return_value = [
+            MockPosition(111, "EURUSD", 0, 1.10000, 1.10120),
+            bad,
+            MockPosition(333, "EURUSD", 1, 1.10000, 1.09850),
+        ]
+
+        manager = TrailingStopManager(mt5)
+
+        actions = manager.process_all_positions(breakeven_threshold=10.0)
+
+        assert actions == {"111": "breakeven", "333": "breakeven"}
+        assert mt5.order_send.call_count == 2
+
+    def test_positions_to_soa(self):
+        """Test packing positions into a struct-of-arrays record array"""
+        positions = [
+            MockPosition(111, "EURUSD", 0, 1.10000, 1.10120),
+            MockPosition(333, "USDJPY", 1, 110.00, 109.50, sl=110.20),
+            MockPosition(444, "XAUUSD", 0, 2000.0, 2001.0),
+        ]
+
+        soa = positions_to_soa(positions, {"EURUSD": 0.0001, "USDJPY": 0.01})
+
+        assert list(soa.ticket) == [111, 333, 444]
+        assert list(soa.type) == [0, 1, 0]
+        assert np.isnan(soa.sl[0])  # No SL
+        assert isclose(soa.sl[1], 110.20, abs_tol=1e-9)
+        assert isclose(soa.point[1], 0.01, abs_tol=1e-12)
+        assert np.isnan(soa.point[2])  # Unknown symbol
+
     def test_cleanup_closed_positions(self):
         """Test cleanup of closed position states"""
         mt5 = Mock()
@@ -315,10 +360,7 @@ class TestTrailingStopManager:
         mt5.TRADE_RETCODE_DONE = 10009
 
         # Mock failed order_send
-        result = Mock()
-        result.retcode = 10004  # TRADE_RETCODE_REQUOTE
-        result.comment = "Requote"
-        mt5.order_send.return_value = result
+        mt5.order_send.return_value = Result(10004, "Requote")  # TRADE_RETCODE_REQUOTE
 
         manager = TrailingStopManager(mt5)
 
@@ -355,6 +397,12 @@ if __name__ == "__main__":
         test.test_process_all_positions()
         print("✅ Process all positions test passed")
 
+        test.test_process_all_positions_skips_malformed_position()
+        print("✅ Malformed position fallback test passed")
+
+        test.test_positions_to_soa()
+        print("✅ Positions SoA packing test passed")
+
         test.test_cleanup_closed_positions()
         print("✅ Cleanup closed positions test passed")
 
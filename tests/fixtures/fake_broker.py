@@ -5,16 +5,154 @@ This module provides a complete fake broker that implements the same interface
 as the real MT5 broker but works entirely in memory without external dependencies.
 """
 
+import itertools
 import time
-import uuid
-from datetime import UTC, datetime, timezone
-from typing import Any, Optional
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, NamedTuple, Optional
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from core.events.bus import EventBus
 from core.events.types import Filled, OrderPlaced, Rejected
 
 
+def _to_lots(volume: float) -> int | None:
+    """
+    Convert a volume to integer hundredths of a lot (the 0.01 volume step)
+
+    Returns None when the volume is not a whole number of steps.
+    """
+    lots = round(volume * 100)
+    if abs(volume * 100 - lots) > 1e-6:
+        return None
+    return lots
+
+
+def _from_lots(lots: int) -> float:
+    """Convert integer hundredths of a lot back to a volume"""
+    return lots / 100
+
+
+class Quote(NamedTuple):
+    """Static bid/ask quote for a fake market_data symbol"""
+
+    bid: float
+    ask: float
+    point: float
+
+
+class _DealsBuffer:
+    """
+    Append-only deal log stored in a structured NumPy array.
+
+    Capacity doubles when full. Symbols and sides are stored as small ids
+    into per-buffer string tables; to_dicts() rebuilds the deal dicts.
+    """
+
+    __slots__ = ("_rows", "_size", "_labels", "_label_ids")
+
+    DTYPE = np.dtype(
+        [
+            ("deal_id", "u4"),
+            ("order_id", "u4"),
+            ("ts_us", "i8"),  # Microseconds since the Unix epoch (UTC)
+            ("volume", "f8"),
+            ("price", "f8"),
+            ("commission", "f8"),
+            ("profit", "f8"),
+            ("symbol", "u2"),
+            ("side", "u2"),
+        ]
+    )
+    _EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+    _MICROSECOND = timedelta(microseconds=1)
+
+    def __init__(self, capacity: int = 64):
+        self._rows = np.empty(capacity, dtype=self.DTYPE)
+        self._size = 0
+        self._labels: list[str] = []
+        self._label_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _label_id(self, label: str) -> int:
+        label_id = self._label_ids.get(label)
+        if label_id is None:
+            label_id = self._label_ids[label] = len(self._labels)
+            self._labels.append(label)
+        return label_id
+
+    def append(
+        self,
+        deal_id: str,
+        order_id: str,
+        symbol: str,
+        side: str,
+        volume: float,
+        price: float,
+        timestamp: datetime,
+        commission: float,
+        profit: float = 0.0,
+    ) -> None:
+        """Record one deal; IDs are the connection's 8-digit hex strings"""
+        if self._size == len(self._rows):
+            grown = np.empty(2 * len(self._rows), dtype=self.DTYPE)
+            grown[: self._size] = self._rows
+            self._rows = grown
+
+        self._rows[self._size] = (
+            int(deal_id, 16),
+            int(order_id, 16),
+            (timestamp - self._EPOCH) // self._MICROSECOND,
+            volume,
+            price,
+            commission,
+            profit,
+            self._label_id(symbol),
+            self._label_id(side),
+        )
+        self._size += 1
+
+    @property
+    def rows(self) -> np.ndarray:
+        """View of the recorded deals (no copy)"""
+        return self._rows[: self._size]
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize the deals as the dicts _execute_fill used to store"""
+        labels = self._labels
+        epoch = self._EPOCH
+        return [
+            {
+                "deal_id": format(deal_id, "08x"),
+                "order_id": format(order_id, "08x"),
+                "symbol": labels[symbol],
+                "side": labels[side],
+                "volume": volume,
+                "price": price,
+                "timestamp": epoch + timedelta(microseconds=ts_us),
+                "commission": commission,
+                "profit": profit,
+            }
+            for (
+                deal_id,
+                order_id,
+                ts_us,
+                volume,
+                price,
+                commission,
+                profit,
+                symbol,
+                side,
+            ) in self.rows.tolist()
+        ]
+
+
 class FakeBrokerConnection:
     """
     Fake broker connection that simulates MT5 broker behavior.
@@ -25,25 +163,71 @@ class FakeBrokerConnection:
     - Position sizing simulation
     - Market data simulation
     - No external dependencies
+
+    With pool_enabled=True, result dicts handed back through
+    release_result/pooled_result are recycled by later submit_order calls.
     """
 
-    def __init__(self, event_bus: EventBus | None = None):
-        self.event_bus = event_bus or EventBus()
+    __slots__ = (
+        "event_bus",
+        "pool_enabled",
+        "_result_pool",
+        "_id_counter",
+        "connected",
+        "orders",
+        "_orders_by_client_id",
+        "_pending_orders",
+        "positions",
+        "_position_lots",
+        "deals",
+        "account_balance",
+        "account_equity",
+        "account_margin",
+        "market_data",
+        "_symbol_info_cache",
+    )
+
+    # Upper bound on recycled result dicts kept around
+    _RESULT_POOL_MAX = 128
+
+    # Account fields that never change; get_account_info adds the balances
+    _ACCOUNT_STATIC = MappingProxyType(
+        {
+            "login": 12345678,
+            "leverage": 100,
+            "currency": "USD",
+            "trade_allowed": True,
+            "server": "FakeBroker-Demo",
+        }
+    )
+
+    def __init__(self, event_bus: EventBus | None = None, pool_enabled: bool = False):
+        self.event_bus = event_bus if event_bus is not None else EventBus()
+        self.pool_enabled = pool_enabled
+        self._result_pool: list[dict] = []
+        self._id_counter = itertools.count(1)
         self.connected = True
         self.orders: dict[str, dict] = {}
+        self._orders_by_client_id: dict[str, str] = {}
+        self._pending_orders: dict[str, dict] = {}
         self.positions: dict[str, dict] = {}
-        self.deals: list[dict] = []
+        # Net volume per symbol in integer hundredths of a lot, so repeated
+        # fills sum exactly; positions[...]["volume"] is derived from it
+        self._position_lots: dict[str, int] = {}
+        self.deals = _DealsBuffer()
         self.account_balance = 10000.0
         self.account_equity = 10000.0
         self.account_margin = 0.0
 
         # Fake market data
-        self.market_data = {
-            "EURUSD": {"bid": 1.0950, "ask": 1.0952, "point": 0.00001},
-            "GBPUSD": {"bid": 1.2650, "ask": 1.2653, "point": 0.00001},
-            "USDJPY": {"bid": 149.50, "ask": 149.53, "point": 0.01},
-            "USDCHF": {"bid": 0.8750, "ask": 0.8753, "point": 0.00001},
+        self.market_data: dict[str, Quote] = {
+            "EURUSD": Quote(bid=1.0950, ask=1.0952, point=0.00001),
+            "GBPUSD": Quote(bid=1.2650, ask=1.2653, point=0.00001),
+            "USDJPY": Quote(bid=149.50, ask=149.53, point=0.01),
+            "USDCHF": Quote(bid=0.8750, ask=0.8753, point=0.00001),
         }
+        # symbol -> (quote it was built from, symbol info)
+        self._symbol_info_cache: dict[str, tuple[Quote, dict[str, Any]]] = {}
 
     def is_connected(self) -> bool:
         """Check if broker is connected"""
@@ -60,46 +244,93 @@ class FakeBrokerConnection:
 
     def get_account_info(self) -> dict[str, Any]:
         """Get fake account information"""
+        equity = self.account_equity
+        margin = self.account_margin
         return {
-            "login": 12345678,
+            **self._ACCOUNT_STATIC,
             "balance": self.account_balance,
-            "equity": self.account_equity,
-            "margin": self.account_margin,
-            "margin_free": self.account_equity - self.account_margin,
-            "margin_level": (
-                (self.account_equity / self.account_margin * 100)
-                if self.account_margin > 0
-                else 0.0
-            ),
-            "leverage": 100,
-            "currency": "USD",
-            "trade_allowed": True,
-            "server": "FakeBroker-Demo",
+            "equity": equity,
+            "margin": margin,
+            "margin_free": equity - margin,
+            "margin_level": (equity / margin * 100) if margin > 0 else 0.0,
         }
 
-    def get_symbol_info(self, symbol: str) -> dict[str, Any] | None:
-        """Get fake symbol information"""
-        if symbol not in self.market_data:
-            return None
-
-        data = self.market_data[symbol]
+    @staticmethod
+    def _build_symbol_info(symbol: str, data: Quote) -> dict[str, Any]:
+        """Build the symbol information dict from a market_data entry"""
         return {
             "name": symbol,
-            "digits": 5 if data["point"] == 0.00001 else 3,
-            "point": data["point"],
+            "digits": 5 if data.point == 0.00001 else 3,
+            "point": data.point,
             "trade_stops_level": 10,
             "trade_mode": 4,  # Full trading
             "volume_min": 0.01,
             "volume_max": 500.0,
             "volume_step": 0.01,
             "contract_size": 100000,
-            "bid": data["bid"],
-            "ask": data["ask"],
-            "spread": int((data["ask"] - data["bid"]) / data["point"]),
+            "bid": data.bid,
+            "ask": data.ask,
+            "spread": int((data.ask - data.bid) / data.point),
             "visible": True,
             "select": True,
         }
 
+    def _symbol_info(self, symbol: str) -> dict[str, Any] | None:
+        """
+        Cached symbol information; internal callers must not modify it.
+
+        Built once per quote: Quote is immutable, so replacing a market_data
+        entry is detected by identity and the info is rebuilt.
+        """
+        data = self.market_data.get(symbol)
+        if data is None:
+            return None
+        cached = self._symbol_info_cache.get(symbol)
+        if cached is None or cached[0] is not data:
+            cached = self._symbol_info_cache[symbol] = (
+                data,
+                self._build_symbol_info(symbol, data),
+            )
+        return cached[1]
+
+    def get_symbol_info(self, symbol: str) -> dict[str, Any] | None:
+        """Get fake symbol information (a copy the caller may modify)"""
+        info = self._symbol_info(symbol)
+        return None if info is None else dict(info)
+
+    def _next_id(self) -> str:
+        """Return an 8-character order/deal ID unique within this connection"""
+        return format(next(self._id_counter), "08x")
+
+    def _borrow_result(self, **fields: Any) -> dict[str, Any]:
+        """Return a result dict holding fields, recycled from the pool if possible"""
+        pool = self._result_pool
+        if not pool:
+            return fields
+        result = pool.pop()
+        result.update(fields)
+        return result
+
+    def release_result(self, result: dict[str, Any]) -> None:
+        """Hand a consumed submit_order result back for reuse"""
+        if self.pool_enabled and len(self._result_pool) < self._RESULT_POOL_MAX:
+            result.clear()
+            self._result_pool.append(result)
+
+    @contextmanager
+    def pooled_result(self, result: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Scope a submit_order result, releasing it on exit.
+
+        Usage:
+            with broker.pooled_result(broker.submit_order(...)) as result:
+                assert result["success"]
+        """
+        try:
+            yield result
+        finally:
+            self.release_result(result)
+
     def submit_order(
         self,
         symbol: str,
@@ -127,80 +358,87 @@ class FakeBrokerConnection:
         Returns:
             Dict with order result
         """
+        now = datetime.now(UTC)
         if not self.connected:
-            result = {
-                "success": False,
-                "error": "Not connected",
-                "retcode": 10031,  # Connection error
-                "client_order_id": client_order_id,
-            }
+            result = self._borrow_result(
+                success=False,
+                error="Not connected",
+                retcode=10031,  # Connection error
+                client_order_id=client_order_id,
+            )
 
-            if client_order_id and self.event_bus:
-                self.event_bus.publish(
+            bus = self.event_bus
+            if client_order_id and bus is not None and bus.has_subscribers(Rejected):
+                bus.publish(
                     Rejected(
                         client_order_id=client_order_id,
                         symbol=symbol,
                         reason="Connection error",
-                        timestamp=datetime.now(UTC),
+                        timestamp=now,
                     )
                 )
             return result
 
         # Generate order ID
-        order_id = str(uuid.uuid4())[:8]
+        order_id = self._next_id()
         if client_order_id is None:
             client_order_id = f"fake_{order_id}"
 
         # Check for duplicate client_order_id (idempotency)
-        for existing_order in self.orders.values():
-            if existing_order.get("client_order_id") == client_order_id:
-                # Return existing order result
-                return {
-                    "success": True,
-                    "order_id": existing_order["order_id"],
-                    "client_order_id": client_order_id,
-                    "retcode": 10009,  # Done
-                    "price": existing_order["price"],
-                    "volume": existing_order["volume"],
-                }
+        existing_id = self._orders_by_client_id.get(client_order_id)
+        if existing_id is not None:
+            # Return existing order result
+            existing_order = self.orders[existing_id]
+            return self._borrow_result(
+                success=True,
+                order_id=existing_order["order_id"],
+                client_order_id=client_order_id,
+                retcode=10009,  # Done
+                price=existing_order["price"],
+                volume=existing_order["volume"],
+            )
 
         # Validate symbol
-        symbol_info = self.get_symbol_info(symbol)
+        symbol_info = self._symbol_info(symbol)
         if not symbol_info:
-            result = {
-                "success": False,
-                "error": f"Unknown symbol: {symbol}",
-                "retcode": 10013,  # Invalid
-                "client_order_id": client_order_id,
-            }
+            result = self._borrow_result(
+                success=False,
+                error=f"Unknown symbol: {symbol}",
+                retcode=10013,  # Invalid
+                client_order_id=client_order_id,
+            )
 
-            if self.event_bus:
-                self.event_bus.publish(
+            bus = self.event_bus
+            if bus is not None and bus.has_subscribers(Rejected):
+                bus.publish(
                     Rejected(
                         client_order_id=client_order_id,
                         symbol=symbol,
                         reason=f"Unknown symbol: {symbol}",
-                        timestamp=datetime.now(UTC),
+                        timestamp=now,
                     )
                 )
             return result
 
         # Validate volume
-        if volume < symbol_info["volume_min"] or volume > symbol_info["volume_max"]:
-            result = {
-                "success": False,
-                "error": f"Invalid volume: {volume}",
-                "retcode": 10014,  # Invalid volume
-                "client_order_id": client_order_id,
-            }
+        vmin = symbol_info["volume_min"]
+        vmax = symbol_info["volume_max"]
+        if volume < vmin or volume > vmax or _to_lots(volume) is None:
+            result = self._borrow_result(
+                success=False,
+                error=f"Invalid volume: {volume}",
+                retcode=10014,  # Invalid volume
+                client_order_id=client_order_id,
+            )
 
-            if self.event_bus:
-                self.event_bus.publish(
+            bus = self.event_bus
+            if bus is not None and bus.has_subscribers(Rejected):
+                bus.publish(
                     Rejected(
                         client_order_id=client_order_id,
                         symbol=symbol,
                         reason=f"Invalid volume: {volume}",
-                        timestamp=datetime.now(UTC),
+                        timestamp=now,
                     )
                 )
             return result
@@ -208,12 +446,10 @@ class FakeBrokerConnection:
         # Determine execution price
         market_data = self.market_data[symbol]
         if order_type == "market":
-            execution_price = (
-                market_data["ask"] if side == "buy" else market_data["bid"]
-            )
+            execution_price = market_data.ask if side == "buy" else market_data.bid
         else:
             execution_price = price or (
-                market_data["ask"] if side == "buy" else market_data["bid"]
+                market_data.ask if side == "buy" else market_data.bid
             )
 
         # Create order record
@@ -228,16 +464,22 @@ class FakeBrokerConnection:
             "stop_loss": stop_loss,
             "take_profit": take_profit,
             "status": "filled" if order_type == "market" else "pending",
-            "timestamp": datetime.now(UTC),
+            "timestamp": now,
             "filled_volume": volume if order_type == "market" else 0.0,
         }
 
         self.orders[order_id] = order_record
-
-        # Publish events
-        if self.event_bus:
-            # Submit event
-            self.event_bus.publish(
+        self._orders_by_client_id[client_order_id] = order_id
+        if order_type != "market":
+            self._pending_orders[order_id] = order_record
+
+        # Publish events (OrderPlaced and, for market orders, Filled in one batch).
+        # EventBus defines __len__, so a bus without subscribers is falsy:
+        # compare against None, and fill market orders regardless of the bus
+        bus = self.event_bus
+        events: list[Any] = []
+        if bus is not None and bus.has_subscribers(OrderPlaced):
+            events.append(
                 OrderPlaced(
                     client_order_id=client_order_id,
                     symbol=symbol,
@@ -249,115 +491,127 @@ class FakeBrokerConnection:
                 )
             )
 
-            # For market orders, immediately fill
-            if order_type == "market":
-                self._execute_fill(order_record)
+        # For market orders, immediately fill
+        if order_type == "market":
+            self._execute_fill(order_record, events)
 
-        return {
-            "success": True,
-            "order_id": order_id,
-            "client_order_id": client_order_id,
-            "retcode": 10009,  # Done
-            "price": execution_price,
-            "volume": volume,
-        }
+        if events:
+            bus.publish_many(events)
 
-    def _execute_fill(self, order_record: dict) -> None:
-        """Execute order fill and update positions"""
+        return self._borrow_result(
+            success=True,
+            order_id=order_id,
+            client_order_id=client_order_id,
+            retcode=10009,  # Done
+            price=execution_price,
+            volume=volume,
+        )
+
+    def _execute_fill(self, order_record: dict, events: list | None = None) -> None:
+        """
+        Execute order fill and update positions.
+
+        The Filled event is appended to events when given (for the caller to
+        publish in a batch), otherwise it is published directly.
+        """
+        self._pending_orders.pop(order_record["order_id"], None)
         symbol = order_record["symbol"]
         side = order_record["side"]
         volume = order_record["volume"]
         price = order_record["price"]
+        # Volume was checked against the step in submit_order
+        lots = _to_lots(volume)
 
         # Update positions
         position_key = symbol
-        if position_key not in self.positions:
-            self.positions[position_key] = {
+        position = self.positions.get(position_key)
+        if position is None:
+            position = self.positions[position_key] = {
                 "symbol": symbol,
                 "volume": 0.0,
                 "avg_price": 0.0,
                 "unrealized_pnl": 0.0,
             }
 
-        position = self.positions[position_key]
+        pv = self._position_lots.get(position_key, 0)
+        pap = position["avg_price"]
 
         # Calculate new position
         if side == "buy":
-            new_volume = position["volume"] + volume
+            new_volume = pv + lots
         else:
-            new_volume = position["volume"] - volume
+            new_volume = pv - lots
 
         if new_volume != 0:
             # Update average price
-            if (position["volume"] > 0 and side == "buy") or (
-                position["volume"] < 0 and side == "sell"
-            ):
+            if (pv > 0 and side == "buy") or (pv < 0 and side == "sell"):
                 # Adding to position
-                total_cost = (position["volume"] * position["avg_price"]) + (
-                    volume * price
-                )
-                position["avg_price"] = (
-                    total_cost / new_volume if new_volume != 0 else price
-                )
+                total_cost = (pv * pap) + (lots * price)
+                position["avg_price"] = total_cost / new_volume
             else:
                 # Opposite direction - use new price
                 position["avg_price"] = price
 
-        position["volume"] = new_volume
+        position["volume"] = _from_lots(new_volume)
+        self._position_lots[position_key] = new_volume
 
         # Remove position if volume is zero
-        if abs(new_volume) < 0.001:
+        if new_volume == 0:
             del self.positions[position_key]
+            del self._position_lots[position_key]
 
-        # Create deal record
-        deal_record = {
-            "deal_id": str(uuid.uuid4())[:8],
-            "order_id": order_record["order_id"],
-            "symbol": symbol,
-            "side": side,
-            "volume": volume,
-            "price": price,
-            "timestamp": order_record["timestamp"],
-            "commission": volume * 0.01,  # Fake commission
-            "profit": 0.0,  # Will be calculated later
-        }
-
-        self.deals.append(deal_record)
+        # Record deal
+        self.deals.append(
+            deal_id=self._next_id(),
+            order_id=order_record["order_id"],
+            symbol=symbol,
+            side=side,
+            volume=volume,
+            price=price,
+            timestamp=order_record["timestamp"],
+            commission=volume * 0.01,  # Fake commission
+            profit=0.0,  # Will be calculated later
+        )
 
         # Publish fill event
-        if self.event_bus:
-            self.event_bus.publish(
-                Filled(
-                    client_order_id=order_record["client_order_id"],
-                    broker_order_id=order_record["order_id"],
-                    price=price,
-                    qty=volume,
-                    timestamp=order_record["timestamp"],
-                )
+        bus = self.event_bus
+        if bus is not None and bus.has_subscribers(Filled):
+            filled = Filled(
+                client_order_id=order_record["client_order_id"],
+                broker_order_id=order_record["order_id"],
+                price=price,
+                qty=volume,
+                timestamp=order_record["timestamp"],
             )
+            if events is None:
+                bus.publish(filled)
+            else:
+                events.append(filled)
 
     def get_positions(self) -> list[dict[str, Any]]:
         """Get current positions"""
         positions = []
+        market_data = self.market_data
+        now = datetime.now(UTC)
         for pos in self.positions.values():
             # Calculate unrealized P&L
             symbol = pos["symbol"]
-            if symbol in self.market_data:
-                market_data = self.market_data[symbol]
-                current_price = (
-                    market_data["bid"] if pos["volume"] > 0 else market_data["ask"]
-                )
-                price_diff = current_price - pos["avg_price"]
-                unrealized_pnl = pos["volume"] * price_diff * 100000  # Contract size
+            md = market_data.get(symbol)
+            if md is not None:
+                vol = pos["volume"]
+                avg_price = pos["avg_price"]
+                current_price = md.bid if vol > 0 else md.ask
+                price_diff = current_price - avg_price
+                unrealized_pnl = vol * price_diff * 100000  # Contract size
 
                 positions.append(
                     {
                         "symbol": symbol,
-                        "volume": pos["volume"],
-                        "price_open": pos["avg_price"],
+                        "volume": vol,
+                        "price_open": avg_price,
                         "price_current": current_price,
                         "profit": unrealized_pnl,
-                        "timestamp": datetime.now(UTC),
+                        "timestamp": now,
                     }
                 )
 
@@ -365,7 +619,7 @@ class FakeBrokerConnection:
 
     def get_orders(self) -> list[dict[str, Any]]:
         """Get pending orders"""
-        return [order for order in self.orders.values() if order["status"] == "pending"]
+        return list(self._pending_orders.values())
 
     def cancel_order(self, order_id: str) -> dict[str, Any]:
         """Cancel a pending order"""
@@ -385,6 +639,7 @@ class FakeBrokerConnection:
             }
 
         order["status"] = "cancelled"
+        self._pending_orders.pop(order_id, None)
 
         return {"success": True, "order_id": order_id, "retcode": 10009}
 
@@ -392,35 +647,36 @@ class FakeBrokerConnection:
         self, symbol: str, timeframe: str = "M1", count: int = 100
     ) -> list[dict[str, Any]]:
         """Get fake historical data"""
-        if symbol not in self.market_data:
+        market_data = self.market_data.get(symbol)
+        if market_data is None:
             return []
 
-        market_data = self.market_data[symbol]
-        base_price = (market_data["bid"] + market_data["ask"]) / 2
+        base_price = (market_data.bid + market_data.ask) / 2
 
-        # Generate fake OHLC data
-        rates = []
+        # Generate fake OHLC data (simple deterministic walk)
         current_time = int(time.time())
-
-        for i in range(count):
-            # Simple random walk
-            variation = (i % 20 - 10) * 0.0001
-            open_price = base_price + variation
-            close_price = open_price + ((i % 7 - 3) * 0.0001)
-            high_price = max(open_price, close_price) + (i % 3) * 0.0001
-            low_price = min(open_price, close_price) - (i % 3) * 0.0001
-
-            rates.append(
-                {
-                    "time": current_time - (count - i) * 60,  # 1 minute intervals
-                    "open": round(open_price, 5),
-                    "high": round(high_price, 5),
-                    "low": round(low_price, 5),
-                    "close": round(close_price, 5),
-                    "tick_volume": 100 + (i % 50),
-                    "real_volume": 0,
-                }
+        i = np.arange(count)
+        step = i % 3 * 0.0001
+        open_p = base_price + (i % 20 - 10) * 0.0001
+        close_p = open_p + (i % 7 - 3) * 0.0001
+        high_p = np.maximum(open_p, close_p) + step
+        low_p = np.minimum(open_p, close_p) - step
+        times = current_time - (count - i) * 60  # 1 minute intervals
+        tick_volume = 100 + i % 50
+
+        keys = ("time", "open", "high", "low", "close", "tick_volume", "real_volume")
+        rates = [
+            dict(zip(keys, row))
+            for row in zip(
+                times.tolist(),
+                np.round(open_p, 5).tolist(),
+                np.round(high_p, 5).tolist(),
+                np.round(low_p, 5).tolist(),
+                np.round(close_p, 5).tolist(),
+                tick_volume.tolist(),
+                itertools.repeat(0),
             )
+        ]
 
         return rates
 
@@ -432,9 +688,11 @@ class FakeBrokerAdapter:
     This can be used as a drop-in replacement for MT5Broker in unit tests.
     """
 
+    __slots__ = ("settings", "event_bus", "connection", "_connected")
+
     def __init__(self, settings: Any = None, event_bus: EventBus | None = None):
         self.settings = settings or MagicMock()
-        self.event_bus = event_bus or EventBus()
+        self.event_bus = event_bus if event_bus is not None else EventBus()
         self.connection = FakeBrokerConnection(self.event_bus)
         self._connected = False
 
@@ -0,0 +1,32 @@
+"""
+Lightweight event handler doubles for EventBus tests.
+
+Mock() builds call-tracking machinery the bus tests never use; these
+handlers only record the events they receive.
+"""
+
+from typing import Any
+
+
+class RecordingHandler:
+    """Callable that records every event it is called with"""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[Any] = []
+
+    def __call__(self, event: Any) -> None:
+        self.calls.append(event)
+
+    def assert_called_once_with(self, event: Any) -> None:
+        """Assert the handler received exactly one call, with this event"""
+        assert self.calls == [event], f"Expected one call with {event!r}: {self.calls}"
+
+    def assert_not_called(self) -> None:
+        """Assert the handler was never called"""
+        assert not self.calls, f"Expected no calls: {self.calls}"
+
+    def reset_mock(self) -> None:
+        """Forget recorded calls (named to match Mock)"""
+        self.calls.clear()
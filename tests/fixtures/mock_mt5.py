@@ -0,0 +1,621 @@
+"""
+In-process MetaTrader5 stand-in for unit testing without MT5.
+
+tests/conftest.py registers a MockMT5 instance as the MetaTrader5 module
+when the real package is not installed.
+"""
+
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+
+import numpy as np
+
+# Symbols reported by MockMT5.symbols_get
+SYMBOLS_GET_SYMBOLS = ("EURUSD", "GBPUSD", "USDJPY", "USDCHF")
+
+# Bar layout returned by MetaTrader5.copy_rates_* functions
+RATE_DTYPE = np.dtype(
+    [
+        ("time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("tick_volume", "<i8"),
+        ("spread", "<i4"),
+        ("real_volume", "<i8"),
+    ]
+)
+
+
+class TradeRetcode(IntEnum):
+    """MT5 trade server return codes"""
+
+    REQUOTE = 10004
+    REJECT = 10006
+    CANCEL = 10007
+    PLACED = 10008
+    DONE = 10009
+    TIMEOUT = 10012
+    INVALID = 10013
+    INVALID_VOLUME = 10014
+    INVALID_PRICE = 10015
+    INVALID_STOPS = 10016
+    TRADE_DISABLED = 10017
+    MARKET_CLOSED = 10018
+    NO_MONEY = 10019
+    PRICE_CHANGED = 10020
+    PRICE_OFF = 10021
+    INVALID_EXPIRATION = 10022
+    ORDER_CHANGED = 10023
+    TOO_MANY_REQUESTS = 10024
+    NO_CHANGES = 10025
+    SERVER_DISABLES_AT = 10026
+    CLIENT_DISABLES_AT = 10027
+    LOCKED = 10028
+    FROZEN = 10029
+    INVALID_FILL = 10030
+    CONNECTION = 10031
+    ONLY_REAL = 10032
+    LIMIT_ORDERS = 10033
+    LIMIT_VOLUME = 10034
+    INVALID_ORDER = 10035
+    POSITION_CLOSED = 10036
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolInfo:
+    """Plain-data stand-in for the MT5 symbol_info record"""
+
+    custom: bool
+    chart_mode: int
+    select: bool
+    visible: bool
+    session_deals: int
+    session_buy_orders: int
+    session_sell_orders: int
+    volume: int
+    volumehigh: int
+    volumelow: int
+    time: int
+    digits: int
+    spread: int
+    spread_float: bool
+    trade_calc_mode: int
+    trade_mode: int
+    start_time: int
+    expiration_time: int
+    trade_stops_level: int
+    trade_freeze_level: int
+    trade_exemode: int
+    swap_mode: int
+    swap_rollover3days: int
+    margin_hedged_use_leg: bool
+    expiration_mode: int
+    filling_mode: int
+    order_mode: int
+    order_gtc_mode: int
+    option_mode: int
+    option_right: int
+    bid: float
+    bidhigh: float
+    bidlow: float
+    ask: float
+    askhigh: float
+    asklow: float
+    last: float
+    lasthigh: float
+    lastlow: float
+    volume_real: float
+    volumehigh_real: float
+    volumelow_real: float
+    option_strike: float
+    point: float
+    trade_tick_value: float
+    trade_tick_value_profit: float
+    trade_tick_value_loss: float
+    trade_tick_size: float
+    trade_contract_size: int
+    trade_accrued_interest: float
+    trade_face_value: float
+    trade_liquidity_rate: float
+    volume_min: float
+    volume_max: float
+    volume_step: float
+    volume_limit: float
+    swap_long: float
+    swap_short: float
+    margin_initial: float
+    margin_maintenance: float
+    session_volume: int
+    session_turnover: float
+    session_interest: float
+    session_buy_orders_volume: float
+    session_sell_orders_volume: float
+    session_open: float
+    session_close: float
+    session_aw: float
+    session_price_settlement: float
+    session_price_limit_min: float
+    session_price_limit_max: float
+    margin_hedged: float
+    price_change: float
+    price_volatility: float
+    price_theoretical: float
+    price_greeks_delta: float
+    price_greeks_theta: float
+    price_greeks_gamma: float
+    price_greeks_vega: float
+    price_greeks_rho: float
+    price_greeks_omega: float
+    price_sensitivity: float
+    basis: str
+    category: str
+    currency_base: str
+    currency_profit: str
+    currency_margin: str
+    bank: str
+    description: str
+    exchange: str
+    formula: str
+    isin: str
+    name: str
+    page: str
+    path: str
+
+
+class MockMT5:
+    """
+    Comprehensive MT5 mock for unit testing without actual MT5 dependency.
+
+    Provides all necessary constants and methods to test MT5-related code
+    without requiring the actual MetaTrader5 package.
+    """
+
+    # Trading constants
+    TRADE_ACTION_DEAL = 1
+    TRADE_ACTION_PENDING = 5
+
+    # Order types
+    ORDER_TYPE_BUY = 0
+    ORDER_TYPE_SELL = 1
+    ORDER_TYPE_BUY_LIMIT = 2
+    ORDER_TYPE_SELL_LIMIT = 3
+    ORDER_TYPE_BUY_STOP = 4
+    ORDER_TYPE_SELL_STOP = 5
+    ORDER_TYPE_BUY_STOP_LIMIT = 6
+    ORDER_TYPE_SELL_STOP_LIMIT = 7
+
+    # Order time types
+    ORDER_TIME_GTC = 0
+    ORDER_TIME_DAY = 1
+    ORDER_TIME_SPECIFIED = 2
+    ORDER_TIME_SPECIFIED_DAY = 3
+
+    # Order filling modes
+    ORDER_FILLING_FOK = 0
+    ORDER_FILLING_IOC = 1
+    ORDER_FILLING_RETURN = 2
+
+    # Chart timeframes (values match the MetaTrader5 package)
+    TIMEFRAME_M1 = 1
+    TIMEFRAME_M2 = 2
+    TIMEFRAME_M3 = 3
+    TIMEFRAME_M4 = 4
+    TIMEFRAME_M5 = 5
+    TIMEFRAME_M6 = 6
+    TIMEFRAME_M10 = 10
+    TIMEFRAME_M12 = 12
+    TIMEFRAME_M15 = 15
+    TIMEFRAME_M20 = 20
+    TIMEFRAME_M30 = 30
+    TIMEFRAME_H1 = 16385
+    TIMEFRAME_H2 = 16386
+    TIMEFRAME_H3 = 16387
+    TIMEFRAME_H4 = 16388
+    TIMEFRAME_H6 = 16390
+    TIMEFRAME_H8 = 16392
+    TIMEFRAME_H12 = 16396
+    TIMEFRAME_D1 = 16408
+    TIMEFRAME_W1 = 32769
+    TIMEFRAME_MN1 = 49153
+
+    # Position types
+    POSITION_TYPE_BUY = 0
+    POSITION_TYPE_SELL = 1
+
+    # Trade return codes (flat aliases of TradeRetcode members)
+    TRADE_RETCODE_REQUOTE = TradeRetcode.REQUOTE
+    TRADE_RETCODE_REJECT = TradeRetcode.REJECT
+    TRADE_RETCODE_CANCEL = TradeRetcode.CANCEL
+    TRADE_RETCODE_PLACED = TradeRetcode.PLACED
+    TRADE_RETCODE_DONE = TradeRetcode.DONE
+    TRADE_RETCODE_TIMEOUT = TradeRetcode.TIMEOUT
+    TRADE_RETCODE_INVALID = TradeRetcode.INVALID
+    TRADE_RETCODE_INVALID_VOLUME = TradeRetcode.INVALID_VOLUME
+    TRADE_RETCODE_INVALID_PRICE = TradeRetcode.INVALID_PRICE
+    TRADE_RETCODE_INVALID_STOPS = TradeRetcode.INVALID_STOPS
+    TRADE_RETCODE_TRADE_DISABLED = TradeRetcode.TRADE_DISABLED
+    TRADE_RETCODE_MARKET_CLOSED = TradeRetcode.MARKET_CLOSED
+    TRADE_RETCODE_NO_MONEY = TradeRetcode.NO_MONEY
+    TRADE_RETCODE_PRICE_CHANGED = TradeRetcode.PRICE_CHANGED
+    TRADE_RETCODE_PRICE_OFF = TradeRetcode.PRICE_OFF
+    TRADE_RETCODE_INVALID_EXPIRATION = TradeRetcode.INVALID_EXPIRATION
+    TRADE_RETCODE_ORDER_CHANGED = TradeRetcode.ORDER_CHANGED
+    TRADE_RETCODE_TOO_MANY_REQUESTS = TradeRetcode.TOO_MANY_REQUESTS
+    TRADE_RETCODE_NO_CHANGES = TradeRetcode.NO_CHANGES
+    TRADE_RETCODE_SERVER_DISABLES_AT = TradeRetcode.SERVER_DISABLES_AT
+    TRADE_RETCODE_CLIENT_DISABLES_AT = TradeRetcode.CLIENT_DISABLES_AT
+    TRADE_RETCODE_LOCKED = TradeRetcode.LOCKED
+    TRADE_RETCODE_FROZEN = TradeRetcode.FROZEN
+    TRADE_RETCODE_INVALID_FILL = TradeRetcode.INVALID_FILL
+    TRADE_RETCODE_CONNECTION = TradeRetcode.CONNECTION
+    TRADE_RETCODE_ONLY_REAL = TradeRetcode.ONLY_REAL
+    TRADE_RETCODE_LIMIT_ORDERS = TradeRetcode.LIMIT_ORDERS
+    TRADE_RETCODE_LIMIT_VOLUME = TradeRetcode.LIMIT_VOLUME
+    TRADE_RETCODE_INVALID_ORDER = TradeRetcode.INVALID_ORDER
+    TRADE_RETCODE_POSITION_CLOSED = TradeRetcode.POSITION_CLOSED
+
+    # Symbol trade modes
+    SYMBOL_TRADE_MODE_DISABLED = 0
+    SYMBOL_TRADE_MODE_LONGONLY = 1
+    SYMBOL_TRADE_MODE_SHORTONLY = 2
+    SYMBOL_TRADE_MODE_CLOSEONLY = 3
+    SYMBOL_TRADE_MODE_FULL = 4
+
+    # Static terminal_info/account_info payloads, shared read-only
+    _TERMINAL_INFO = MappingProxyType(
+        {
+            "community_account": False,
+            "community_connection": False,
+            "connected": True,
+            "dlls_allowed": True,
+            "trade_allowed": True,
+            "tradeapi_disabled": False,
+            "trade_expert": True,
+            "email_enabled": False,
+            "ftp_enabled": False,
+            "notifications_enabled": False,
+            "mqid": False,
+            "build": 3000,
+            "maxbars": 65000,
+            "codepage": 1251,
+            "cpu_cores": 8,
+            "disk_space": 10000000,
+            "physical_memory": 16000000,
+            "screen_dpi": 96,
+            "ping_last": 45,
+            "community_balance": 0.0,
+            "retransmission": 0.01,
+            "company": "Mock Broker LLC",
+            "name": "MockTrader 5",
+            "language": 1033,
+            "path": "C:\\Program Files\\MockTrader 5",
+        }
+    )
+    _ACCOUNT_INFO = MappingProxyType(
+        {
+            "login": 12345678,
+            "trade_mode": 0,  # Demo account
+            "leverage": 100,
+            "limit_orders": 100,
+            "margin_so_mode": 0,
+            "trade_allowed": True,
+            "trade_expert": True,
+            "margin_mode": 0,
+            "currency_digits": 2,
+            "fifo_close": False,
+            "balance": 10000.0,
+            "credit": 0.0,
+            "profit": 0.0,
+            "equity": 10000.0,
+            "margin": 0.0,
+            "margin_free": 10000.0,
+            "margin_level": 0.0,
+            "margin_so_call": 50.0,
+            "margin_so_so": 30.0,
+            "margin_initial": 0.0,
+            "margin_maintenance": 0.0,
+            "assets": 0.0,
+            "liabilities": 0.0,
+            "commission_blocked": 0.0,
+            "name": "Mock Trader",
+            "server": "MockServer-Demo",
+            "currency": "USD",
+            "company": "Mock Broker LLC",
+        }
+    )
+
+    # Static order_send result fields; per-request fields are overlaid
+    _ORDER_SEND_OK_TEMPLATE = {
+        "retcode": TRADE_RETCODE_DONE,
+        "deal": 123456789,
+        "order": 987654321,
+        "bid": 1.0950,
+        "ask": 1.0952,
+        "comment": "Mocked execution",
+        "retcode_external": 0,
+    }
+    _ORDER_SEND_ERR_TEMPLATE = {
+        "retcode": TRADE_RETCODE_CONNECTION,
+        "deal": 0,
+        "order": 0,
+        "volume": 0.0,
+        "price": 0.0,
+        "bid": 0.0,
+        "ask": 0.0,
+        "comment": "Connection error",
+        "retcode_external": 0,
+    }
+
+    # Symbol-independent symbol_info fields (5-digit quotes)
+    _BASE_SYMBOL_INFO_5DIGIT = {
+        "custom": False,
+        "chart_mode": 0,
+        "select": True,
+        "visible": True,
+        "session_deals": 0,
+        "session_buy_orders": 0,
+        "session_sell_orders": 0,
+        "volume": 0,
+        "volumehigh": 0,
+        "volumelow": 0,
+        "time": 1694188800,
+        "digits": 5,
+        "spread": 2,
+        "spread_float": True,
+        "trade_calc_mode": 0,
+        "trade_mode": SYMBOL_TRADE_MODE_FULL,
+        "start_time": 0,
+        "expiration_time": 0,
+        "trade_stops_level": 10,
+        "trade_freeze_level": 0,
+        "trade_exemode": 0,
+        "swap_mode": 0,
+        "swap_rollover3days": 3,
+        "margin_hedged_use_leg": False,
+        "expiration_mode": 15,
+        "filling_mode": 7,  # FOK | IOC | Return
+        "order_mode": 127,
+        "order_gtc_mode": 0,
+        "option_mode": 0,
+        "option_right": 0,
+        "bid": 1.0950,
+        "bidhigh": 1.0980,
+        "bidlow": 1.0920,
+        "ask": 1.0952,
+        "askhigh": 1.0982,
+        "asklow": 1.0922,
+        "last": 1.0951,
+        "lasthigh": 1.0981,
+        "lastlow": 1.0921,
+        "volume_real": 0.0,
+        "volumehigh_real": 0.0,
+        "volumelow_real": 0.0,
+        "option_strike": 0.0,
+        "point": 0.00001,
+        "trade_tick_value": 1.0,
+        "trade_tick_value_profit": 1.0,
+        "trade_tick_value_loss": 1.0,
+        "trade_tick_size": 0.00001,
+        "trade_contract_size": 100000,
+        "trade_accrued_interest": 0.0,
+        "trade_face_value": 0.0,
+        "trade_liquidity_rate": 0.0,
+        "volume_min": 0.01,
+        "volume_max": 500.0,
+        "volume_step": 0.01,
+        "volume_limit": 0.0,
+        "swap_long": -0.5,
+        "swap_short": 0.2,
+        "margin_initial": 0.0,
+        "margin_maintenance": 0.0,
+        "session_volume": 0,
+        "session_turnover": 0.0,
+        "session_interest": 0.0,
+        "session_buy_orders_volume": 0.0,
+        "session_sell_orders_volume": 0.0,
+        "session_open": 1.0940,
+        "session_close": 1.0951,
+        "session_aw": 0.0,
+        "session_price_settlement": 0.0,
+        "session_price_limit_min": 0.0,
+        "session_price_limit_max": 0.0,
+        "margin_hedged": 50000.0,
+        "price_change": 0.0011,
+        "price_volatility": 0.0,
+        "price_theoretical": 0.0,
+        "price_greeks_delta": 0.0,
+        "price_greeks_theta": 0.0,
+        "price_greeks_gamma": 0.0,
+        "price_greeks_vega": 0.0,
+        "price_greeks_rho": 0.0,
+        "price_greeks_omega": 0.0,
+        "price_sensitivity": 0.0,
+        "basis": "",
+        "category": "",
+        "bank": "",
+        "exchange": "",
+        "formula": "",
+        "isin": "",
+        "page": "",
+    }
+    # JPY pairs quote with 3 digits
+    _BASE_SYMBOL_INFO_3DIGIT = {
+        **_BASE_SYMBOL_INFO_5DIGIT,
+        "digits": 3,
+        "point": 0.001,
+        "trade_tick_size": 0.001,
+    }
+
+    def __init__(self):
+        self.initialized = False
+        self.connected = False
+        self._symbol_cache: dict[str, SymbolInfo] = {}
+        self._symbols_get_cache: tuple[SymbolInfo, ...] | None = None
+
+    def initialize(
+        self,
+        login: int | None = None,
+        password: str | None = None,
+        server: str | None = None,
+        timeout: int = 60000,
+        portable: bool = False,
+        path: str | None = None,
+    ) -> bool:
+        """Mock MT5 initialization"""
+        self.initialized = True
+        self.connected = True
+        return True
+
+    def shutdown(self) -> None:
+        """Mock MT5 shutdown"""
+        self.initialized = False
+        self.connected = False
+        self._symbol_cache.clear()
+        self._symbols_get_cache = None
+
+    def __reduce__(self):
+        """
+        Pickle as constructor call plus connection flags only.
+
+        Caches are rebuilt on demand, so pytest-xdist workers can rehydrate
+        the mock cheaply.
+        """
+        return (
+            type(self),
+            (),
+            {"initialized": self.initialized, "connected": self.connected},
+        )
+
+    def reset(self) -> None:
+        """Return a shared mock to its freshly initialized state"""
+        self.initialized = True
+        self.connected = True
+        self._symbol_cache.clear()
+        self._symbols_get_cache = None
+
+    def terminal_info(self) -> MappingProxyType | None:
+        """Mock terminal info (shared read-only mapping)"""
+        return self._TERMINAL_INFO if self.connected else None
+
+    def account_info(self) -> MappingProxyType | None:
+        """Mock account info (shared read-only mapping)"""
+        return self._ACCOUNT_INFO if self.connected else None
+
+    @classmethod
+    def _build_symbol_info(cls, symbol: str) -> SymbolInfo:
+        """Build the mock symbol_info record for a symbol"""
+        # Return different mock data based on symbol; the templates never
+        # carry the symbol-specific keys, so both merge in a single call
+        has_pair = len(symbol) >= 6
+        template = (
+            cls._BASE_SYMBOL_INFO_3DIGIT
+            if "JPY" in symbol
+            else cls._BASE_SYMBOL_INFO_5DIGIT
+        )
+        return SymbolInfo(
+            **template,
+            currency_base=symbol[:3] if has_pair else "EUR",
+            currency_profit=symbol[3:6] if has_pair else "USD",
+            currency_margin=symbol[3:6] if has_pair else "USD",
+            description=f"Mock {symbol}",
+            name=symbol,
+            path=f"Forex\\Mock\\{symbol}",
+        )
+
+    def symbol_info(self, symbol: str) -> SymbolInfo | None:
+        """Mock symbol info"""
+        if not self.connected:
+            return None
+
+        major = _MAJORS.get(symbol)
+        if major is not None:
+            return major
+
+        cached = self._symbol_cache.get(symbol)
+        if cached is None:
+            cached = self._symbol_cache[symbol] = self._build_symbol_info(symbol)
+        return cached
+
+    def symbol_select(self, symbol: str, enable: bool = True) -> bool:
+        """Mock symbol selection"""
+        return bool(self.connected)
+
+    def symbols_get(self, group: str = "*") -> tuple | None:
+        """Mock symbols list"""
+        if not self.connected:
+            return None
+        if self._symbols_get_cache is None:
+            self._symbols_get_cache = tuple(
+                self.symbol_info(symbol) for symbol in SYMBOLS_GET_SYMBOLS
+            )
+        return self._symbols_get_cache
+
+    def copy_rates_from_pos(
+        self, symbol: str, timeframe: int, start_pos: int, count: int
+    ) -> np.ndarray | None:
+        """Mock historical rates (structured array, like real MT5)"""
+        if not self.connected:
+            return None
+        # Return mock OHLC data
+        current_time = int(time.time())
+        idx = np.arange(count)
+        offset = (idx % 10) * 0.0001
+        rates = np.empty(count, dtype=RATE_DTYPE)
+        rates["time"] = current_time - (count - idx) * 60  # 1-minute intervals
+        rates["open"] = 1.0950 + offset
+        rates["high"] = 1.0955 + offset
+        rates["low"] = 1.0945 + offset
+        rates["close"] = 1.0952 + offset
+        rates["tick_volume"] = 100 + idx
+        rates["spread"] = 2
+        rates["real_volume"] = 0
+        return rates
+
+    def positions_get(
+        self, symbol: str | None = None, ticket: int | None = None
+    ) -> tuple | None:
+        """Mock positions"""
+        if not self.connected:
+            return None
+        return ()  # No open positions by default
+
+    def orders_get(
+        self, symbol: str | None = None, ticket: int | None = None
+    ) -> tuple | None:
+        """Mock pending orders"""
+        if not self.connected:
+            return None
+        return ()  # No pending orders by default
+
+    def order_send(self, request: dict) -> dict:
+        """Mock order sending"""
+        if not self.connected:
+            return {
+                **self._ORDER_SEND_ERR_TEMPLATE,
+                "request_id": request.get("magic", 0),
+            }
+
+        return {
+            **self._ORDER_SEND_OK_TEMPLATE,
+            "volume": request.get("volume", 0.01),
+            "price": request.get("price", 1.0951),
+            "request_id": request.get("magic", 0),
+        }
+
+    def last_error(self) -> tuple:
+        """Mock last error"""
+        return (0, "No error")
+
+
+# Prebuilt records for the majors, shared by every MockMT5 instance
+_MAJORS = MappingProxyType(
+    {symbol: MockMT5._build_symbol_info(symbol) for symbol in SYMBOLS_GET_SYMBOLS}
+)
+EURUSD_MOCK = _MAJORS["EURUSD"]
+GBPUSD_MOCK = _MAJORS["GBPUSD"]
+USDJPY_MOCK = _MAJORS["USDJPY"]
+USDCHF_MOCK = _MAJORS["USDCHF"]
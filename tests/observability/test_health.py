@@ -2,15 +2,8 @@
 Tests for health check functionality.
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from observability.health import (
     check_health,
@@ -20,9 +13,57 @@ from observability.health import (
 )
 
 
+class _StubBroker:
+    """Broker stand-in exposing only is_connected."""
+
+    def __init__(self, ok):
+        self._ok = ok
+
+    def is_connected(self):
+        return self._ok
+
+
+class _StubPath:
+    """Path stand-in exposing only exists."""
+
+    def __init__(self, exists):
+        self._exists = exists
+
+    def exists(self):
+        return self._exists
+
+
+class _StubCursor:
+    """Cursor stand-in recording executed statements."""
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql):
+        self.executed.append(sql)
+
+
+class _StubConn:
+    """sqlite3 connection stand-in handing out a single cursor."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def close(self):
+        pass
+
+
 class TestHealthChecks(unittest.TestCase):
     """Test health check functionality."""
 
+    def setUp(self):
+        self.settings = object()
+        self.cursor = _StubCursor()
+        self.conn = _StubConn(self.cursor)
+
     def test_determine_overall_status(self):
         """Test overall status determination logic."""
         # All OK
@@ -49,14 +90,8 @@ class TestHealthChecks(unittest.TestCase):
     @patch("config.settings.get_settings")
     def test_check_mt5_connection_success(self, mock_get_settings, mock_broker_class):
         """Test successful MT5 connection check."""
-        # Mock settings
-        mock_settings = Mock()
-        mock_get_settings.return_value = mock_settings
-
-        # Mock broker
-        mock_broker = Mock()
-        mock_broker.is_connected.return_value = True
-        mock_broker_class.return_value = mock_broker
+        mock_get_settings.return_value = self.settings
+        mock_broker_class.return_value = _StubBroker(True)
 
         result = check_mt5_connection()
 
@@ -68,14 +103,8 @@ class TestHealthChecks(unittest.TestCase):
     @patch("config.settings.get_settings")
     def test_check_mt5_connection_failure(self, mock_get_settings, mock_broker_class):
         """Test failed MT5 connection check."""
-        # Mock settings
-        mock_settings = Mock()
-        mock_get_settings.return_value = mock_settings
-
-        # Mock broker
-        mock_broker = Mock()
-        mock_broker.is_connected.return_value = False
-        mock_broker_class.return_value = mock_broker
+        mock_get_settings.return_value = self.settings
+        mock_broker_class.return_value = _StubBroker(False)
 
         result = check_mt5_connection()
 
@@ -99,30 +128,19 @@ class TestHealthChecks(unittest.TestCase):
     @patch("observability.health.Path")
     def test_check_idempotency_db_success(self, mock_path, mock_sqlite):
         """Test successful database check."""
-        # Mock path exists
-        mock_path_instance = Mock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
-
-        # Mock database connection
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_sqlite.connect.return_value = mock_conn
+        mock_path.return_value = _StubPath(True)
+        mock_sqlite.connect.return_value = self.conn
 
         result = check_idempotency_db()
 
         self.assertTrue(result["idempotency_db_ok"])
         self.assertEqual(result["status"], "ok")
-        mock_cursor.execute.assert_called_once_with("SELECT 1")
+        self.assertEqual(self.cursor.executed, ["SELECT 1"])
 
     @patch("observability.health.Path")
     def test_check_idempotency_db_not_found(self, mock_path):
         """Test database check when file not found."""
-        # Mock path doesn't exist
-        mock_path_instance = Mock()
-        mock_path_instance.exists.return_value = False
-        mock_path.return_value = mock_path_instance
+        mock_path.return_value = _StubPath(False)
 
         result = check_idempotency_db()
 
@@ -134,10 +152,7 @@ class TestHealthChecks(unittest.TestCase):
     @patch("observability.health.Path")
     def test_check_idempotency_db_error(self, mock_path, mock_sqlite):
         """Test database check with connection error."""
-        # Mock path exists
-        mock_path_instance = Mock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_path.return_value = _StubPath(True)
 
         # Mock database connection error
         mock_sqlite.connect.side_effect = Exception("Connection failed")
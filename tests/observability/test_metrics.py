@@ -2,13 +2,6 @@
 Tests for the metrics registry functionality.
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 import threading
 import time
 import unittest
@@ -48,6 +41,41 @@ class TestMetrics(unittest.TestCase):
         self.assertEqual(counters["method=GET&status=200"], 3.0)
         self.assertEqual(counters["method=POST&status=201"], 1.0)
 
+    def test_label_order_independent(self):
+        """Test label keyword order does not split a series."""
+        self.registry.inc("requests", 1.0, method="GET", status="200")
+        self.registry.inc("requests", 1.0, status="200", method="GET")
+
+        counters = self.registry.get_all_metrics()["counters"]["requests"]
+        self.assertEqual(counters, {"method=GET&status=200": 2.0})
+
+    def test_equal_label_values_render_distinct_series(self):
+        """Test labels that compare equal but render differently stay apart."""
+        self.registry.inc("requests", 1.0, status=200)
+        self.registry.inc("requests", 1.0, status=200.0)
+        self.registry.inc("flags", 1.0, flag=1)
+        self.registry.inc("flags", 1.0, flag=True)
+
+        counters = self.registry.get_all_metrics()["counters"]
+        self.assertEqual(counters["requests"], {"status=200": 1.0, "status=200.0": 1.0})
+        self.assertEqual(counters["flags"], {"flag=1": 1.0, "flag=True": 1.0})
+
+    def test_single_series_accessors(self):
+        """Test reading one series without a full snapshot."""
+        self.registry.inc("requests", 2.0, method="GET")
+        self.registry.set_gauge("cpu_usage", 45.2, core="0")
+        self.registry.observe("latency", 100.0, endpoint="/api")
+
+        self.assertEqual(self.registry.get_counter("requests", method="GET"), 2.0)
+        self.assertEqual(self.registry.get_counter("requests", method="PUT"), 0.0)
+        self.assertEqual(self.registry.get_counter("missing"), 0.0)
+        self.assertEqual(self.registry.get_gauge("cpu_usage", core="0"), 45.2)
+        self.assertIsNone(self.registry.get_gauge("cpu_usage", core="9"))
+        self.assertEqual(
+            self.registry.get_histogram("latency", endpoint="/api")["count"], 1
+        )
+        self.assertIsNone(self.registry.get_histogram("latency"))
+
     def test_gauge_set(self):
         """Test gauge setting."""
         self.registry.set_gauge("temperature", 25.5)
@@ -119,8 +147,39 @@ class TestMetrics(unittest.TestCase):
         metrics = self.registry.get_all_metrics()
         self.assertEqual(metrics["counters"]["thread_test"]["__default__"], 500.0)
 
+    def test_exited_thread_shards_retired(self):
+        """Test short-lived threads' counter shards do not pile up unread."""
+        for _ in range(200):
+            thread = threading.Thread(target=self.registry.inc, args=("churn",))
+            thread.start()
+            thread.join()
+
+        # Each new shard retires the exited threads' ones before any read
+        self.assertLessEqual(len(self.registry._counter_shards._shards), 2)
+        self.assertEqual(self.registry.get_counter("churn"), 200.0)
+
+    def test_histogram_thread_safety(self):
+        """Test concurrent observations across and within histogram series."""
+
+        def observe_values(endpoint):
+            for i in range(200):
+                self.registry.observe("latency", float(i % 7), endpoint=endpoint)
+
+        threads = [
+            threading.Thread(target=observe_values, args=(f"/api/{n % 2}",))
+            for n in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        histograms = self.registry.get_all_metrics()["histograms"]["latency"]
+        self.assertEqual(histograms["endpoint=/api/0"]["count"], 600)
+        self.assertEqual(histograms["endpoint=/api/1"]["count"], 600)
+
     def test_histogram_memory_limit(self):
-        """Test histogram memory limit (max 1000 observations)."""
+        """Test histogram memory stays bounded (sparse bins, not raw values)."""
         # Add more than 1000 observations
         for i in range(1200):
             self.registry.observe("memory_test", float(i))
@@ -128,10 +187,45 @@ class TestMetrics(unittest.TestCase):
         metrics = self.registry.get_all_metrics()
         histogram = metrics["histograms"]["memory_test"]["__default__"]
 
-        # Should only keep last 1000 observations
-        self.assertEqual(len(histogram["values"]), 10)  # Only shows last 10 in summary
-        # Count is limited to the size of the list, which is max 1000
-        self.assertLessEqual(histogram["count"], 1000)
+        # Count and sum cover every observation
+        self.assertEqual(histogram["count"], 1200)
+        self.assertEqual(histogram["sum"], float(sum(range(1200))))
+        # Summary shows the last 10 raw observations
+        self.assertEqual(histogram["values"], [float(i) for i in range(1190, 1200)])
+        self.assertEqual(histogram["min"], 0.0)
+        self.assertEqual(histogram["max"], 1199.0)
+        # Bins are two significant digits wide, far fewer than observations
+        series = self.registry._histograms["memory_test"]["__default__"]
+        self.assertLess(len(series.bins), 250)
+
+    def test_histogram_quantiles(self):
+        """Test quantiles derived from histogram bins."""
+        for i in range(1, 101):
+            self.registry.observe("latency_ms", float(i))
+
+        histogram = self.registry.get_all_metrics()["histograms"]["latency_ms"][
+            "__default__"
+        ]
+
+        # Extremes are exact; quantiles come from bin midpoints
+        self.assertEqual(histogram["min"], 1.0)
+        self.assertEqual(histogram["max"], 100.0)
+        self.assertAlmostEqual(histogram["p50"], 50.5)
+        self.assertAlmostEqual(histogram["p99"], 99.5)
+
+    def test_histogram_tiny_values(self):
+        """Test values below the smallest bin saturate to the zero bin."""
+        self.registry.observe("tiny", 1e-310)
+        self.registry.observe("tiny", 5e-324)
+
+        histogram = self.registry.get_all_metrics()["histograms"]["tiny"][
+            "__default__"
+        ]
+
+        self.assertEqual(histogram["count"], 2)
+        self.assertEqual(histogram["min"], 5e-324)
+        self.assertEqual(histogram["max"], 1e-310)
+        self.assertEqual(histogram["p50"], 0.0)
 
     def test_render_as_text(self):
         """Test text rendering of metrics."""
@@ -148,6 +242,23 @@ class TestMetrics(unittest.TestCase):
         self.assertIn("test_histogram_count 2", text)
         self.assertIn("test_histogram_sum 4", text)
         self.assertIn("test_histogram_avg 2", text)
+        self.assertIn("test_histogram_p50 1.55", text)
+        self.assertIn("test_histogram_p99 2.55", text)
+
+    def test_render_as_bytes(self):
+        """Test byte rendering matches the text rendering."""
+        self.registry.inc("test_counter", 5.0, route="/a%b")
+        self.registry.set_gauge("test_gauge", 42)
+        self.registry.observe("test_histogram", 1.5)
+
+        body = self.registry.render_as_bytes()
+
+        self.assertIsInstance(body, bytes)
+        self.assertIn(b"test_counter{route=/a%b} 5.0 ", body)
+        self.assertIn(b"test_gauge 42 ", body)
+        self.assertEqual(
+            len(body.splitlines()), len(self.registry.render_as_text().splitlines())
+        )
 
     def test_global_metrics_functions(self):
         """Test global metrics convenience functions."""
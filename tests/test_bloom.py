@@ -0,0 +1,41 @@
+"""
+Tests for the Bloom filter fronting the idempotency store
+"""
+
+import pytest
+
+from core.executor.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    """Test BloomFilter membership and sizing"""
+
+    def test_no_false_negatives(self):
+        """Test every added item is reported as present"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"coid_{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate(self):
+        """Test unseen items rarely hit at capacity"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"coid_{i}")
+
+        hits = sum(f"other_{i}" in bloom for i in range(10_000))
+        assert hits < 300  # ~1% expected, generous bound
+
+    def test_sizing(self):
+        """Test bit count and hash count follow the standard formulas"""
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        assert bloom.num_bits == 14_377_588
+        assert bloom.num_hashes == 10
+
+    @pytest.mark.parametrize("capacity,error_rate", [(0, 0.01), (100, 0.0), (100, 1.0)])
+    def test_invalid_parameters(self, capacity, error_rate):
+        """Test invalid sizing is rejected"""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
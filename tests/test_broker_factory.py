@@ -28,6 +28,20 @@ class MockSettings:
         self.mt5.terminal_path = None
 
 
+@pytest.fixture(scope="class")
+def paper_broker():
+    """PaperBroker shared by a test class; reset per test by the class"""
+    return PaperBroker(MockSettings())
+
+
+@pytest.fixture(scope="class")
+def connected_paper_broker():
+    """Factory-built, connected paper broker shared by a test class"""
+    broker = create_broker(MockSettings(broker_kind="paper"))
+    broker.connect()
+    return broker
+
+
 class TestBrokerFactory:
     """Test broker factory creation and swap-ability"""
 
@@ -93,10 +107,13 @@ class TestBrokerFactory:
 class TestPaperBroker:
     """Test PaperBroker simulation functionality"""
 
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.settings = MockSettings()
-        self.broker = PaperBroker(self.settings)
+    @pytest.fixture(autouse=True)
+    def _fresh_broker(self, paper_broker):
+        """Return the shared broker to its initial, disconnected state"""
+        paper_broker.reset_simulation()
+        paper_broker._connected = False
+        self.settings = paper_broker.settings
+        self.broker = paper_broker
 
     def test_paper_broker_initialization(self):
         """Test paper broker initializes correctly"""
@@ -115,7 +132,12 @@ class TestPaperBroker:
         self.broker.connect()
         assert self.broker.is_connected()
 
-    def test_market_order_execution(self):
+    @pytest.mark.parametrize(
+        "side,sl,tp,expected_qty",
+        [(Side.BUY, 1.0900, 1.1000, 0.1), (Side.SELL, 1.1000, 1.0900, -0.1)],
+        ids=["long", "short"],
+    )
+    def test_market_order_execution(self, side, sl, tp, expected_qty):
         """Test market order execution and position tracking"""
         self.broker.connect()
 
@@ -123,11 +145,11 @@ class TestPaperBroker:
         request = OrderRequest(
             client_order_id="test_001",
             symbol="EURUSD",
-            side=Side.BUY,
+            side=side,
             qty=0.1,
             order_type="MARKET",
-            sl=1.0900,
-            tp=1.1000,
+            sl=sl,
+            tp=tp,
         )
 
         # Execute order
@@ -144,7 +166,7 @@ class TestPaperBroker:
 
         position = positions[0]
         assert position.symbol == "EURUSD"
-        assert position.qty == 0.1  # Long position
+        assert position.qty == expected_qty
         assert position.avg_price > 0
 
     def test_order_idempotency(self):
@@ -168,92 +190,81 @@ class TestPaperBroker:
         assert result2.accepted is True
         assert result1.broker_order_id == result2.broker_order_id
 
+        # Further retries reuse the cached duplicate reply
+        assert self.broker.place_order(request) is result2
+
         # Should only have one position
         positions = self.broker.positions()
         assert len(positions) == 1
 
-    def test_position_updates(self):
-        """Test position updates with multiple trades"""
+    @pytest.mark.parametrize(
+        "trades,expected_qty",
+        [
+            ([(Side.BUY, 0.1)], 0.1),
+            ([(Side.BUY, 0.1), (Side.BUY, 0.1)], 0.2),
+            ([(Side.BUY, 0.1), (Side.BUY, 0.1), (Side.SELL, 0.1)], 0.1),
+            ([(Side.BUY, 0.1), (Side.SELL, 0.1)], None),
+        ],
+        ids=["open", "add", "partial_close", "full_close"],
+    )
+    def test_position_updates(self, trades, expected_qty):
+        """Test position updates and closure over a sequence of trades"""
         self.broker.connect()
 
-        # Buy 0.1 lot
-        buy_request = OrderRequest(
-            client_order_id="buy_001",
-            symbol="EURUSD",
-            side=Side.BUY,
-            qty=0.1,
-            order_type="MARKET",
-        )
-        self.broker.place_order(buy_request)
-
-        # Check position
-        positions = self.broker.positions()
-        assert len(positions) == 1
-        assert positions[0].qty == 0.1
-
-        # Buy another 0.1 lot
-        buy_request2 = OrderRequest(
-            client_order_id="buy_002",
-            symbol="EURUSD",
-            side=Side.BUY,
-            qty=0.1,
-            order_type="MARKET",
-        )
-        self.broker.place_order(buy_request2)
-
-        # Check updated position
-        positions = self.broker.positions()
-        assert len(positions) == 1
-        assert positions[0].qty == 0.2
-
-        # Sell 0.1 lot (partial close)
-        sell_request = OrderRequest(
-            client_order_id="sell_001",
-            symbol="EURUSD",
-            side=Side.SELL,
-            qty=0.1,
-            order_type="MARKET",
-        )
-        self.broker.place_order(sell_request)
+        for i, (side, qty) in enumerate(trades):
+            request = OrderRequest(
+                client_order_id=f"trade_{i:03d}",
+                symbol="EURUSD",
+                side=side,
+                qty=qty,
+                order_type="MARKET",
+            )
+            self.broker.place_order(request)
 
-        # Check reduced position
         positions = self.broker.positions()
-        assert len(positions) == 1
-        assert positions[0].qty == 0.1
-
-    def test_position_closure(self):
-        """Test complete position closure"""
+        if expected_qty is None:
+            # Position closed completely
+            assert len(positions) == 0
+        else:
+            assert len(positions) == 1
+            assert positions[0].qty == expected_qty
+
+    def test_positions_reused_until_updated(self):
+        """Test repeated reads reuse positions until a fill changes them"""
         self.broker.connect()
 
-        # Open position
-        buy_request = OrderRequest(
-            client_order_id="open_pos",
-            symbol="EURUSD",
-            side=Side.BUY,
-            qty=0.1,
-            order_type="MARKET",
-        )
-        self.broker.place_order(buy_request)
+        for i, symbol in enumerate(["EURUSD", "EURUSD", "GBPUSD"]):
+            self.broker.place_order(
+                OrderRequest(
+                    client_order_id=f"reuse_{i:03d}",
+                    symbol=symbol,
+                    side=Side.BUY,
+                    qty=0.1,
+                    order_type="MARKET",
+                )
+            )
 
-        # Verify position exists
-        positions = self.broker.positions()
-        assert len(positions) == 1
+        first = {p.symbol: p for p in self.broker.positions()}
+        second = {p.symbol: p for p in self.broker.positions()}
+        assert first["EURUSD"] is second["EURUSD"]
+        assert first["EURUSD"].qty == pytest.approx(0.2)
 
-        # Close position completely
-        sell_request = OrderRequest(
-            client_order_id="close_pos",
-            symbol="EURUSD",
-            side=Side.SELL,
-            qty=0.1,
-            order_type="MARKET",
+        self.broker.place_order(
+            OrderRequest(
+                client_order_id="reuse_close",
+                symbol="EURUSD",
+                side=Side.SELL,
+                qty=0.1,
+                order_type="MARKET",
+            )
         )
-        self.broker.place_order(sell_request)
 
-        # Verify position closed
-        positions = self.broker.positions()
-        assert len(positions) == 0
+        third = {p.symbol: p for p in self.broker.positions()}
+        assert third["EURUSD"].qty == pytest.approx(0.1)
+        assert third["GBPUSD"] is first["GBPUSD"]
 
-    def test_commission_calculation(self):
+    @pytest.mark.parametrize("qty", [0.1, 0.5])
+    def test_commission_calculation(self, qty):
         """Test commission deduction from balance"""
         self.broker.connect()
         initial_balance = self.broker._balance
@@ -263,13 +274,13 @@ class TestPaperBroker:
             client_order_id="commission_test",
             symbol="EURUSD",
             side=Side.BUY,
-            qty=0.1,
+            qty=qty,
             order_type="MARKET",
         )
         self.broker.place_order(request)
 
         # Check commission deducted
-        expected_commission = 0.1 * 5.0  # 0.1 lot * $5 per lot
+        expected_commission = qty * 5.0  # lots * $5 per lot
         assert self.broker._balance == initial_balance - expected_commission
 
     def test_account_info(self):
@@ -311,6 +322,23 @@ class TestPaperBroker:
         result = self.broker.cancel("fake_order_id")
         assert result is False  # Market orders cannot be cancelled
 
+    def test_many_open_positions(self):
+        """Test the position book grows past its initial capacity"""
+        self.broker.connect()
+        symbols = [f"SYM{i}USD" for i in range(20)]
+
+        for i, symbol in enumerate(symbols):
+            side = Side.BUY if i % 2 else Side.SELL
+            request = OrderRequest(
+                client_order_id=f"many_{i}", symbol=symbol, side=side, qty=0.1
+            )
+            assert self.broker.place_order(request).accepted is True
+
+        positions = {pos.symbol: pos for pos in self.broker.positions()}
+        assert set(positions) == set(symbols)
+        assert positions["SYM1USD"].qty == 0.1
+        assert positions["SYM0USD"].qty == -0.1
+
     def test_simulation_reset(self):
         """Test simulation reset functionality"""
         self.broker.connect()
@@ -364,11 +392,14 @@ class TestPaperBroker:
 class TestBrokerIntegration:
     """Test broker integration in event pipeline simulation"""
 
-    def test_event_flow_simulation(self):
+    @pytest.fixture
+    def broker(self, connected_paper_broker):
+        """Shared connected paper broker with simulation state cleared"""
+        connected_paper_broker.reset_simulation()
+        return connected_paper_broker
+
+    def test_event_flow_simulation(self, broker):
         """Test that paper broker works with event flow"""
-        settings = MockSettings(broker_kind="paper")
-        broker = create_broker(settings)
-        broker.connect()
 
         # Simulate order placement in event flow
         request = OrderRequest(
@@ -393,23 +424,26 @@ class TestBrokerIntegration:
         assert positions[0].symbol == "XAUUSD"
         assert positions[0].qty == 0.01
 
-    def test_multiple_symbols(self):
+    def test_multiple_symbols(self, broker):
         """Test trading multiple symbols simultaneously"""
-        settings = MockSettings(broker_kind="paper")
-        broker = create_broker(settings)
-        broker.connect()
 
         symbols = ["EURUSD", "GBPUSD", "XAUUSD"]
 
-        # Open positions in multiple symbols
-        for i, symbol in enumerate(symbols):
-            request = OrderRequest(
-                client_order_id=f"multi_{symbol}_{i}",
-                symbol=symbol,
-                side=Side.BUY,
-                qty=0.1,
-                order_type="MARKET",
-            )
+        # Open positions in multiple symbols, validated as one batch
+        requests = OrderRequest.batch(
+            [
+                {
+                    "client_order_id": f"multi_{symbol}_{i}",
+                    "symbol": symbol,
+                    "side": Side.BUY,
+                    "qty": 0.1,
+                    "order_type": "MARKET",
+                }
+                for i, symbol in enumerate(symbols)
+            ]
+        )
+        for request in requests:
+            assert isinstance(request, OrderRequest)
             result = broker.place_order(request)
             assert result.accepted is True
 
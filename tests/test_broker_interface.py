@@ -25,7 +25,7 @@ class FakeBroker:
 
     def __init__(self):
         self._connected = False
-        self._positions = []
+        self._positions: dict[str, Position] = {}  # symbol -> position
         self._next_order_id = 1000
 
     def connect(self) -> None:
@@ -46,12 +46,17 @@ class FakeBroker:
             order_id = str(self._next_order_id)
             self._next_order_id += 1
 
-            # Add position for successful market order
+            # Add to (or open) the symbol's position for successful market order
             qty = request.qty if request.side == Side.BUY else -request.qty
-            position = Position(
-                symbol=request.symbol, qty=qty, avg_price=2500.0  # Mock price
-            )
-            self._positions.append(position)
+            current = self._positions.get(request.symbol)
+            if current is not None:
+                qty += current.qty
+            if qty:
+                self._positions[request.symbol] = Position(
+                    symbol=request.symbol, qty=qty, avg_price=2500.0  # Mock price
+                )
+            else:
+                del self._positions[request.symbol]
 
             return OrderResult(
                 accepted=True, broker_order_id=order_id, reason="Simulated execution"
@@ -67,7 +72,7 @@ class FakeBroker:
 
     def positions(self) -> list[Position]:
         """Return simulated positions"""
-        return self._positions.copy()
+        return list(self._positions.values())
 
 
 class TestBrokerGatewayInterface:
@@ -163,6 +168,28 @@ class TestBrokerGatewayInterface:
         assert position.qty == 0.1  # Long position
         assert position.avg_price > 0
 
+    def test_positions_net_per_symbol(self):
+        """Test repeated orders on a symbol update a single position"""
+        broker = FakeBroker()
+        broker.connect()
+
+        for i, side in enumerate([Side.BUY, Side.BUY, Side.SELL]):
+            broker.place_order(
+                OrderRequest(
+                    client_order_id=f"net-{i}", symbol="XAUUSD", side=side, qty=0.1
+                )
+            )
+        positions = broker.positions()
+        assert len(positions) == 1
+        assert positions[0].qty == pytest.approx(0.1)
+
+        broker.place_order(
+            OrderRequest(
+                client_order_id="net-3", symbol="XAUUSD", side=Side.SELL, qty=0.1
+            )
+        )
+        assert broker.positions() == []
+
     def test_order_cancellation(self):
         """Test order cancellation (returns False for fake broker)"""
         broker = FakeBroker()
@@ -219,6 +246,27 @@ class TestOrderRequestValidation:
                 # Missing price
             )
 
+    def test_batch_validates_every_row(self):
+        """Test that batch construction applies the per-order validators"""
+        rows = [
+            {"client_order_id": "b-1", "symbol": "EURUSD", "side": "BUY", "qty": 1.0},
+            {
+                "client_order_id": "b-2",
+                "symbol": "GBPUSD",
+                "side": "SELL",
+                "qty": 0.5,
+                "order_type": "LIMIT",
+                "price": 1.25,
+            },
+        ]
+        requests = OrderRequest.batch(rows)
+        assert [r.client_order_id for r in requests] == ["b-1", "b-2"]
+        assert requests[1].order_type == OrderType.LIMIT
+
+        del rows[1]["price"]
+        with pytest.raises(ValueError, match="LIMIT orders require a price"):
+            OrderRequest.batch(rows)
+
     def test_invalid_quantity(self):
         """Test that quantity must be positive"""
         from pydantic import ValidationError
@@ -252,6 +300,16 @@ class TestPositionModel:
         assert position.is_short is True
         assert position.abs_qty == 1.0
 
+    def test_position_is_frozen_and_slotted(self):
+        """Test that positions are immutable and carry no instance dict"""
+        import dataclasses
+
+        position = Position(symbol="XAUUSD", qty=0.5, avg_price=2500.0)
+
+        assert not hasattr(position, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            position.qty = 1.0
+
 
 class TestOrderResultValidation:
     """Test OrderResult model validation"""
@@ -3,7 +3,6 @@ Tests for Dashboard Authentication System (Prompt-28)
 Tests JWT authentication, RBAC, token refresh, and audit logging.
 """
 
-import json
 import logging
 import sqlite3
 import tempfile
@@ -11,9 +10,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from dashboard import auth
 from dashboard.app import app
 from dashboard.auth import (
     create_access_token,
@@ -41,6 +42,23 @@ class TestAuthCore:
         # Wrong password should fail
         assert not verify_password("wrong_password", hashed)
 
+    def test_password_hashing_cost_profile(self, monkeypatch):
+        """Test the KDF follows AUTH_KDF_PROFILE and bcrypt uses BCRYPT_ROUNDS"""
+        monkeypatch.setenv("AUTH_KDF_PROFILE", "test")
+        test_hash = hash_password("pw")
+        assert test_hash.startswith("sha256$")
+        assert verify_password("pw", test_hash)
+
+        # The _fast_bcrypt fixture lowers the production cost of 12 to 4
+        monkeypatch.delenv("AUTH_KDF_PROFILE")
+        production_hash = hash_password("pw")
+        assert production_hash.startswith("$2b$04$")
+        assert verify_password("pw", production_hash)
+        assert not verify_password("pw", test_hash)
+
+        monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 5)
+        assert hash_password("pw").startswith("$2b$05$")
+
     def test_jwt_token_creation(self):
         """Test JWT token creation and validation"""
         user_id = "test_user_123"
@@ -72,7 +90,8 @@ class TestAuthCore:
 
         # Create token
         token = create_access_token(user_id, roles)
-        payload = jwt.decode(token, "test_secret", algorithms=["HS256"])
+        # Only the timing claims are checked, so skip signature verification
+        payload = jwt.get_unverified_claims(token)
 
         # Check expiration is set correctly
         exp_time = datetime.fromtimestamp(payload["exp"])
@@ -83,59 +102,55 @@ class TestAuthCore:
         assert 14 <= time_diff.total_seconds() / 60 <= 16  # Allow some variance
 
 
-class TestUserStore:
-    """Test user store functionality"""
+@pytest.fixture
+def user_store():
+    """Private in-memory user store, so tests share no database state"""
+    return UserStore(db_path=":memory:")
 
-    def setup_method(self):
-        """Set up test database"""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_db.close()
-        self.user_store = UserStore(db_path=self.temp_db.name)
 
-    def teardown_method(self):
-        """Clean up test database"""
-        Path(self.temp_db.name).unlink(missing_ok=True)
+class TestUserStore:
+    """Test user store functionality"""
 
-    def test_create_user(self):
+    def test_create_user(self, user_store):
         """Test user creation"""
         email = "test@example.com"
         password = "test_password"
         roles = ["viewer", "trader"]
 
-        user_id = self.user_store.create_user(email, password, roles)
+        user_id = user_store.create_user(email, password, roles)
 
         assert isinstance(user_id, str)
         assert len(user_id) == 36  # UUID length
 
         # Verify user was created
-        user = self.user_store.get_user_by_email(email)
+        user = user_store.get_user_by_email(email)
         assert user is not None
         assert user["email"] == email
         assert user["roles"] == roles
 
-    def test_duplicate_email_rejected(self):
+    def test_duplicate_email_rejected(self, user_store):
         """Test that duplicate emails are rejected"""
         email = "test@example.com"
         password = "test_password"
 
         # Create first user
-        self.user_store.create_user(email, password)
+        user_store.create_user(email, password)
 
         # Attempt to create duplicate should fail
         with pytest.raises(ValueError, match="already exists"):
-            self.user_store.create_user(email, password)
+            user_store.create_user(email, password)
 
-    def test_user_authentication(self):
+    def test_user_authentication(self, user_store):
         """Test user authentication"""
         email = "test@example.com"
         password = "test_password"
         roles = ["trader"]
 
         # Create user
-        user_id = self.user_store.create_user(email, password, roles)
+        user_id = user_store.create_user(email, password, roles)
 
         # Test successful authentication
-        user = self.user_store.authenticate_user(email, password)
+        user = user_store.authenticate_user(email, password)
         assert user is not None
         assert user["id"] == user_id
         assert user["email"] == email
@@ -143,97 +158,165 @@ class TestUserStore:
         assert user["last_login_ts"] is not None
 
         # Test failed authentication
-        assert self.user_store.authenticate_user(email, "wrong_password") is None
-        assert self.user_store.authenticate_user("wrong@email.com", password) is None
+        assert user_store.authenticate_user(email, "wrong_password") is None
+        assert user_store.authenticate_user("wrong@email.com", password) is None
 
-    def test_role_validation(self):
+    def test_role_validation(self, user_store):
         """Test role validation"""
         email = "test@example.com"
         password = "test_password"
 
         # Valid roles should work
-        user_id = self.user_store.create_user(
-            email, password, ["viewer", "trader", "admin"]
-        )
-        user = self.user_store.get_user_by_id(user_id)
+        user_id = user_store.create_user(email, password, ["viewer", "trader", "admin"])
+        user = user_store.get_user_by_id(user_id)
         assert set(user["roles"]) == {"viewer", "trader", "admin"}
 
         # Invalid roles should be rejected
         with pytest.raises(ValueError, match="Invalid roles"):
-            self.user_store.create_user("test2@example.com", password, ["invalid_role"])
+            user_store.create_user("test2@example.com", password, ["invalid_role"])
 
-    def test_update_user_roles(self):
+    def test_update_user_roles(self, user_store):
         """Test updating user roles"""
         email = "test@example.com"
         password = "test_password"
 
-        user_id = self.user_store.create_user(email, password, ["viewer"])
+        user_id = user_store.create_user(email, password, ["viewer"])
 
         # Update roles
-        success = self.user_store.update_user_roles(
-            user_id, ["viewer", "trader", "admin"]
-        )
+        success = user_store.update_user_roles(user_id, ["viewer", "trader", "admin"])
         assert success
 
         # Verify update
-        user = self.user_store.get_user_by_id(user_id)
+        user = user_store.get_user_by_id(user_id)
         assert set(user["roles"]) == {"viewer", "trader", "admin"}
 
-    def test_user_stats(self):
+    def test_bulk_create_is_all_or_nothing(self, user_store):
+        """Test a batch with a duplicate email creates no users"""
+        user_store.create_user("taken@example.com", "password")
+
+        with pytest.raises(ValueError, match="already exists"):
+            user_store.create_users_bulk(
+                [
+                    ("new@example.com", "password", None),
+                    ("taken@example.com", "password", None),
+                ]
+            )
+        assert user_store.get_user_by_email("new@example.com") is None
+
+    def test_connection_reused_per_thread(self, user_store):
+        """Test each thread keeps one connection and sees committed writes"""
+        import threading
+
+        user_store.create_user("first@example.com", "password")
+        with user_store._get_connection() as first:
+            pass
+        user_store.get_user_by_email("first@example.com")
+        with user_store._get_connection() as second:
+            assert second is first
+
+        found = []
+        thread = threading.Thread(
+            target=lambda: found.append(
+                user_store.get_user_by_email("first@example.com")
+            )
+        )
+        thread.start()
+        thread.join()
+        assert found[0]["email"] == "first@example.com"
+
+    def test_user_stats(self, user_store):
         """Test user statistics"""
-        # Create test users
-        self.user_store.create_user("user1@example.com", "password", ["viewer"])
-        self.user_store.create_user("user2@example.com", "password", ["trader"])
-        self.user_store.create_user("user3@example.com", "password", ["admin"])
+        # Create test users in one batch
+        user_ids = user_store.create_users_bulk(
+            [
+                ("user1@example.com", "password", ["viewer"]),
+                ("user2@example.com", "password", ["trader"]),
+                ("user3@example.com", "password", ["admin"]),
+            ]
+        )
+        assert len(set(user_ids)) == 3
+        assert user_store.authenticate_user("user2@example.com", "password")
 
-        stats = self.user_store.get_stats()
+        stats = user_store.get_stats()
 
         assert stats["total_users"] == 3
+        assert stats["recent_logins"] == 1
         assert "viewer" in stats["role_counts"]
         assert "trader" in stats["role_counts"]
         assert "admin" in stats["role_counts"]
 
 
-class TestDashboardAuth:
-    """Test dashboard authentication endpoints"""
+@pytest.fixture(scope="module")
+def dashboard_users():
+    """
+    User store with one viewer, trader and admin, hashed once per module.
 
-    def setup_method(self):
-        """Set up test client and user store"""
-        self.client = TestClient(app)
+    The accounts are read-only credentials, so tests share them instead of
+    paying for three password hashes per test.
+    """
+    temp_db = tempfile.NamedTemporaryFile(delete=False)
+    temp_db.close()
 
-        # Create temporary user database
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_db.close()
+    with pytest.MonkeyPatch.context() as mp:
+        # Keep the global user store out of the way while tests run
+        mp.setattr("dashboard.users._user_store", None)
 
-        # Patch user store to use temp database
-        self.user_store_patcher = patch("dashboard.users._user_store", None)
-        self.user_store_patcher.start()
+        user_store = UserStore(db_path=temp_db.name)
+        user_ids = user_store.create_users_bulk(
+            [
+                (f"{role}@example.com", "password", [role])
+                for role in ("viewer", "trader", "admin")
+            ]
+        )
+        yield (user_store, *user_ids, temp_db.name)
 
-        from dashboard.users import UserStore
+    Path(temp_db.name).unlink(missing_ok=True)
 
-        self.user_store = UserStore(db_path=self.temp_db.name)
 
-        # Create test users
-        self.viewer_id = self.user_store.create_user(
-            "viewer@example.com", "password", ["viewer"]
-        )
-        self.trader_id = self.user_store.create_user(
-            "trader@example.com", "password", ["trader"]
-        )
-        self.admin_id = self.user_store.create_user(
-            "admin@example.com", "password", ["admin"]
-        )
+@pytest.fixture(scope="module")
+def client():
+    """TestClient shared by the module's tests"""
+    return TestClient(app)
 
-    def teardown_method(self):
-        """Clean up"""
-        self.user_store_patcher.stop()
-        Path(self.temp_db.name).unlink(missing_ok=True)
 
-    @patch("dashboard.users.get_user_store")
-    def test_login_success(self, mock_get_user_store):
-        """Test successful login"""
-        mock_get_user_store.return_value = self.user_store
+@pytest.fixture(scope="module")
+def role_cookies(dashboard_users, client):
+    """Cookie jars from one login per role, shared by the access tests"""
+    user_store = dashboard_users[0]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("dashboard.users.get_user_store", lambda: user_store)
+        cookies = {
+            role: client.post(
+                "/auth/login",
+                data={"email": f"{role}@example.com", "password": "password"},
+            ).cookies
+            for role in ("viewer", "trader", "admin")
+        }
+    # Leave the shared client logged out
+    client.cookies.clear()
+    return cookies
+
+
+class TestDashboardAuth:
+    """Test dashboard authentication endpoints"""
 
+    @pytest.fixture(autouse=True)
+    def _client(self, dashboard_users, client, monkeypatch):
+        """Shared test client, with an empty cookie jar, over the shared store"""
+        client.cookies.clear()
+        self.client = client
+        (
+            self.user_store,
+            self.viewer_id,
+            self.trader_id,
+            self.admin_id,
+            self.temp_db_path,
+        ) = dashboard_users
+        monkeypatch.setattr("dashboard.users.get_user_store", lambda: self.user_store)
+
+    def test_login_success(self):
+        """Test successful login"""
         response = self.client.post(
             "/auth/login", data={"email": "viewer@example.com", "password": "password"}
         )
@@ -246,11 +329,8 @@ class TestDashboardAuth:
         assert "access" in response.cookies
         assert "refresh" in response.cookies
 
-    @patch("dashboard.users.get_user_store")
-    def test_login_failure(self, mock_get_user_store):
+    def test_login_failure(self):
         """Test failed login"""
-        mock_get_user_store.return_value = self.user_store
-
         response = self.client.post(
             "/auth/login",
             data={"email": "viewer@example.com", "password": "wrong_password"},
@@ -259,16 +339,10 @@ class TestDashboardAuth:
         assert response.status_code == 401
         assert "access" not in response.cookies
 
-    @patch("dashboard.users.get_user_store")
-    def test_protected_route_access(self, mock_get_user_store):
+    def test_protected_route_access(self, role_cookies):
         """Test access to protected routes with different roles"""
-        mock_get_user_store.return_value = self.user_store
-
-        # Login as viewer
-        login_response = self.client.post(
-            "/auth/login", data={"email": "viewer@example.com", "password": "password"}
-        )
-        cookies = login_response.cookies
+        # Logged in as viewer
+        cookies = role_cookies["viewer"]
 
         # Should be able to access overview (requires viewer)
         response = self.client.get("/", cookies=cookies)
@@ -282,16 +356,10 @@ class TestDashboardAuth:
         response = self.client.get("/admin", cookies=cookies)
         assert response.status_code == 403
 
-    @patch("dashboard.users.get_user_store")
-    def test_role_based_access(self, mock_get_user_store):
+    def test_role_based_access(self, role_cookies):
         """Test role-based access control"""
-        mock_get_user_store.return_value = self.user_store
-
         # Test trader access
-        login_response = self.client.post(
-            "/auth/login", data={"email": "trader@example.com", "password": "password"}
-        )
-        trader_cookies = login_response.cookies
+        trader_cookies = role_cookies["trader"]
 
         # Trader should access viewer and trader routes
         assert self.client.get("/", cookies=trader_cookies).status_code == 200
@@ -301,21 +369,15 @@ class TestDashboardAuth:
         assert self.client.get("/admin", cookies=trader_cookies).status_code == 403
 
         # Test admin access
-        login_response = self.client.post(
-            "/auth/login", data={"email": "admin@example.com", "password": "password"}
-        )
-        admin_cookies = login_response.cookies
+        admin_cookies = role_cookies["admin"]
 
         # Admin should access all routes
         assert self.client.get("/", cookies=admin_cookies).status_code == 200
         assert self.client.get("/orders", cookies=admin_cookies).status_code == 200
         assert self.client.get("/admin", cookies=admin_cookies).status_code == 200
 
-    @patch("dashboard.users.get_user_store")
-    def test_token_refresh(self, mock_get_user_store):
+    def test_token_refresh(self):
         """Test token refresh functionality"""
-        mock_get_user_store.return_value = self.user_store
-
         # Login to get tokens
         login_response = self.client.post(
             "/auth/login", data={"email": "viewer@example.com", "password": "password"}
@@ -335,16 +397,10 @@ class TestDashboardAuth:
         # Access token should be different (rotated)
         assert new_access != original_access
 
-    @patch("dashboard.users.get_user_store")
-    def test_logout(self, mock_get_user_store):
+    def test_logout(self, role_cookies):
         """Test logout functionality"""
-        mock_get_user_store.return_value = self.user_store
-
-        # Login first
-        login_response = self.client.post(
-            "/auth/login", data={"email": "viewer@example.com", "password": "password"}
-        )
-        cookies = login_response.cookies
+        # Logged in as viewer; copy the jar so the shared one is untouched
+        cookies = httpx.Cookies(role_cookies["viewer"])
 
         # Verify access works
         assert self.client.get("/", cookies=cookies).status_code == 200
@@ -374,32 +430,48 @@ class TestDashboardAuth:
 class TestAuditLogging:
     """Test audit logging functionality"""
 
-    def setup_method(self):
-        """Set up test environment"""
-        self.temp_log_dir = tempfile.mkdtemp()
-        self.original_cwd = Path.cwd()
+    @pytest.fixture(autouse=True)
+    def _audit_file_sink(self, monkeypatch):
+        """Re-enable the audit file that conftest turns off for the suite"""
+        monkeypatch.delenv("DASHBOARD_AUDIT_SINK", raising=False)
 
-    def teardown_method(self):
-        """Clean up"""
-        import shutil
+    @patch("dashboard.auth.logger")
+    def test_audit_logging(self, mock_logger, monkeypatch):
+        """Test that audit events are logged"""
+        entries = []
+        monkeypatch.setattr("dashboard.auth._audit_sink", entries.append)
+
+        from dashboard.auth import log_audit_event
+
+        log_audit_event(
+            "test_event",
+            user_id="test_user",
+            details={"key": "value"},
+            success=True,
+        )
 
-        shutil.rmtree(self.temp_log_dir, ignore_errors=True)
+        assert len(entries) == 1
+        entry = dict(entries[0])
+        assert isinstance(entry.pop("timestamp"), str)
+        assert entry == {
+            "event_type": "test_event",
+            "user_id": "test_user",
+            "success": True,
+            "details": {"key": "value"},
+            "severity": "INFO",
+        }
+        mock_logger.info.assert_called_once()
 
     @patch("dashboard.auth.logger")
-    def test_audit_logging(self, mock_logger):
-        """Test that audit events are logged"""
+    def test_audit_file_sink(self, mock_logger):
+        """Test the default sink appends one JSON line to the audit file"""
         with patch("os.makedirs"), patch("builtins.open", create=True) as mock_open:
             mock_file = MagicMock()
             mock_open.return_value.__enter__.return_value = mock_file
 
             from dashboard.auth import log_audit_event
 
-            log_audit_event(
-                "test_event",
-                user_id="test_user",
-                details={"key": "value"},
-                success=True,
-            )
+            log_audit_event("test_event", user_id="test_user")
 
             # Verify file was opened for append
             mock_open.assert_called_once()
@@ -407,16 +479,24 @@ class TestAuditLogging:
             assert "logs/audit-" in args[0]
             assert "a" in args[1]
 
-            # Verify JSON was written
+            # Verify one JSON line was written
             mock_file.write.assert_called_once()
             written_data = mock_file.write.call_args[0][0]
+            assert written_data.endswith("}\n")
+            assert '"event_type": "test_event"' in written_data
+
+    @patch("dashboard.auth.logger")
+    def test_null_audit_sink(self, mock_logger, monkeypatch):
+        """Test DASHBOARD_AUDIT_SINK=null logs the event without file I/O"""
+        monkeypatch.setenv("DASHBOARD_AUDIT_SINK", "null")
+
+        with patch("builtins.open", create=True) as mock_open:
+            from dashboard.auth import log_audit_event
+
+            log_audit_event("test_event", user_id="test_user")
 
-            # Parse the JSON
-            log_entry = json.loads(written_data.strip())
-            assert log_entry["event_type"] == "test_event"
-            assert log_entry["user_id"] == "test_user"
-            assert log_entry["success"] is True
-            assert log_entry["details"]["key"] == "value"
+        mock_open.assert_not_called()
+        mock_logger.info.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -2,11 +2,10 @@
 Tests for EventBus implementation - publish/subscribe functionality
 """
 
-from unittest.mock import Mock
-
 import pytest
 
 from core.events import EventBus, RiskApproved, SignalDetected, Validated
+from tests.fixtures.handlers import RecordingHandler
 
 
 class TestEventBus:
@@ -15,7 +14,7 @@ class TestEventBus:
     def test_subscribe_and_publish(self):
         """Test basic subscribe/publish flow"""
         bus = EventBus()
-        handler_mock = Mock()
+        handler_mock = RecordingHandler()
 
         # Subscribe handler
         bus.subscribe(SignalDetected, handler_mock)
@@ -32,9 +31,9 @@ class TestEventBus:
     def test_multiple_handlers_for_same_event(self):
         """Test multiple handlers can subscribe to same event type"""
         bus = EventBus()
-        handler1 = Mock()
-        handler2 = Mock()
-        handler3 = Mock()
+        handler1 = RecordingHandler()
+        handler2 = RecordingHandler()
+        handler3 = RecordingHandler()
 
         # Subscribe multiple handlers
         bus.subscribe(SignalDetected, handler1)
@@ -55,9 +54,9 @@ class TestEventBus:
     def test_different_event_types(self):
         """Test handlers only receive events of subscribed type"""
         bus = EventBus()
-        signal_handler = Mock()
-        validated_handler = Mock()
-        risk_handler = Mock()
+        signal_handler = RecordingHandler()
+        validated_handler = RecordingHandler()
+        risk_handler = RecordingHandler()
 
         # Subscribe to different event types
         bus.subscribe(SignalDetected, signal_handler)
@@ -110,7 +109,7 @@ class TestEventBus:
         def failing_handler(event):
             raise ValueError("Handler failed")
 
-        working_handler = Mock()
+        working_handler = RecordingHandler()
 
         # Subscribe handlers
         bus.subscribe(SignalDetected, failing_handler)
@@ -134,8 +133,8 @@ class TestEventBus:
     def test_unsubscribe(self):
         """Test handler unsubscription"""
         bus = EventBus()
-        handler1 = Mock()
-        handler2 = Mock()
+        handler1 = RecordingHandler()
+        handler2 = RecordingHandler()
 
         # Subscribe handlers
         bus.subscribe(SignalDetected, handler1)
@@ -155,10 +154,29 @@ class TestEventBus:
         handler1.assert_not_called()
         handler2.assert_called_once_with(signal)
 
+    def test_subscribe_during_publish(self):
+        """Test handlers added mid-dispatch run from the next publish on"""
+        bus = EventBus()
+        late_handler = RecordingHandler()
+
+        def subscribing_handler(event):
+            bus.subscribe(SignalDetected, late_handler)
+
+        bus.subscribe(SignalDetected, subscribing_handler)
+        signal = SignalDetected(
+            symbol="XAUUSD", side="BUY", strength=0.7, strategy_id="test"
+        )
+
+        bus.publish(signal)
+        late_handler.assert_not_called()
+
+        bus.publish(signal)
+        late_handler.assert_called_once_with(signal)
+
     def test_unsubscribe_nonexistent_handler(self):
         """Test unsubscribing handler that wasn't subscribed"""
         bus = EventBus()
-        handler = Mock()
+        handler = RecordingHandler()
 
         # Try to unsubscribe without subscribing first
         result = bus.unsubscribe(SignalDetected, handler)
@@ -167,8 +185,8 @@ class TestEventBus:
     def test_get_handlers(self):
         """Test getting handlers for event type"""
         bus = EventBus()
-        handler1 = Mock()
-        handler2 = Mock()
+        handler1 = RecordingHandler()
+        handler2 = RecordingHandler()
 
         # Initially no handlers
         handlers = bus.get_handlers(SignalDetected)
@@ -189,10 +207,40 @@ class TestEventBus:
         original_handlers = bus.get_handlers(SignalDetected)
         assert len(original_handlers) == 2  # Original not affected
 
+    def test_publish_many(self):
+        """Test batch publishing delivers every event in order"""
+        bus = EventBus()
+        received = []
+        bus.subscribe(SignalDetected, received.append)
+        bus.subscribe(Validated, received.append)
+
+        signal = SignalDetected(
+            symbol="XAUUSD", side="BUY", strength=0.8, strategy_id="test"
+        )
+        validated = Validated(symbol="XAUUSD", side="BUY")
+        bus.publish_many([signal, validated])
+
+        assert received == [signal, validated]
+        assert bus.get_stats()["events_published"] == 2
+
+    def test_has_subscribers(self):
+        """Test subscriber presence check per event type"""
+        bus = EventBus()
+        handler = RecordingHandler()
+
+        assert not bus.has_subscribers(SignalDetected)
+
+        bus.subscribe(SignalDetected, handler)
+        assert bus.has_subscribers(SignalDetected)
+        assert not bus.has_subscribers(Validated)
+
+        bus.unsubscribe(SignalDetected, handler)
+        assert not bus.has_subscribers(SignalDetected)
+
     def test_clear(self):
         """Test clearing all handlers and stats"""
         bus = EventBus()
-        handler = Mock()
+        handler = RecordingHandler()
 
         # Subscribe and publish to generate stats
         bus.subscribe(SignalDetected, handler)
@@ -213,11 +261,31 @@ class TestEventBus:
         assert bus.get_handlers(SignalDetected) == []
         assert bus.get_stats()["events_published"] == 0
 
+    def test_stats_after_clear(self):
+        """Test stats count through clear() from dispatchers on either side of it"""
+        bus = EventBus()
+        handler = RecordingHandler()
+        signal = SignalDetected(
+            symbol="XAUUSD", side="BUY", strength=0.8, strategy_id="test"
+        )
+
+        bus.subscribe(SignalDetected, handler)
+        bus.clear()
+        bus.publish(signal)
+        handler.assert_not_called()
+
+        bus.subscribe(SignalDetected, handler)
+        bus.publish(signal)
+
+        stats = bus.get_stats()
+        assert stats["events_published"] == 2
+        assert stats["handlers_called"] == 1
+
     def test_stats_tracking(self):
         """Test event bus statistics tracking"""
         bus = EventBus()
-        handler1 = Mock()
-        handler2 = Mock()
+        handler1 = RecordingHandler()
+        handler2 = RecordingHandler()
 
         def failing_handler(event):
             raise Exception("Failed")
@@ -247,8 +315,8 @@ class TestEventBus:
         assert repr(bus) == "EventBus({})"
 
         # With handlers
-        handler1 = Mock()
-        handler2 = Mock()
+        handler1 = RecordingHandler()
+        handler2 = RecordingHandler()
         bus.subscribe(SignalDetected, handler1)
         bus.subscribe(SignalDetected, handler2)
         bus.subscribe(Validated, handler1)
@@ -263,8 +331,8 @@ class TestEventBus:
         bus = EventBus()
         assert len(bus) == 0
 
-        handler1 = Mock()
-        handler2 = Mock()
+        handler1 = RecordingHandler()
+        handler2 = RecordingHandler()
 
         bus.subscribe(SignalDetected, handler1)
         assert len(bus) == 1
@@ -9,13 +9,33 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 
 from config.settings import ApplicationSettings, FeedKind, SlippageKind
-from feeds import BacktestFeed, Candle, FeedWithSlippage, LiveMT5Feed, create_feed
-from feeds.atr import calculate_atr, fetch_atr_from_feed
+from feeds import (
+    BacktestFeed,
+    Candle,
+    CandleBatch,
+    FeedWithSlippage,
+    LiveMT5Feed,
+    create_feed,
+)
+from feeds.atr import NUMBA_AVAILABLE, calculate_atr, fetch_atr_from_feed
 from models.slippage import FixedPipsSlippage, PercentOfATRSlippage
 
+# Record layout of MetaTrader5.copy_rates_from_pos results
+MT5_RATES_DTYPE = [
+    ("time", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("tick_volume", "<u8"),
+    ("spread", "<i4"),
+    ("real_volume", "<u8"),
+]
+
 
 class TestCandle(unittest.TestCase):
     """Test Candle data model"""
@@ -53,6 +73,44 @@ class TestCandle(unittest.TestCase):
             candle.close = 1960.0  # Should fail due to frozen=True
 
 
+class TestCandleBatch(unittest.TestCase):
+    """Test column-oriented candle container"""
+
+    def setUp(self):
+        """Build a three-candle batch from a DataFrame"""
+        self.batch = CandleBatch.from_frame(
+            pd.DataFrame(
+                {
+                    "ts": [1672531200, 1672533000, 1672534800],
+                    "open": [1950.0, 1952.0, 1954.0],
+                    "high": [1955.0, 1957.0, 1959.0],
+                    "low": [1945.0, 1948.0, 1950.0],
+                    "close": [1952.0, 1954.0, 1956.0],
+                    "volume": [1000, 1200, 1100],
+                }
+            )
+        )
+
+    def test_indexing_returns_candles(self):
+        """Test integer indexing builds Candle objects"""
+        self.assertEqual(len(self.batch), 3)
+        self.assertIsInstance(self.batch[0], Candle)
+        self.assertEqual(self.batch[0].ts, 1672531200)
+        self.assertEqual(self.batch[-1].close, 1956.0)
+        self.assertEqual(self.batch[1].volume, 1200.0)
+
+        with self.assertRaises(IndexError):
+            self.batch[3]
+
+    def test_slicing_and_iteration(self):
+        """Test slices stay batches and iteration yields candles in order"""
+        recent = self.batch[-2:]
+
+        self.assertIsInstance(recent, CandleBatch)
+        self.assertEqual([c.close for c in recent], [1954.0, 1956.0])
+        self.assertEqual(list(recent)[0], self.batch[1])
+
+
 class TestSlippageModels(unittest.TestCase):
     """Test slippage model implementations"""
 
@@ -112,6 +170,19 @@ class TestSlippageModels(unittest.TestCase):
         with self.assertRaises(ValueError):
             slippage.apply("INVALID", 1950.0)
 
+    def test_fixed_pips_slippage_many(self):
+        """Test batch slippage matches per-fill apply"""
+        slippage = FixedPipsSlippage(pips=2.0, pip_size=0.1)
+        sides = np.array(["BUY", "SELL", "BUY"])
+        prices = np.array([1950.0, 1950.0, 1.2345])
+
+        slipped = slippage.apply_many(sides, prices)
+
+        expected = [slippage.apply(s, p) for s, p in zip(sides, prices)]
+        self.assertEqual(slipped.tolist(), expected)
+        with self.assertRaises(ValueError):
+            slippage.apply_many(np.array(["BUY", "HOLD"]), prices[:2])
+
 
 class TestBacktestFeed(unittest.TestCase):
     """Test backtest feed implementation"""
@@ -189,6 +260,27 @@ class TestBacktestFeed(unittest.TestCase):
         # Verify cache is working
         self.assertIn("XAUUSD_M30", feed._cache)
 
+        # Both requests are read-only views of the same cached columns
+        self.assertTrue(np.shares_memory(candles1.close, candles2.close))
+        self.assertEqual(candles1[0], candles2[10])
+        with self.assertRaises(ValueError):
+            candles2.close[0] = 0.0
+
+    def test_csv_sidecar_reused(self):
+        """Test a later feed loads the typed sidecar instead of parsing the CSV"""
+        self._create_test_csv("XAUUSD_M30.csv", 50)
+
+        first = BacktestFeed(self.settings, data_dir=str(self.test_data_dir))
+        candles1 = first.get_ohlcv("XAUUSD", "M30", 20)
+        self.assertTrue((self.test_data_dir / "XAUUSD_M30.csv.npz").exists())
+
+        second = BacktestFeed(self.settings, data_dir=str(self.test_data_dir))
+        with patch("feeds.backtest.pd.read_csv") as mock_read_csv:
+            candles2 = second.get_ohlcv("XAUUSD", "M30", 20)
+
+        mock_read_csv.assert_not_called()
+        self.assertEqual(list(candles2), list(candles1))
+
     def test_get_latest_candle(self):
         """Test getting latest candle"""
         self._create_test_csv("XAUUSD_M30.csv", 50)
@@ -235,25 +327,14 @@ class TestLiveMT5Feed(unittest.TestCase):
         """Test successful OHLCV data fetch"""
         mock_initialize.return_value = True
 
-        # Mock MT5 rates data
-        mock_rates = [
-            {
-                "time": 1672531200,
-                "open": 1950.0,
-                "high": 1955.0,
-                "low": 1945.0,
-                "close": 1952.0,
-                "tick_volume": 1000,
-            },
-            {
-                "time": 1672533000,
-                "open": 1952.0,
-                "high": 1957.0,
-                "low": 1948.0,
-                "close": 1954.0,
-                "tick_volume": 1200,
-            },
-        ]
+        # Mock MT5 rates data (structured array, as copy_rates_from_pos returns)
+        mock_rates = np.array(
+            [
+                (1672531200, 1950.0, 1955.0, 1945.0, 1952.0, 1000, 20, 0),
+                (1672533000, 1952.0, 1957.0, 1948.0, 1954.0, 1200, 18, 0),
+            ],
+            dtype=MT5_RATES_DTYPE,
+        )
         mock_copy_rates.return_value = mock_rates
 
         feed = LiveMT5Feed(self.settings)
@@ -263,6 +344,8 @@ class TestLiveMT5Feed(unittest.TestCase):
         self.assertIsInstance(candles[0], Candle)
         self.assertEqual(candles[0].ts, 1672531200)
         self.assertEqual(candles[0].close, 1952.0)
+        self.assertEqual(candles[1].volume, 1200.0)
+        self.assertTrue(candles.close.flags.c_contiguous)
 
     def test_get_ohlcv_failure(self, mock_copy_rates, mock_initialize):
         """Test OHLCV data fetch failure"""
@@ -322,6 +405,23 @@ class TestATRCalculation(unittest.TestCase):
         self.assertGreater(atr, 0)
         self.assertIsInstance(atr, float)
 
+    def test_atr_batch_matches_list(self):
+        """Test a CandleBatch gives the same ATR as the equivalent list"""
+        candles = self._create_test_candles(30)
+        batch = CandleBatch.from_frame(pd.DataFrame([c.model_dump() for c in candles]))
+
+        self.assertEqual(calculate_atr(batch, period=14), calculate_atr(candles, 14))
+
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_atr_numba_matches_pandas(self):
+        """Test the compiled EMA kernel reproduces pandas exactly"""
+        from feeds._atr_numba import ewm_last
+
+        tr = np.array([c.high - c.low for c in self._create_test_candles(50)])
+        for period in (2, 14, 30):
+            expected = pd.Series(tr).ewm(span=period, adjust=False).mean().iloc[-1]
+            self.assertEqual(ewm_last(tr, period), expected)
+
     def test_atr_insufficient_data(self):
         """Test ATR calculation with insufficient data"""
         candles = self._create_test_candles(10)
@@ -424,6 +524,7 @@ class TestFeedWithSlippage(unittest.TestCase):
         sell_cost = feed_wrapper.get_spread_cost("SELL")
         expected_sell_cost = -expected_buy_cost  # -0.25
         self.assertEqual(sell_cost, expected_sell_cost)
+        self.assertEqual(feed_wrapper.get_spread_cost("buy"), expected_buy_cost)
 
     @patch("feeds.factory.create_feed")
     @patch("feeds.factory.create_slippage_model")
@@ -439,6 +540,12 @@ class TestFeedWithSlippage(unittest.TestCase):
         self.assertEqual(feed_wrapper.get_commission_cost(0.5), 1.0)
         self.assertEqual(feed_wrapper.get_commission_cost(-1.5), 3.0)  # Absolute value
 
+        # Batch variant matches the scalar one
+        lots = np.array([1.0, 0.5, -1.5])
+        self.assertEqual(
+            feed_wrapper.get_commission_cost_many(lots).tolist(), [2.0, 1.0, 3.0]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
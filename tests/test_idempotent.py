@@ -2,6 +2,7 @@
 Tests for IdempotentOrderExecutor - reliability and deduplication
 """
 
+import hashlib
 import sqlite3
 import tempfile
 from pathlib import Path
@@ -81,6 +82,12 @@ class TestMakeCoid:
         ids = [coid1, coid2, coid3, coid4, coid5]
         assert len(set(ids)) == 5  # All unique
 
+    def test_ids_stable_across_releases(self):
+        """Test IDs match the stored SHA256-prefix format of earlier releases"""
+        assert make_coid("XAUUSD", "BUY", "ma_cross", "20250907_1510") == (
+            hashlib.sha256(b"XAUUSD_BUY_ma_cross_20250907_1510").hexdigest()[:24]
+        )
+
     def test_valid_characters(self):
         """Test that generated IDs contain only valid hex characters"""
         coid = make_coid("XAUUSD", "BUY", "test", "20250907_1510")
@@ -101,18 +108,19 @@ class TestIdempotentOrderExecutor:
         with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
             db_path = f.name
         yield db_path
-        # Cleanup - force close any remaining connections
-        try:
-            Path(db_path).unlink(missing_ok=True)
-        except PermissionError:
-            # On Windows, SQLite files may be locked
-            import time
-
-            time.sleep(0.1)  # Brief delay
+        # Cleanup the database and its write-ahead log files
+        for path in (db_path, db_path + "-wal", db_path + "-shm"):
             try:
-                Path(db_path).unlink(missing_ok=True)
+                Path(path).unlink(missing_ok=True)
             except PermissionError:
-                pass  # Ignore cleanup failures in tests
+                # On Windows, SQLite files may be locked
+                import time
+
+                time.sleep(0.1)  # Brief delay
+                try:
+                    Path(path).unlink(missing_ok=True)
+                except PermissionError:
+                    pass  # Ignore cleanup failures in tests
 
     @pytest.fixture
     def fake_broker(self):
@@ -122,7 +130,9 @@ class TestIdempotentOrderExecutor:
     @pytest.fixture
     def executor(self, fake_broker, temp_db):
         """Create executor with fake broker and temp database"""
-        return IdempotentOrderExecutor(fake_broker, temp_db)
+        executor = IdempotentOrderExecutor(fake_broker, temp_db)
+        yield executor
+        executor.close()
 
     def test_database_initialization(self, fake_broker, temp_db):
         """Test that database is created and initialized properly"""
@@ -145,6 +155,9 @@ class TestIdempotentOrderExecutor:
             )
             assert cursor.fetchone() is not None
 
+            # Executor switched the database to write-ahead logging
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
         # Explicitly close executor's connection for cleanup
         executor.close()
 
@@ -246,6 +259,40 @@ class TestIdempotentOrderExecutor:
         assert len(matching) == 1
         assert matching[0]["broker_order_id"] == broker_id
 
+    def test_recorded_ids_survive_restart(self, fake_broker, temp_db):
+        """Test a new executor's filter is warmed from the sent table"""
+        first = IdempotentOrderExecutor(fake_broker, temp_db, use_bloom=True)
+        first.record("test_coid_restart", "B1")
+        first.close()
+
+        executor = IdempotentOrderExecutor(fake_broker, temp_db, use_bloom=True)
+        assert executor.already_sent("test_coid_restart")
+        assert not executor.already_sent("test_coid_unseen")
+        executor.close()
+
+    @pytest.mark.parametrize("use_bloom", [False, True])
+    def test_shared_database_blocks_other_executors_orders(
+        self, fake_broker, temp_db, use_bloom
+    ):
+        """Test an order sent through one executor blocks it in another"""
+        first = IdempotentOrderExecutor(fake_broker, temp_db, use_bloom=use_bloom)
+        second = IdempotentOrderExecutor(fake_broker, temp_db, use_bloom=use_bloom)
+        request = OrderRequest(
+            client_order_id="test_coid_shared", symbol="XAUUSD", side=Side.BUY, qty=0.1
+        )
+
+        # First looks the ID up before the other executor sends it
+        assert not first.already_sent("test_coid_shared")
+        assert second.place(request).accepted is True
+
+        result = first.place(request)
+        assert result.accepted is False
+        assert result.reason == "DUPLICATE_COID"
+        assert fake_broker.call_count == 1
+
+        first.close()
+        second.close()
+
     def test_get_sent_orders(self, executor, fake_broker):
         """Test retrieval of sent order history"""
         # Initially no orders
@@ -8,13 +8,20 @@ This shows how to write tests that:
 4. Run real integration tests when MT5 is available locally
 """
 
+import importlib.util
+import sys
+import types
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from core.events.bus import EventBus
-from tests.conftest import mt5_available, skip_if_no_mt5
-from tests.fixtures.fake_broker import FakeBrokerAdapter
+from tests.conftest import _env_flag, mt5_available, skip_if_no_mt5
+from tests.fixtures.fake_broker import (
+    FakeBrokerAdapter,
+    FakeBrokerConnection,
+    Quote,
+)
 
 
 class TestMT5LessStrategy:
@@ -62,6 +69,103 @@ class TestMT5LessStrategy:
         positions = fake_broker.get_positions()
         assert isinstance(positions, list)  # Interface returns list
 
+    def test_fake_broker_pending_orders(self):
+        """Only uncancelled limit orders are reported as pending"""
+        connection = FakeBrokerConnection()
+        connection.submit_order("EURUSD", "buy", 0.1)
+        limit = connection.submit_order(
+            "EURUSD", "buy", 0.1, order_type="limit", price=1.09
+        )
+
+        assert [o["order_id"] for o in connection.get_orders()] == [limit["order_id"]]
+
+        assert connection.cancel_order(limit["order_id"])["success"]
+        assert connection.get_orders() == []
+
+    def test_fake_broker_deals_log(self):
+        """Deals recorded by fills round-trip through the NumPy deal log"""
+        connection = FakeBrokerConnection(EventBus())
+
+        results = [
+            connection.submit_order(symbol, side, 0.1)
+            for symbol, side in (("EURUSD", "buy"), ("USDJPY", "sell"))
+        ]
+
+        deals = connection.deals.to_dicts()
+        assert len(connection.deals) == 2
+        assert [d["order_id"] for d in deals] == [r["order_id"] for r in results]
+        assert [(d["symbol"], d["side"]) for d in deals] == [
+            ("EURUSD", "buy"),
+            ("USDJPY", "sell"),
+        ]
+        assert deals[0]["price"] == 1.0952
+        assert (
+            deals[0]["timestamp"]
+            == connection.orders[results[0]["order_id"]]["timestamp"]
+        )
+
+    def test_fake_broker_position_closes_exactly(self):
+        """Offsetting fills in 0.01 steps flatten the position with no residue"""
+        connection = FakeBrokerConnection(EventBus())
+
+        connection.submit_order("EURUSD", "buy", 0.1)
+        connection.submit_order("EURUSD", "buy", 0.2)
+        assert [p["volume"] for p in connection.get_positions()] == [0.3]
+
+        connection.submit_order("EURUSD", "sell", 0.3)
+        assert connection.get_positions() == []
+
+    def test_fake_broker_position_volume(self):
+        """Positions report volume in lots and off-step volumes are rejected"""
+        connection = FakeBrokerConnection()
+
+        for _ in range(3):
+            assert connection.submit_order("EURUSD", "buy", 0.1)["success"]
+        assert connection.positions["EURUSD"]["volume"] == 0.3
+        assert connection.get_positions()[0]["volume"] == 0.3
+
+        result = connection.submit_order("EURUSD", "sell", 0.125)
+        assert not result["success"]
+        assert result["retcode"] == 10014
+        assert connection.positions["EURUSD"]["volume"] == 0.3
+
+        assert connection.submit_order("EURUSD", "sell", 0.3)["success"]
+        assert connection.positions == {}
+
+    def test_fake_broker_symbol_info(self):
+        """Symbol info tracks market_data and callers get their own copy"""
+        connection = FakeBrokerConnection()
+
+        info = connection.get_symbol_info("EURUSD")
+        info["volume_min"] = 100.0
+        assert connection.get_symbol_info("EURUSD")["volume_min"] == 0.01
+        assert connection.submit_order("EURUSD", "buy", 0.1)["success"]
+
+        connection.market_data["EURUSD"] = Quote(bid=1.2, ask=1.2002, point=0.00001)
+        assert connection.get_symbol_info("EURUSD")["ask"] == 1.2002
+        del connection.market_data["EURUSD"]
+        assert connection.get_symbol_info("EURUSD") is None
+
+    def test_fake_broker_result_pool(self):
+        """Released submit_order results are recycled only when pooling is on"""
+        connection = FakeBrokerConnection(pool_enabled=True)
+
+        with connection.pooled_result(
+            connection.submit_order("EURUSD", "buy", 0.1)
+        ) as first:
+            assert first["success"]
+        assert first == {}
+
+        second = connection.submit_order("EURUSD", "sell", 0.1)
+        assert second is first
+        assert second["success"] and second["volume"] == 0.1
+
+        unpooled = FakeBrokerConnection()
+        result = unpooled.submit_order("EURUSD", "buy", 0.1)
+        unpooled.release_result(result)
+        assert result["success"]
+        assert unpooled.submit_order("EURUSD", "buy", 0.1) is not result
+
     @pytest.mark.mt5_unit
     def test_mt5_mock_functionality(self, mock_mt5):
         """
@@ -93,7 +197,7 @@ class TestMT5LessStrategy:
         rates = mock_mt5.copy_rates_from_pos("EURUSD", 1, 0, 10)
         assert rates is not None
         assert len(rates) == 10
-        assert all("open" in rate for rate in rates)
+        assert "open" in rates.dtype.names
 
         # Test order sending
         request = {
@@ -107,6 +211,19 @@ class TestMT5LessStrategy:
         result = mock_mt5.order_send(request)
         assert result["retcode"] == mock_mt5.TRADE_RETCODE_DONE
 
+    def test_live_feed_imports_with_mock(self, mock_mt5, monkeypatch):
+        """Test feeds.live_mt5 imports against MockMT5 and maps its timeframes"""
+        monkeypatch.setitem(sys.modules, "MetaTrader5", mock_mt5)
+
+        # Execute a private copy of the module so the imported one is untouched
+        spec = importlib.util.find_spec("feeds.live_mt5")
+        live_mt5 = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(live_mt5)
+
+        assert live_mt5._TIMEFRAME_MAP["M1"] == 1
+        assert live_mt5._TIMEFRAME_MAP["H1"] == 16385
+        assert live_mt5._TIMEFRAME_MAP["D1"] == 16408
+
     @pytest.mark.mt5_integration
     @skip_if_no_mt5("Requires actual MT5 connection for integration testing")
     def test_real_mt5_integration(self):
@@ -146,6 +263,11 @@ class TestMT5LessStrategy:
         finally:
             mt5.shutdown()
 
+    @pytest.mark.mt5_integration
+    def test_real_mt5_fixture_is_not_mock(self, real_mt5):
+        """Test real_mt5 yields the installed package, never MockMT5"""
+        assert isinstance(real_mt5, types.ModuleType)
+
     def test_conditional_mt5_import(self):
         """
         Test that shows how to handle conditional MT5 imports in application code.
@@ -172,6 +294,15 @@ class TestMT5LessStrategy:
             # This would be None in a real scenario without our fixture
             pass
 
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("true", True), ("1", True), ("false", False), ("0", False), ("", False)],
+    )
+    def test_ci_flag_parsing(self, monkeypatch, value, expected):
+        """Only truthy CI values count as running in CI"""
+        monkeypatch.setenv("CI", value)
+        assert _env_flag("CI") is expected
+
     @patch("adapters.mt5_broker.MT5Broker")
     def test_adapter_with_mock_injection(self, mock_broker_class):
         """
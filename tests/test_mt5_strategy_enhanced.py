@@ -9,6 +9,7 @@ This extends the existing MT5-less approach with:
 """
 
 import os
+import pickle
 import sys
 from typing import Any, Optional
 from unittest.mock import MagicMock, Mock, patch
@@ -212,6 +213,13 @@ class TestEnhancedMT5Strategy:
         assert jpy_symbol.digits == 3
         assert jpy_symbol.point == 0.001
 
+        # Majors are served from prebuilt module-level records
+        from tests.fixtures.mock_mt5 import EURUSD_MOCK, USDJPY_MOCK
+
+        assert symbol_info is EURUSD_MOCK
+        assert jpy_symbol is USDJPY_MOCK
+        assert mock_mt5.symbol_info("XAUUSD").name == "XAUUSD"
+
         # Test symbol selection
         assert mock_mt5.symbol_select("EURUSD", True)
         assert mock_mt5.symbol_select("NONEXISTENT", False)
@@ -219,11 +227,8 @@ class TestEnhancedMT5Strategy:
         # Test historical data
         rates = mock_mt5.copy_rates_from_pos("EURUSD", 1, 0, 10)
         assert len(rates) == 10
+        assert {"open", "high", "low", "close"} <= set(rates.dtype.names)
         for rate in rates:
-            assert "open" in rate
-            assert "high" in rate
-            assert "low" in rate
-            assert "close" in rate
             assert rate["high"] >= rate["open"]
             assert rate["high"] >= rate["close"]
             assert rate["low"] <= rate["open"]
@@ -273,6 +278,27 @@ class TestEnhancedMT5Strategy:
         assert not mock_mt5.initialized
         assert not mock_mt5.connected
 
+    @pytest.mark.mt5_unit
+    def test_mock_mt5_pickle_roundtrip(self, mock_mt5):
+        """MT5 mock survives pickling (pytest-xdist workers)"""
+        mock_mt5.symbol_info("EURUSD")  # Populate caches
+
+        restored = pickle.loads(pickle.dumps(mock_mt5))
+
+        assert type(restored) is type(mock_mt5)
+        assert restored.connected
+        assert restored.initialized
+        assert restored.symbol_info("EURUSD").name == "EURUSD"
+
+    @pytest.mark.mt5_unit
+    def test_mock_mt5_retcode_aliases(self, mock_mt5):
+        """Flat TRADE_RETCODE_* constants alias TradeRetcode members"""
+        from tests.fixtures.mock_mt5 import TradeRetcode
+
+        for member in TradeRetcode:
+            assert getattr(mock_mt5, f"TRADE_RETCODE_{member.name}") is member
+        assert mock_mt5.TRADE_RETCODE_DONE == 10009
+
     def test_error_handling_patterns(self):
         """Test error handling patterns for MT5-less environments"""
 
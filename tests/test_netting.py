@@ -283,12 +283,24 @@ class TestIdempotentExecutorNetting:
         self.mock_broker.place_order.return_value = OrderResult(
             accepted=True, broker_order_id="BR123", reason="OK"
         )
+        self._executors = []
 
-    def test_executor_netting_initialization(self):
-        """Test executor initializes with netting configuration."""
+    def teardown_method(self):
+        """Close executors created by the test."""
+        for executor in self._executors:
+            executor.close()
+
+    def _make_executor(self):
+        """Create an executor on an in-memory database, closed after the test."""
         executor = IdempotentOrderExecutor(
             broker=self.mock_broker, db_path=":memory:", settings=self.mock_settings
         )
+        self._executors.append(executor)
+        return executor
+
+    def test_executor_netting_initialization(self):
+        """Test executor initializes with netting configuration."""
+        executor = self._make_executor()
 
         assert executor.position_aggregator.netting_mode == NettingMode.NETTING
         assert executor.position_aggregator.reduce_rule == ReduceRule.FIFO
@@ -297,9 +309,7 @@ class TestIdempotentExecutorNetting:
         """Test executor passes through orders in hedging mode."""
         self.mock_settings.trading.netting_mode = "HEDGING"
 
-        executor = IdempotentOrderExecutor(
-            broker=self.mock_broker, db_path=":memory:", settings=self.mock_settings
-        )
+        executor = self._make_executor()
 
         # Mock get_existing_positions to return empty list
         executor._get_existing_positions = MagicMock(return_value=[])
@@ -326,9 +336,7 @@ class TestIdempotentExecutorNetting:
         mock_datetime.now.return_value = datetime(2025, 9, 8, 15, 0, 0)
         mock_datetime.fromtimestamp.side_effect = lambda x: datetime.fromtimestamp(x)
 
-        executor = IdempotentOrderExecutor(
-            broker=self.mock_broker, db_path=":memory:", settings=self.mock_settings
-        )
+        executor = self._make_executor()
 
         # Mock existing long position
         mock_position = MagicMock()
@@ -386,9 +394,7 @@ class TestIdempotentExecutorNetting:
 
     def test_executor_duplicate_order_blocking(self):
         """Test that duplicate orders are still blocked with netting."""
-        executor = IdempotentOrderExecutor(
-            broker=self.mock_broker, db_path=":memory:", settings=self.mock_settings
-        )
+        executor = self._make_executor()
 
         request = OrderRequest(
             client_order_id="duplicate123",
@@ -5,16 +5,12 @@ Tests for RiskGovernorV2 - Loss Streak, Dynamic Blackout, Cooldown
 
 import json
 import os
-import sys
 import tempfile
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from config.settings import get_settings
 from risk.governor_v2 import RiskGovernorV2, RiskState
 
@@ -3,13 +3,14 @@ Test trailing stop jitter reduction with increased hysteresis and minimum step.
 Validates that the new configuration reduces excessive stop adjustments.
 """
 
+from math import isclose
 from unittest.mock import Mock
 
 import pandas as pd
 import pytest
 
 from risk.trailing import TrailingStopManager
-from test_trailing_stops import MockPosition, MockSymbolInfo
+from test_trailing_stops import MockPosition, MockSymbolInfo, Result
 
 
 class TestTrailingJitterReduction:
@@ -23,9 +24,7 @@ class TestTrailingJitterReduction:
         self.mt5.TRADE_RETCODE_DONE = 10009
 
         # Mock successful order updates
-        result = Mock()
-        result.retcode = self.mt5.TRADE_RETCODE_DONE
-        self.mt5.order_send.return_value = result
+        self.mt5.order_send.return_value = Result(self.mt5.TRADE_RETCODE_DONE)
 
         self.manager = TrailingStopManager(self.mt5)
 
@@ -107,7 +106,7 @@ class TestTrailingJitterReduction:
         assert (
             trailing_sl is not None
         ), "10 pip improvement should meet 8 pip minimum step requirement"
-        assert abs(trailing_sl - 1.10200) < 1e-9
+        assert isclose(trailing_sl, 1.10200, abs_tol=1e-9)
 
     def test_jitter_reduction_in_volatile_market(self):
         """Test jitter reduction during volatile price action"""
@@ -194,8 +193,8 @@ class TestTrailingJitterReduction:
         assert (
             trailing_sl is not None
         ), "Large price move should trigger trailing with config-driven parameters"
-        assert (
-            abs(trailing_sl - 1.10300) < 1e-9
+        assert isclose(
+            trailing_sl, 1.10300, abs_tol=1e-9
         ), f"Expected SL 1.10300, got {trailing_sl}"
 
     def test_backwards_compatibility_with_old_values(self):
@@ -115,9 +115,8 @@ class MT5StrategyValidator:
     def test_mock_availability(self) -> bool:
         """Test that MT5 mock is available and functional"""
         try:
-            # Import the mock from conftest
-            sys.path.insert(0, os.path.join(os.getcwd(), "tests"))
-            from conftest import MockMT5
+            # Import the mock used by tests/conftest.py
+            from tests.fixtures.mock_mt5 import MockMT5
 
             # Test mock creation
             mock_mt5 = MockMT5()
@@ -14,7 +14,7 @@ def test_mt5_less_strategy():
     print(f"✅ MT5 Available: {mt5_available()}")
 
     # Test 2: Mock MT5 Functionality
-    from tests.conftest import MockMT5
+    from tests.fixtures.mock_mt5 import MockMT5
 
     mock = MockMT5()
     assert mock.initialize()